@@ -0,0 +1,43 @@
+#!/bin/bash
+
+# Run a test script with mimalloc (or jemalloc) preloaded as the process allocator.
+# Merges build many small str/bytes objects; these allocators fragment less than
+# the system malloc under that pattern, lowering peak RSS. Falls back to the default
+# allocator when neither library is installed.
+#
+# Usage: ./run_tests.sh [test_script.py] [args...]   (default: test_templates.py)
+# Set MIMALLOC_LARGE_OS_PAGES=1 to let mimalloc back its heap with large pages.
+
+SCRIPT="${1:-test_templates.py}"
+shift
+
+ALLOCATOR_CANDIDATES=(
+    "$HOPPER_MALLOC_LIB"
+    /usr/lib/x86_64-linux-gnu/libmimalloc.so.2
+    /usr/lib/aarch64-linux-gnu/libmimalloc.so.2
+    /usr/local/lib/libmimalloc.so
+    /opt/homebrew/lib/libmimalloc.dylib
+    /usr/local/lib/libmimalloc.dylib
+    /usr/lib/x86_64-linux-gnu/libjemalloc.so.2
+    /usr/lib/aarch64-linux-gnu/libjemalloc.so.2
+)
+
+ALLOCATOR=""
+for lib in "${ALLOCATOR_CANDIDATES[@]}"; do
+    if [ -n "$lib" ] && [ -f "$lib" ]; then
+        ALLOCATOR="$lib"
+        break
+    fi
+done
+
+if [ -z "$ALLOCATOR" ]; then
+    echo "⚠️  mimalloc/jemalloc not found, using the default allocator"
+    exec python "$SCRIPT" "$@"
+fi
+
+echo "🧠 Allocator: $ALLOCATOR"
+if [ "$(uname)" = "Darwin" ]; then
+    DYLD_INSERT_LIBRARIES="$ALLOCATOR" exec python "$SCRIPT" "$@"
+else
+    LD_PRELOAD="$ALLOCATOR${LD_PRELOAD:+:$LD_PRELOAD}" exec python "$SCRIPT" "$@"
+fi
@@ -7,5 +7,6 @@ Conversational AI agents for intelligent data analysis
 from .chat_agent import ChatAgent
 from .data_analyzer import DataAnalyzer
 from .session_manager import SessionManager
+from .redis_session_manager import RedisSessionManager
 
-__all__ = ['ChatAgent', 'DataAnalyzer', 'SessionManager']
+__all__ = ['ChatAgent', 'DataAnalyzer', 'SessionManager', 'RedisSessionManager']
@@ -5,16 +5,110 @@ Intelligent conversational agent using OpenAI API
 """
 
 import os
+import re
+import asyncio
 import json
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, asdict
+import hashlib
+from collections import OrderedDict, deque
+from typing import Optional, Dict, List, Any, AsyncIterator, Tuple
+from dataclasses import dataclass
 from datetime import datetime
-from openai import OpenAI
+import numpy as np
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Model identifier resolved once at import
+DEFAULT_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+
+# One client (and HTTP keep-alive pool) per API key and event loop, shared by all
+# agents; an httpx pool only works on the loop it was opened on
+_CLIENTS: Dict[Tuple[str, asyncio.AbstractEventLoop], AsyncOpenAI] = {}
+
+# Upper bound on OpenAI requests in flight per event loop, across all sessions
+# (keeps bursts of concurrent chats under the account's rate limits)
+MAX_CONCURRENT_REQUESTS = int(os.getenv('OPENAI_MAX_CONCURRENCY', '32'))
+
+# One semaphore per event loop, shared by all agents (asyncio primitives are loop-bound)
+_REQUEST_SLOTS: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _get_client(api_key: str, max_connections: int = 64) -> AsyncOpenAI:
+    """Get shared OpenAI client for api_key on the running event loop, creating it on first use"""
+    key = (api_key, asyncio.get_running_loop())
+    client = _CLIENTS.get(key)
+    if client is None:
+        # Forget clients whose loop has since closed (e.g. earlier asyncio.run calls)
+        for stale in [k for k in _CLIENTS if k[1].is_closed()]:
+            del _CLIENTS[stale]
+        
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                )
+            )
+        )
+        _CLIENTS[key] = client
+    return client
+
+
+def _request_slot() -> asyncio.Semaphore:
+    """Semaphore bounding OpenAI requests on the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    slot = _REQUEST_SLOTS.get(loop)
+    if slot is None:
+        for stale in [k for k in _REQUEST_SLOTS if k.is_closed()]:
+            del _REQUEST_SLOTS[stale]
+        slot = _REQUEST_SLOTS[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return slot
+
+
+async def close_shared_clients():
+    """Close the running event loop's shared OpenAI clients and their connection pools"""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _CLIENTS if k[1] is loop]:
+        await _CLIENTS.pop(key).close()
+
+
+SYSTEM_PROMPT = """You are a helpful data analysis assistant. Your role is to help users analyze and visualize their data through natural conversation.
+
+Your capabilities:
+1. Filter data by categories, values, dates
+2. Create pivot tables with user-specified rows/columns
+3. Generate visualizations (PPT, PDF, charts, Excel)
+4. Suggest appropriate analyses
+
+Always:
+- Be concise and helpful
+- Confirm your understanding before taking actions
+- Show data previews when relevant
+- Offer quick action buttons for common tasks; actions that run a command directly
+  use slash commands: "/filter <value>", "/pivot rows=<col> columns=<col> values=<col>",
+  "/viz <bar|line|pie>", "/export <ppt|pdf|excel|chart>"
+- Ask clarifying questions if intent is unclear
+
+When user uploads data, acknowledge it and describe what you see.
+When user requests filtering or pivoting, extract the specific fields and values.
+When user wants visualizations, ask about format preferences (PPT/PDF/Chart/Excel).
+
+Respond in JSON format with:
+{
+    "message": "Your response to the user",
+    "intent": {
+        "action": "filter|pivot|visualize|export|query",
+        "parameters": {...},
+        "confidence": 0.0-1.0
+    },
+    "quick_actions": ["Action 1", "Action 2"],
+    "needs_confirmation": true/false
+}"""
+
 
 @dataclass
 class Intent:
@@ -24,7 +118,12 @@ class Intent:
     confidence: float
     
     def to_dict(self):
-        return asdict(self)
+        # Shallow plain dict (asdict deep-copies parameters)
+        return {
+            'action': self.action,
+            'parameters': self.parameters,
+            'confidence': self.confidence
+        }
 
 
 @dataclass
@@ -49,59 +148,111 @@ class AgentResponse:
 class ChatAgent:
     """Intelligent chat agent for data analysis"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
+    # Only deterministic commands are safe to replay for a paraphrased message
+    SEMANTIC_CACHE_ACTIONS = frozenset({'filter', 'pivot', 'visualize', 'export'})
+    
+    # Slash commands (used by quick actions) handled locally without an API call
+    FAST_PATH_PREFIXES = ('/filter', '/pivot', '/viz', '/export')
+    _FAST_PATH_ACTIONS = {
+        '/filter': 'filter',
+        '/pivot': 'pivot',
+        '/viz': 'visualize',
+        '/export': 'export'
+    }
+    _FAST_ARG_RE = re.compile(r'(\w+)=("[^"]*"|\S+)')
+    
+    # Precompiled keyword scanners for local intent extraction
+    # Zero-width lookahead tests every position, so overlapping keywords are all seen
+    _INTENT_RE = re.compile(
+        r"(?=(?P<filter>only|filter|just|where|show me)"
+        r"|(?P<pivot>pivot|rows|columns|table)"
+        r"|(?P<visualize>chart|graph|visualize|plot|show)"
+        r"|(?P<export>export|download|save|generate|create))",
+        re.IGNORECASE
+    )
+    _FILTER_PARAM_RE = re.compile(r"(?<!\S)(?:only|just)\s+(?=(\S+))", re.IGNORECASE)
+    _PIVOT_ROWS_RE = re.compile(r"(?<!\S)\S*row\S*\s+(?=(\S+))", re.IGNORECASE)
+    _PIVOT_COLS_RE = re.compile(r"(?<!\S)\S*col\S*\s+(?=(\S+))", re.IGNORECASE)
+    _PIVOT_COLS_KEYWORD_RE = re.compile(r"column|cols", re.IGNORECASE)
+    _CHART_RE = re.compile(r"bar|line|pie", re.IGNORECASE)
+    _FORMAT_RE = re.compile(
+        r"(?P<ppt>ppt|powerpoint)|(?P<pdf>pdf)|(?P<excel>excel|xlsx)|(?P<chart>chart|interactive)",
+        re.IGNORECASE
+    )
+    
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: Optional[str] = None,
+                 enable_cache: bool = False,
+                 cache_size: int = 512,
+                 enable_semantic_cache: bool = False,
+                 semantic_threshold: float = 0.92,
+                 semantic_cache_size: int = 2000,
+                 embedding_model: str = "text-embedding-3-small",
+                 history_size: int = 10,
+                 log_full_history: bool = False):
         """
         Initialize chat agent
         
         Args:
             api_key: OpenAI API key (defaults to env var)
-            model: OpenAI model to use
+            model: OpenAI model to use (defaults to OPENAI_MODEL env var)
+            enable_cache: Reuse responses for identical prompts instead of calling the API
+            cache_size: Maximum number of cached responses (LRU eviction)
+            enable_semantic_cache: Reuse responses for paraphrased messages (embedding similarity)
+            semantic_threshold: Minimum cosine similarity for a semantic cache hit
+            semantic_cache_size: Maximum number of embedded prompts kept (FIFO eviction)
+            embedding_model: OpenAI embedding model used by the semantic cache
+            history_size: Number of recent messages sent back to the model
+            log_full_history: Keep an unbounded transcript for diagnostics
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        self.model = model or os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        self.model = model or DEFAULT_MODEL
         
-        if not self.api_key or self.api_key == 'your-api-key-here':
+        self._has_api_key = bool(self.api_key) and self.api_key != 'your-api-key-here'
+        if not self._has_api_key:
             print("⚠️  Warning: OpenAI API key not configured. Set OPENAI_API_KEY in .env file")
-            self.client = None
-        else:
-            self.client = OpenAI(api_key=self.api_key)
         
-        self.conversation_history: List[Dict] = []
+        # Bounded window: O(1) maintenance and memory independent of conversation length
+        self.conversation_history: deque = deque(maxlen=history_size)
+        self._full_history_log: Optional[List[Dict]] = [] if log_full_history else None
         self.data_context: Dict = {}
+        self._context_cache: Optional[tuple] = None  # (context, serialized message)
         self.system_prompt = self._build_system_prompt()
+        
+        # Exact-match response cache (opt-in, temperature > 0 makes replies non-deterministic)
+        self.enable_cache = enable_cache
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        # Semantic response cache: (embedding, content, parsed) entries + lazily stacked matrix
+        self.enable_semantic_cache = enable_semantic_cache
+        self.semantic_threshold = semantic_threshold
+        self.embedding_model = embedding_model
+        self._semantic_entries: deque = deque(maxlen=semantic_cache_size)
+        self._semantic_matrix: Optional[np.ndarray] = None
+    
+    @property
+    def client(self) -> Optional[AsyncOpenAI]:
+        """Shared OpenAI client for the running event loop (None without an API key)"""
+        return _get_client(self.api_key) if self._has_api_key else None
     
     def _build_system_prompt(self) -> str:
         """Build system prompt for the agent"""
-        return """You are a helpful data analysis assistant. Your role is to help users analyze and visualize their data through natural conversation.
-
-Your capabilities:
-1. Filter data by categories, values, dates
-2. Create pivot tables with user-specified rows/columns
-3. Generate visualizations (PPT, PDF, charts, Excel)
-4. Suggest appropriate analyses
-
-Always:
-- Be concise and helpful
-- Confirm your understanding before taking actions
-- Show data previews when relevant
-- Offer quick action buttons for common tasks
-- Ask clarifying questions if intent is unclear
-
-When user uploads data, acknowledge it and describe what you see.
-When user requests filtering or pivoting, extract the specific fields and values.
-When user wants visualizations, ask about format preferences (PPT/PDF/Chart/Excel).
-
-Respond in JSON format with:
-{
-    "message": "Your response to the user",
-    "intent": {
-        "action": "filter|pivot|visualize|export|query",
-        "parameters": {...},
-        "confidence": 0.0-1.0
-    },
-    "quick_actions": ["Action 1", "Action 2"],
-    "needs_confirmation": true/false
-}"""
+        # Constant across turns and sessions so providers can cache the prefix
+        return SYSTEM_PROMPT
+    
+    def _context_message(self) -> Dict:
+        """Build the data-context system message with deterministic key order"""
+        # Serialize only when the context changed since the last turn
+        cached = self._context_cache
+        if cached is not None and (cached[0] is self.data_context or cached[0] == self.data_context):
+            return cached[1]
+        
+        context_json = json.dumps(self.data_context, indent=2, sort_keys=True, default=str)
+        message = {"role": "system", "content": f"Current data context:\n{context_json}"}
+        self._context_cache = (self.data_context, message)
+        return message
     
     async def process_message(self, user_message: str, context: Optional[Dict] = None) -> AgentResponse:
         """
@@ -114,93 +265,434 @@ Respond in JSON format with:
         Returns:
             AgentResponse with message and extracted intent
         """
+        if user_message.startswith(self.FAST_PATH_PREFIXES):
+            return self._handle_fast_path(user_message)
+        
         if not self.client:
             return AgentResponse(
                 message="⚠️ OpenAI API not configured. Please set your API key in .env file.",
                 quick_actions=["View Documentation"]
             )
         
-        # Update context
-        if context:
-            self.data_context = context
-        
-        # Build messages for API call
-        messages = [{"role": "system", "content": self.system_prompt}]
+        self._update_context(context)
+        messages = self._build_messages(user_message)
         
-        # Add context if available
-        if self.data_context:
-            context_msg = f"\n\nCurrent data context:\n{json.dumps(self.data_context, indent=2)}"
-            messages[0]["content"] += context_msg
-        
-        # Add conversation history
-        messages.extend(self.conversation_history[-5:])  # Keep last 5 messages
+        # Serve identical prompts from cache without a network round-trip
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._cache_key(user_message)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                content, parsed = cached
+                self._record_turn(user_message, content)
+                return self._build_response(parsed)
         
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
+        # Serve paraphrases of earlier commands from the semantic cache
+        embedding = None
+        if self.enable_semantic_cache:
+            embedding = await self._embed(user_message)
+            cached = self._semantic_lookup(embedding)
+            if cached is not None:
+                content, parsed = cached
+                self._record_turn(user_message, content)
+                return self._build_response(parsed)
         
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=0.7,
-                max_tokens=1000
-            )
+            # Call OpenAI API (waits for a free request slot under bursts)
+            async with _request_slot():
+                response = await self.client.chat.completions.create(**self._completion_request(messages))
             
             # Parse response
             content = response.choices[0].message.content
             parsed = json.loads(content)
             
             # Update conversation history
-            self.conversation_history.append({"role": "user", "content": user_message})
-            self.conversation_history.append({"role": "assistant", "content": content})
+            self._record_turn(user_message, content)
+            
+            if cache_key is not None:
+                self._cache_put(cache_key, (content, parsed))
+            if embedding is not None:
+                self._semantic_put(embedding, content, parsed)
+            
+            return self._build_response(parsed)
+            
+        except Exception as e:
+            return self._error_response(e, user_message)
+    
+    async def process_stream(self, user_message: str, context: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """
+        Process user message, streaming the model output as it is generated
+        
+        Args:
+            user_message: User's message
+            context: Current data context
             
-            # Build AgentResponse
-            intent = None
-            if 'intent' in parsed and parsed['intent']:
-                intent = Intent(
-                    action=parsed['intent'].get('action', 'query'),
-                    parameters=parsed['intent'].get('parameters', {}),
-                    confidence=parsed['intent'].get('confidence', 0.5)
+        Yields:
+            {'type': 'delta', 'content': ...} chunks of raw model output, then a
+            final {'type': 'message', ...} event with the parsed AgentResponse
+        """
+        if user_message.startswith(self.FAST_PATH_PREFIXES):
+            yield {'type': 'message', **self._handle_fast_path(user_message).to_dict()}
+            return
+        
+        if not self.client:
+            response = AgentResponse(
+                message="⚠️ OpenAI API not configured. Please set your API key in .env file.",
+                quick_actions=["View Documentation"]
+            )
+            yield {'type': 'message', **response.to_dict()}
+            return
+        
+        self._update_context(context)
+        messages = self._build_messages(user_message)
+        
+        try:
+            # The request slot is held until the stream is fully read
+            async with _request_slot():
+                stream = await self.client.chat.completions.create(
+                    **self._completion_request(messages),
+                    stream=True
                 )
+                
+                parts = []
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield {'type': 'delta', 'content': delta}
+            
+            # JSON is only complete once the stream closes
+            content = ''.join(parts)
+            parsed = json.loads(content)
+            self._record_turn(user_message, content)
+            response = self._build_response(parsed)
             
+        except Exception as e:
+            response = self._error_response(e, user_message)
+        
+        yield {'type': 'message', **response.to_dict()}
+    
+    def _handle_fast_path(self, user_message: str) -> AgentResponse:
+        """
+        Build response for a slash command locally (no tokens, no network)
+        
+        Commands take an optional free-text argument and key=value pairs,
+        e.g. "/filter APAC", "/filter Region=APAC", "/pivot rows=Region columns=Month".
+        """
+        command, _, argument = user_message.partition(' ')
+        action = self._FAST_PATH_ACTIONS.get(command.lower())
+        if action is None:
             return AgentResponse(
-                message=parsed.get('message', 'I understand. Let me help you with that.'),
-                intent=intent,
-                quick_actions=parsed.get('quick_actions'),
-                needs_confirmation=parsed.get('needs_confirmation', False)
+                message=f"Unknown command: {command}",
+                quick_actions=list(self.FAST_PATH_PREFIXES)
             )
-            
-        except json.JSONDecodeError as e:
-            print(f"Error parsing OpenAI response: {e}")
+        
+        pairs = {key: value.strip('"') for key, value in self._FAST_ARG_RE.findall(argument)}
+        free_text = self._FAST_ARG_RE.sub('', argument).strip()
+        
+        if action == 'filter':
+            parameters = {}
+            if len(pairs) == 1:
+                column, value = next(iter(pairs.items()))
+                parameters = {'column': column, 'category': value}
+            elif free_text:
+                parameters = {'category': free_text}
+            message = f"Filtering data to {parameters.get('category', '...')}."
+        elif action == 'pivot':
+            options = {key.lower(): value for key, value in pairs.items()}
+            parameters = {key: options[key] for key in ('rows', 'columns', 'values') if key in options}
+            message = "Creating pivot table."
+        elif action == 'visualize':
+            parameters = self._extract_viz_params(free_text)
+            message = f"Creating {parameters['chart_type']} chart."
+        else:
+            parameters = self._extract_export_params(free_text)
+            message = f"Exporting as {', '.join(parameters['formats'])}."
+        
+        return AgentResponse(
+            message=message,
+            intent=Intent(action=action, parameters=parameters, confidence=1.0)
+        )
+    
+    def _update_context(self, context: Optional[Dict]):
+        """Update data context from a message's context argument, if given"""
+        if context:
+            self.set_context(context)
+    
+    def set_context(self, context: Dict):
+        """
+        Replace the data context
+        
+        Use this instead of assigning data_context: semantically cached
+        responses only hold for the data they were answered on, so they are
+        dropped when the context changes.
+        
+        Args:
+            context: Data summary (DataAnalyzer.get_summary())
+        """
+        if context is not self.data_context and context != self.data_context:
+            self.clear_semantic_cache()
+        self.data_context = context
+    
+    def _build_messages(self, user_message: str) -> List[Dict]:
+        """Build messages for API call"""
+        # The static system prompt and the data context go in separate leading
+        # messages so the prompt prefix stays byte-identical across turns and
+        # OpenAI's automatic prompt caching applies
+        messages = [{"role": "system", "content": self.system_prompt}]
+        
+        # Add context if available
+        if self.data_context:
+            messages.append(self._context_message())
+        
+        # Add conversation history
+        messages.extend(self.conversation_history)
+        
+        # Add current user message
+        messages.append({"role": "user", "content": user_message})
+        
+        return messages
+    
+    def _error_response(self, error: Exception, user_message: str) -> AgentResponse:
+        """Build fallback response for a failed or unparseable API call"""
+        if isinstance(error, json.JSONDecodeError):
+            print(f"Error parsing OpenAI response: {error}")
             # Fall back to simple response
             return AgentResponse(
                 message="I understand your request. Let me process that for you.",
                 intent=self.extract_intent(user_message),
                 quick_actions=["Try again", "View help"]
             )
-        except Exception as e:
-            print(f"Error calling OpenAI API: {e}")
-            # Provide helpful error message
-            error_msg = str(e)
-            if "API key" in error_msg or "authentication" in error_msg.lower():
-                return AgentResponse(
-                    message="⚠️ OpenAI API key is invalid or missing. Please check your .env configuration.",
-                    quick_actions=["View documentation"]
-                )
-            elif "rate limit" in error_msg.lower():
-                return AgentResponse(
-                    message="⚠️ API rate limit exceeded. Please wait a moment and try again.",
+        
+        print(f"Error calling OpenAI API: {error}")
+        # Provide helpful error message
+        error_msg = str(error)
+        if "API key" in error_msg or "authentication" in error_msg.lower():
+            return AgentResponse(
+                message="⚠️ OpenAI API key is invalid or missing. Please check your .env configuration.",
+                quick_actions=["View documentation"]
+            )
+        elif "rate limit" in error_msg.lower():
+            return AgentResponse(
+                message="⚠️ API rate limit exceeded. Please wait a moment and try again.",
+                quick_actions=["Try again"]
+            )
+        else:
+            # Use fallback intent extraction
+            return AgentResponse(
+                message=f"I'll help you with that using local processing.",
+                intent=self.extract_intent(user_message),
+                quick_actions=["Continue", "Try again"]
+            )
+    
+    def _completion_request(self, messages: List[Dict]) -> Dict:
+        """Build chat completion arguments for the given messages"""
+        return {
+            'model': self.model,
+            'messages': messages,
+            'response_format': {"type": "json_object"},
+            'temperature': 0.7,
+            'max_tokens': 1000
+        }
+    
+    async def submit_batch(self, user_messages: List[str]) -> str:
+        """
+        Submit messages to the OpenAI Batch API for offline processing (50% cost, 24h window)
+        
+        Each message is sent with the current system prompt and data context but
+        without conversation history, and does not touch the conversation state.
+        
+        Args:
+            user_messages: User messages to process
+            
+        Returns:
+            Batch ID for wait_for_batch
+        """
+        if not self.client:
+            raise ValueError("OpenAI API not configured")
+        
+        prefix = [{"role": "system", "content": self.system_prompt}]
+        if self.data_context:
+            prefix.append(self._context_message())
+        
+        lines = []
+        for idx, user_message in enumerate(user_messages):
+            messages = prefix + [{"role": "user", "content": user_message}]
+            lines.append(json.dumps({
+                'custom_id': f"msg-{idx}",
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._completion_request(messages)
+            }))
+        
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0) -> List[AgentResponse]:
+        """
+        Poll a submitted batch until it finishes and parse its results
+        
+        Args:
+            batch_id: Batch ID returned by submit_batch
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            AgentResponses in the order the messages were submitted
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in ('completed', 'failed', 'expired', 'cancelled'):
+                break
+            await asyncio.sleep(poll_interval)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise ValueError(f"Batch {batch_id} finished with status: {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            try:
+                content = record['response']['body']['choices'][0]['message']['content']
+                results[record['custom_id']] = self._build_response(json.loads(content))
+            except (KeyError, IndexError, TypeError, json.JSONDecodeError):
+                results[record['custom_id']] = AgentResponse(
+                    message="I couldn't process this message.",
                     quick_actions=["Try again"]
                 )
-            else:
-                # Use fallback intent extraction
-                return AgentResponse(
-                    message=f"I'll help you with that using local processing.",
-                    intent=self.extract_intent(user_message),
-                    quick_actions=["Continue", "Try again"]
-                )
+        
+        return [results[key] for key in sorted(results, key=lambda k: int(k.split('-')[1]))]
+    
+    def process_message_sync(self, user_message: str, context: Optional[Dict] = None) -> AgentResponse:
+        """
+        Blocking wrapper around process_message for callers without an event loop
+        
+        Args:
+            user_message: User's message
+            context: Current data context
+            
+        Returns:
+            AgentResponse with message and extracted intent
+        """
+        async def run() -> AgentResponse:
+            try:
+                return await self.process_message(user_message, context)
+            finally:
+                # This loop ends with asyncio.run, so release its client now
+                await close_shared_clients()
+        
+        return asyncio.run(run())
+    
+    def _record_turn(self, user_message: str, content: str):
+        """Append a user/assistant exchange to the history window"""
+        turn = ({"role": "user", "content": user_message},
+                {"role": "assistant", "content": content})
+        self.conversation_history.extend(turn)
+        if self._full_history_log is not None:
+            self._full_history_log.extend(turn)
+    
+    def _build_response(self, parsed: Dict) -> AgentResponse:
+        """Build AgentResponse from parsed model JSON"""
+        intent = None
+        if 'intent' in parsed and parsed['intent']:
+            intent = Intent(
+                action=parsed['intent'].get('action', 'query'),
+                parameters=parsed['intent'].get('parameters', {}),
+                confidence=parsed['intent'].get('confidence', 0.5)
+            )
+        
+        return AgentResponse(
+            message=parsed.get('message', 'I understand. Let me help you with that.'),
+            intent=intent,
+            quick_actions=parsed.get('quick_actions'),
+            needs_confirmation=parsed.get('needs_confirmation', False)
+        )
+    
+    def _cache_key(self, user_message: str) -> str:
+        """Hash every input that influences the model reply"""
+        payload = json.dumps({
+            "sys": self.system_prompt,
+            "ctx": self.data_context,
+            "hist": list(self.conversation_history),
+            "msg": user_message
+        }, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[tuple]:
+        """Look up cached response and mark it most recently used"""
+        entry = self._response_cache.get(key)
+        if entry is not None:
+            self._response_cache.move_to_end(key)
+        return entry
+    
+    def _cache_put(self, key: str, entry: tuple):
+        """Store response, evicting the least recently used one when full"""
+        self._response_cache[key] = entry
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._response_cache.clear()
+        self.clear_semantic_cache()
+    
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a unit vector (None if the embedding call fails)"""
+        try:
+            async with _request_slot():
+                response = await self.client.embeddings.create(model=self.embedding_model, input=text)
+        except Exception as e:
+            print(f"Error creating embedding: {e}")
+            return None
+        
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def _semantic_lookup(self, embedding: Optional[np.ndarray]) -> Optional[tuple]:
+        """Find the cached response whose prompt is most similar to embedding"""
+        if embedding is None or not self._semantic_entries:
+            return None
+        
+        if self._semantic_matrix is None:
+            self._semantic_matrix = np.stack([entry[0] for entry in self._semantic_entries])
+        
+        # Vectors are pre-normalized, so the dot product is the cosine similarity
+        sims = self._semantic_matrix @ embedding
+        best = int(np.argmax(sims))
+        if sims[best] < self.semantic_threshold:
+            return None
+        
+        _, content, parsed = self._semantic_entries[best]
+        return content, parsed
+    
+    def _semantic_put(self, embedding: np.ndarray, content: str, parsed: Dict):
+        """Remember a response for future paraphrases of the same command"""
+        intent = parsed.get('intent') or {}
+        if intent.get('action') not in self.SEMANTIC_CACHE_ACTIONS:
+            return
+        
+        self._semantic_entries.append((embedding, content, parsed))
+        self._semantic_matrix = None
+    
+    def clear_semantic_cache(self):
+        """Drop all semantically cached responses"""
+        self._semantic_entries.clear()
+        self._semantic_matrix = None
     
     def extract_intent(self, message: str) -> Intent:
         """
@@ -212,10 +704,11 @@ Respond in JSON format with:
         Returns:
             Intent object
         """
-        message_lower = message.lower()
+        # Single scan collects every intent keyword group present in the message
+        matched = {m.lastgroup for m in self._INTENT_RE.finditer(message)}
         
         # Filter intent
-        if any(word in message_lower for word in ['only', 'filter', 'just', 'where', 'show me']):
+        if 'filter' in matched:
             return Intent(
                 action='filter',
                 parameters=self._extract_filter_params(message),
@@ -223,7 +716,7 @@ Respond in JSON format with:
             )
         
         # Pivot intent
-        if any(word in message_lower for word in ['pivot', 'rows', 'columns', 'table']):
+        if 'pivot' in matched:
             return Intent(
                 action='pivot',
                 parameters=self._extract_pivot_params(message),
@@ -231,7 +724,7 @@ Respond in JSON format with:
             )
         
         # Visualization intent
-        if any(word in message_lower for word in ['chart', 'graph', 'visualize', 'plot', 'show']):
+        if 'visualize' in matched:
             return Intent(
                 action='visualize',
                 parameters=self._extract_viz_params(message),
@@ -239,7 +732,7 @@ Respond in JSON format with:
             )
         
         # Export intent
-        if any(word in message_lower for word in ['export', 'download', 'save', 'generate', 'create']):
+        if 'export' in matched:
             return Intent(
                 action='export',
                 parameters=self._extract_export_params(message),
@@ -257,11 +750,10 @@ Respond in JSON format with:
         """Extract filter parameters from message"""
         params = {}
         
-        # Simple keyword extraction (can be enhanced)
-        words = message.split()
-        for i, word in enumerate(words):
-            if word.lower() in ['only', 'just'] and i + 1 < len(words):
-                params['category'] = words[i + 1]
+        # Simple keyword extraction (can be enhanced): last word after 'only'/'just'
+        values = self._FILTER_PARAM_RE.findall(message)
+        if values:
+            params['category'] = values[-1]
         
         return params
     
@@ -269,22 +761,16 @@ Respond in JSON format with:
         """Extract pivot parameters from message"""
         params = {}
         
-        message_lower = message.lower()
-        
         # Extract rows
-        if 'rows' in message_lower or 'row' in message_lower:
-            # Simple pattern matching
-            words = message.split()
-            for i, word in enumerate(words):
-                if 'row' in word.lower() and i + 1 < len(words):
-                    params['rows'] = words[i + 1]
-        
-        # Extract columns
-        if 'columns' in message_lower or 'column' in message_lower or 'cols' in message_lower:
-            words = message.split()
-            for i, word in enumerate(words):
-                if 'col' in word.lower() and i + 1 < len(words):
-                    params['columns'] = words[i + 1]
+        rows = self._PIVOT_ROWS_RE.findall(message)
+        if rows:
+            params['rows'] = rows[-1]
+        
+        # Extract columns (only when the message mentions columns, not e.g. 'color')
+        if self._PIVOT_COLS_KEYWORD_RE.search(message):
+            columns = self._PIVOT_COLS_RE.findall(message)
+            if columns:
+                params['columns'] = columns[-1]
         
         return params
     
@@ -292,31 +778,18 @@ Respond in JSON format with:
         """Extract visualization parameters"""
         params = {'chart_type': 'auto'}
         
-        message_lower = message.lower()
-        
-        if 'bar' in message_lower:
-            params['chart_type'] = 'bar'
-        elif 'line' in message_lower:
-            params['chart_type'] = 'line'
-        elif 'pie' in message_lower:
-            params['chart_type'] = 'pie'
+        found = {m.group(0).lower() for m in self._CHART_RE.finditer(message)}
+        for chart_type in ('bar', 'line', 'pie'):
+            if chart_type in found:
+                params['chart_type'] = chart_type
+                break
         
         return params
     
     def _extract_export_params(self, message: str) -> Dict:
         """Extract export parameters"""
-        params = {'formats': []}
-        
-        message_lower = message.lower()
-        
-        if 'ppt' in message_lower or 'powerpoint' in message_lower:
-            params['formats'].append('ppt')
-        if 'pdf' in message_lower:
-            params['formats'].append('pdf')
-        if 'excel' in message_lower or 'xlsx' in message_lower:
-            params['formats'].append('excel')
-        if 'chart' in message_lower or 'interactive' in message_lower:
-            params['formats'].append('chart')
+        found = {m.lastgroup for m in self._FORMAT_RE.finditer(message)}
+        params = {'formats': [fmt for fmt in ('ppt', 'pdf', 'excel', 'chart') if fmt in found]}
         
         # If no specific format mentioned, ask
         if not params['formats']:
@@ -326,7 +799,9 @@ Respond in JSON format with:
     
     def reset_conversation(self):
         """Reset conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        if self._full_history_log is not None:
+            self._full_history_log.clear()
         self.data_context = {}
     
     def get_conversation_summary(self) -> str:
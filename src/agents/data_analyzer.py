@@ -4,12 +4,25 @@ Data Analyzer
 Intelligent data analysis and transformation
 """
 
+import re
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 
+@lru_cache(maxsize=256)
+def _contains_pattern(value: str) -> re.Pattern:
+    """Compiled case-insensitive literal pattern for 'contains' filters"""
+    return re.compile(re.escape(value), re.IGNORECASE)
+
+
+def _is_text(series: pd.Series) -> bool:
+    """True for object and string (including string[pyarrow]) columns"""
+    return pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
+
 @dataclass
 class DataSummary:
     """Summary of dataset"""
@@ -43,49 +56,83 @@ class DataAnalyzer:
         Args:
             dataframe: DataFrame to analyze
         """
-        self.df = dataframe.copy()
-        self.original_df = dataframe.copy()
+        # Shallow copy: shares the caller's column data (copy-on-write, enabled by the
+        # API) so session-shared frames cost nothing per analyzer. Only whole columns
+        # are replaced here (_encode_categories) and filters never modify frames in
+        # place, so the caller's frame is never changed. The working frame shares the
+        # baseline until the first filter reassigns self.df.
+        self.original_df = dataframe.copy(deep=False)
+        self.df = self.original_df
+        self._analyze_static()
+        self._encode_categories()
         self.metadata = self._analyze_metadata()
         self.filter_history: List[Dict] = []
     
-    def _analyze_metadata(self) -> DataSummary:
-        """Analyze dataset and extract metadata"""
-        # Get basic info
-        total_rows = len(self.df)
-        total_columns = len(self.df.columns)
-        columns = self.df.columns.tolist()
-        dtypes = {col: str(dtype) for col, dtype in self.df.dtypes.items()}
+    def _analyze_static(self):
+        """
+        Analyze properties that filtering cannot change
         
-        # Find categorical columns (object type or < 20 unique values)
+        Column names, dtypes and column roles are fixed for the lifetime of the
+        analyzer, so they are computed once from the baseline data.
+        """
+        df = self.original_df
+        
+        self._columns = df.columns.tolist()
+        self._dtypes = {col: str(dtype) for col, dtype in df.dtypes.items()}
+        self._numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        self._date_columns = df.select_dtypes(include=['datetime64']).columns.tolist()
+        
+        # Categorical candidates: text type or < 20 unique values. Filtering only
+        # removes values, so low-cardinality columns stay low-cardinality.
+        self._category_candidates = [
+            col for col in df.columns
+            if _is_text(df[col]) or df[col].nunique() < 20
+        ]
+    
+    def _encode_categories(self):
+        """
+        Store repetitive text columns as pandas category dtype
+        
+        Values are hashed once here; equality filters then compare integer
+        codes instead of Python strings. Reported dtypes keep the original
+        names since they were captured by _analyze_static.
+        """
+        df = self.original_df
+        for col in self._category_candidates:
+            if _is_text(df[col]) and df[col].nunique() < 0.5 * len(df):
+                df[col] = df[col].astype('category')
+    
+    def _analyze_dynamic(self, df: pd.DataFrame) -> DataSummary:
+        """Analyze the row-dependent part of the metadata for df"""
+        # Find categorical columns
         categories = {}
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object' or self.df[col].nunique() < 20:
-                unique_values = self.df[col].dropna().unique().tolist()
-                if len(unique_values) <= 50:  # Limit to 50 categories
-                    categories[col] = unique_values[:50]
+        for col in self._category_candidates:
+            unique_values = df[col].dropna().unique().tolist()
+            if len(unique_values) <= 50:  # Limit to 50 categories
+                categories[col] = unique_values
         
         # Find date range
         date_range = None
-        date_columns = self.df.select_dtypes(include=['datetime64']).columns
-        if len(date_columns) > 0:
-            first_date_col = date_columns[0]
-            min_date = self.df[first_date_col].min()
-            max_date = self.df[first_date_col].max()
+        if self._date_columns:
+            first_date_col = self._date_columns[0]
+            min_date = df[first_date_col].min()
+            max_date = df[first_date_col].max()
             date_range = (str(min_date), str(max_date))
         
-        # Find numeric columns
-        numeric_columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
-        
         return DataSummary(
-            total_rows=total_rows,
-            total_columns=total_columns,
-            columns=columns,
-            dtypes=dtypes,
+            total_rows=len(df),
+            total_columns=len(self._columns),
+            columns=list(self._columns),
+            dtypes=dict(self._dtypes),
             categories=categories,
             date_range=date_range,
-            numeric_columns=numeric_columns
+            numeric_columns=list(self._numeric_columns)
         )
     
+    def _analyze_metadata(self) -> DataSummary:
+        """Analyze dataset and extract metadata"""
+        return self._analyze_dynamic(self.df)
+    
     def get_summary(self) -> Dict:
         """Get data summary for agent context"""
         return self.metadata.to_dict()
@@ -102,6 +149,15 @@ class DataAnalyzer:
         Returns:
             Filtered DataFrame
         """
+        self._filter(column, value, operator)
+        
+        # Update metadata
+        self.metadata = self._analyze_metadata()
+        
+        return self.df
+    
+    def _filter(self, column: str, value: Any, operator: str):
+        """Apply a single filter without refreshing metadata"""
         if column not in self.df.columns:
             raise ValueError(f"Column '{column}' not found in data")
         
@@ -113,21 +169,64 @@ class DataAnalyzer:
         })
         
         # Apply filter
+        mask = self._build_mask(column, value, operator)
+        if mask is not None:
+            self.df = self.df[mask]
+    
+    def _build_mask(self, column: str, value: Any, operator: str) -> Optional[np.ndarray]:
+        """
+        Build boolean row mask for a filter on the current data
+        
+        Args:
+            column: Column to filter
+            value: Value to filter by
+            operator: Filter operator
+            
+        Returns:
+            Boolean array, or None for unknown operators
+        """
+        series = self.df[column]
+        is_category = isinstance(series.dtype, pd.CategoricalDtype)
+        
+        if operator in ('equals', 'not_equals') and is_category:
+            # Integer compare on category codes
+            try:
+                code = series.cat.categories.get_loc(value)
+            except (KeyError, TypeError):
+                code = -2  # Matches no row (missing values are -1)
+            mask = series.cat.codes.to_numpy() == code
+            return mask if operator == 'equals' else ~mask
+        
         if operator == 'equals':
-            self.df = self.df[self.df[column] == value]
+            # Nullable (e.g. string[pyarrow]) compares leave NA for missing values
+            return (series == value).to_numpy(dtype=bool, na_value=False)
         elif operator == 'contains':
-            self.df = self.df[self.df[column].astype(str).str.contains(str(value), case=False, na=False)]
-        elif operator == 'greater':
-            self.df = self.df[self.df[column] > value]
-        elif operator == 'less':
-            self.df = self.df[self.df[column] < value]
+            if is_category:
+                # Match each distinct category once, then select rows by code
+                pattern = _contains_pattern(str(value))
+                matched = series.cat.categories.astype(str).str.contains(pattern, na=False)
+                return np.isin(series.cat.codes.to_numpy(), np.flatnonzero(matched))
+            if not pd.api.types.is_object_dtype(series.dtype) and pd.api.types.is_string_dtype(series.dtype):
+                # Arrow-backed strings take a regex string, not a compiled pattern
+                matched = series.str.contains(re.escape(str(value)), case=False, na=False)
+                return matched.to_numpy(dtype=bool, na_value=False)
+            if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+                series = series.astype(str)
+            pattern = _contains_pattern(str(value))
+            return series.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        elif operator in ('greater', 'less'):
+            if is_category:
+                # Unordered categoricals only support equality: compare each distinct
+                # category once, then select rows by code
+                categories = pd.Series(series.cat.categories)
+                matched = categories > value if operator == 'greater' else categories < value
+                return np.isin(series.cat.codes.to_numpy(), np.flatnonzero(matched.to_numpy()))
+            matched = series > value if operator == 'greater' else series < value
+            return matched.to_numpy(dtype=bool, na_value=False)
         elif operator == 'not_equals':
-            self.df = self.df[self.df[column] != value]
+            return (series != value).to_numpy(dtype=bool, na_value=True)
         
-        # Update metadata
-        self.metadata = self._analyze_metadata()
-        
-        return self.df
+        return None
     
     def apply_filters(self, filters: List[Dict]) -> pd.DataFrame:
         """
@@ -139,12 +238,28 @@ class DataAnalyzer:
         Returns:
             Filtered DataFrame
         """
-        for filter_dict in filters:
-            self.apply_filter(
-                filter_dict['column'],
-                filter_dict['value'],
-                filter_dict.get('operator', 'equals')
-            )
+        specs = [
+            (f['column'], f['value'], f.get('operator', 'equals'))
+            for f in filters
+        ]
+        
+        for column, _, _ in specs:
+            if column not in self.df.columns:
+                raise ValueError(f"Column '{column}' not found in data")
+        
+        # Combine all masks and slice once instead of once per filter
+        masks = [self._build_mask(*spec) for spec in specs]
+        masks = [mask for mask in masks if mask is not None]
+        if masks:
+            self.df = self.df[np.logical_and.reduce(masks)]
+        
+        self.filter_history.extend(
+            {'column': column, 'value': value, 'operator': operator}
+            for column, value, operator in specs
+        )
+        
+        # Update metadata once for the whole filter chain
+        self.metadata = self._analyze_metadata()
         
         return self.df
     
@@ -171,18 +286,36 @@ class DataAnalyzer:
             if col not in self.df.columns:
                 raise ValueError(f"Column '{col}' not found")
         
-        # Create pivot
+        # Group on integer category codes instead of hashing text keys per row
+        self._encode_pivot_keys(rows + columns)
+        
+        # Create pivot (observed=True skips unobserved category combinations)
         pivot = pd.pivot_table(
             self.df,
             index=rows,
             columns=columns,
             values=values,
             aggfunc=aggfunc,
-            fill_value=0
+            fill_value=0,
+            observed=True
         )
         
         return pivot
     
+    def _encode_pivot_keys(self, keys: List[str]):
+        """Convert text key columns to category dtype, once per analyzer"""
+        to_encode = {
+            col: 'category' for col in keys
+            if _is_text(self.df[col])
+        }
+        if not to_encode:
+            return
+        
+        # Encode the baseline too so the conversion survives reset()
+        is_baseline = self.df is self.original_df
+        self.original_df = self.original_df.astype(to_encode)
+        self.df = self.original_df if is_baseline else self.df.astype(to_encode)
+    
     def group_by(self, columns: List[str], agg_dict: Dict[str, str]) -> pd.DataFrame:
         """
         Group by columns and aggregate
@@ -194,15 +327,22 @@ class DataAnalyzer:
         Returns:
             Grouped DataFrame
         """
-        return self.df.groupby(columns).agg(agg_dict).reset_index()
+        # observed=True: category-encoded keys only yield groups present in the data
+        return self.df.groupby(columns, observed=True).agg(agg_dict).reset_index()
     
     def get_preview(self, rows: int = 10) -> Dict:
-        """Get data preview for display"""
+        """
+        Get data preview for display
+        
+        Uses the 'split' layout: column names once, rows as lists of values
+        in column order, instead of one dict per row.
+        """
         preview_df = self.df.head(rows)
         
         return {
             'columns': preview_df.columns.tolist(),
-            'data': preview_df.to_dict('records'),
+            # astype(object) keeps per-column types (int stays int in mixed frames)
+            'data': preview_df.astype(object).to_numpy().tolist(),
             'total_rows': len(self.df),
             'showing_rows': len(preview_df)
         }
@@ -235,7 +375,7 @@ class DataAnalyzer:
         
         # If we have date columns
         if self.metadata.date_range:
-            date_cols = self.df.select_dtypes(include=['datetime64']).columns.tolist()
+            date_cols = self._date_columns
             if date_cols and self.metadata.numeric_columns:
                 suggestions.append({
                     'type': 'line',
@@ -259,7 +399,7 @@ class DataAnalyzer:
     
     def reset(self):
         """Reset to original data"""
-        self.df = self.original_df.copy()
+        self.df = self.original_df
         self.filter_history = []
         self.metadata = self._analyze_metadata()
     
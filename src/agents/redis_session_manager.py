@@ -0,0 +1,281 @@
+"""
+Redis Session Manager
+
+Session storage shared across API workers, backed by Redis
+"""
+
+import asyncio
+import io
+import json
+import threading
+import uuid
+from typing import Optional
+from datetime import datetime
+import pandas as pd
+
+from .session_manager import Session, SessionManager
+from .data_analyzer import DataAnalyzer
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class RedisSessionManager(SessionManager):
+    """
+    Manage user sessions in Redis
+    
+    Session fields live in a Redis hash whose TTL is the session timeout, so
+    expiry needs no scan. Uploaded DataFrames are stored once as Parquet blobs
+    keyed by content hash. Live objects (chat agent, data analyzer) cannot be
+    serialized; each worker keeps them in its local LRU (self.sessions) and
+    rebuilds them from Redis when a session first reaches that worker.
+    
+    The Redis client is synchronous; async callers use the *_async methods,
+    which run each call on a worker thread instead of blocking the event loop.
+    Worker threads share the local state (self.sessions, self._df_cache), so
+    every access to it holds self._lock; Redis round trips run outside the lock.
+    """
+    
+    def __init__(self,
+                 redis_url: str = "redis://localhost:6379/0",
+                 timeout_seconds: int = 3600,
+                 max_sessions: int = 100,
+                 key_prefix: str = "hopper:"):
+        """
+        Initialize Redis session manager
+        
+        Args:
+            redis_url: Redis connection URL
+            timeout_seconds: Session timeout in seconds (Redis TTL)
+            max_sessions: Maximum number of sessions kept live in this worker
+            key_prefix: Prefix for all Redis keys
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is not installed. Install it with: pip install redis")
+        
+        super().__init__(timeout_seconds=timeout_seconds, max_sessions=max_sessions)
+        self.redis = redis.Redis.from_url(redis_url)
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+    
+    async def _run(self, func, *args, **kwargs):
+        """Run a manager method (Redis round trips) off the event loop"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}session:{session_id}"
+    
+    def _data_key(self, df_hash: str) -> str:
+        return f"{self.key_prefix}df:{df_hash}"
+    
+    def _save(self, session: Session):
+        """Write session fields to Redis and refresh its TTL"""
+        key = self._session_key(session.id)
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping={
+            'created_at': session.created_at.isoformat(),
+            'last_activity': session.last_activity.isoformat(),
+            'data_key': session.data_key or '',
+            'user_data': json.dumps(session.user_data, default=str)
+        })
+        pipe.expire(key, self.timeout_seconds)
+        if session.data_key:
+            pipe.expire(self._data_key(session.data_key), self.timeout_seconds)
+        pipe.execute()
+    
+    def _load(self, session_id: str) -> Optional[Session]:
+        """Rebuild a local session from its Redis hash"""
+        fields = self.redis.hgetall(self._session_key(session_id))
+        if not fields:
+            return None
+        
+        fields = {k.decode(): v.decode() for k, v in fields.items()}
+        if 'created_at' not in fields:
+            return None  # Activity stub of a session expiring concurrently
+        
+        session = Session(
+            id=session_id,
+            created_at=datetime.fromisoformat(fields['created_at']),
+            last_activity=datetime.fromisoformat(fields['last_activity']),
+            user_data=json.loads(fields.get('user_data') or '{}')
+        )
+        
+        data_key = fields.get('data_key')
+        if data_key:
+            df = self.get_cached_dataframe(data_key)
+            if df is not None:
+                session.data = df
+                session.data_key = data_key
+                session.data_analyzer = DataAnalyzer(df)
+                # The agent's data context (set on upload in the worker that received it)
+                session.summary_cache = session.data_analyzer.get_summary()
+        
+        return session
+    
+    def create_session(self, user_id: Optional[str] = None) -> Session:
+        """
+        Create new session
+        
+        Args:
+            user_id: Optional user identifier
+        
+        Returns:
+            New Session object
+        """
+        session = Session(id=str(uuid.uuid4()))
+        
+        if user_id:
+            session.user_data['user_id'] = user_id
+        
+        self._save(session)
+        self._cache_local(session)
+        
+        return session
+    
+    def _cache_local(self, session: Session) -> Session:
+        """Keep live session objects in this worker's LRU, returning the cached one"""
+        with self._lock:
+            cached = self.sessions.get(session.id)
+            if cached is not None:
+                return cached  # Loaded concurrently by another request thread
+            if len(self.sessions) >= self.max_sessions:
+                self.sessions.popitem(last=False)
+            self.sessions[session.id] = session
+            return session
+    
+    def _touch(self, session: Session):
+        """Mark session as most recently active, if still cached locally"""
+        with self._lock:
+            session.touch()
+            if session.id in self.sessions:
+                self.sessions.move_to_end(session.id)
+    
+    def get_session(self, session_id: str) -> Optional[Session]:
+        """
+        Get session by ID
+        
+        Args:
+            session_id: Session ID
+        
+        Returns:
+            Session object or None if not found/expired
+        """
+        key = self._session_key(session_id)
+        with self._lock:
+            session = self.sessions.get(session_id)
+        
+        # One round trip: EXPIRE refreshes the TTL and reports whether the session
+        # still exists, HSET records the activity
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.expire(key, self.timeout_seconds)
+        pipe.hset(key, 'last_activity', datetime.now().isoformat())
+        pipe.expire(key, self.timeout_seconds)
+        if session is not None and session.data_key:
+            pipe.expire(self._data_key(session.data_key), self.timeout_seconds)
+        exists = pipe.execute()[0]
+        
+        if not exists:
+            # Expired (TTL) or deleted by another worker; drop the stub HSET just created
+            self.redis.delete(key)
+            with self._lock:
+                self.sessions.pop(session_id, None)
+            return None
+        
+        if session is None:
+            session = self._load(session_id)
+            if session is None:
+                return None
+            session = self._cache_local(session)
+        
+        self._touch(session)
+        
+        return session
+    
+    def update_session(self, session_id: str, **kwargs):
+        """
+        Update session data
+        
+        Args:
+            session_id: Session ID
+            **kwargs: Data to update
+        """
+        super().update_session(session_id, **kwargs)
+        with self._lock:
+            session = self.sessions.get(session_id)
+        if session is not None:
+            self._save(session)
+    
+    def delete_session(self, session_id: str):
+        """Delete session"""
+        self.redis.delete(self._session_key(session_id))
+        with self._lock:
+            self.sessions.pop(session_id, None)
+    
+    def cleanup_expired(self):
+        """Drop local copies of sessions (and their frames) that Redis has expired"""
+        with self._lock:
+            session_ids = list(self.sessions)
+        expired = [sid for sid in session_ids if not self.redis.exists(self._session_key(sid))]
+        
+        with self._lock:
+            for sid in expired:
+                self.sessions.pop(sid, None)
+            
+            in_use = {session.data_key for session in self.sessions.values()}
+            for df_hash in list(self._df_cache):
+                if df_hash not in in_use:
+                    del self._df_cache[df_hash]
+    
+    def get_cached_dataframe(self, df_hash: str) -> Optional[pd.DataFrame]:
+        """Get shared DataFrame by content hash from this worker or Redis"""
+        with self._lock:
+            df = self._df_cache.get(df_hash)
+        if df is not None:
+            return df
+        
+        blob = self.redis.get(self._data_key(df_hash))
+        if blob is None:
+            return None
+        
+        df = pd.read_parquet(io.BytesIO(blob))
+        with self._lock:
+            return self._df_cache.setdefault(df_hash, df)
+    
+    def attach_dataframe(self, session_id: str, df_hash: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Attach data to a session, storing the baseline DataFrame once per content hash
+        
+        Args:
+            session_id: Session ID
+            df_hash: Content hash of the source file
+            df: Parsed DataFrame (ignored if the hash is already stored)
+        
+        Returns:
+            Shared DataFrame stored on the session
+        """
+        session = self.get_session(session_id)
+        
+        if not session:
+            raise ValueError(f"Session {session_id} not found or expired")
+        
+        shared = self.get_cached_dataframe(df_hash)
+        if shared is None:
+            buffer = io.BytesIO()
+            df.to_parquet(buffer, index=False)
+            self.redis.set(self._data_key(df_hash), buffer.getvalue(),
+                           ex=self.timeout_seconds, nx=True)
+            with self._lock:
+                shared = self._df_cache.setdefault(df_hash, df)
+        
+        session.data = shared
+        session.data_key = df_hash
+        self._save(session)
+        
+        return shared
+    
+    def get_active_session_count(self) -> int:
+        """Get number of active sessions across all workers"""
+        return sum(1 for _ in self.redis.scan_iter(match=self._session_key('*')))
@@ -5,7 +5,9 @@ Manage user sessions and conversation context
 """
 
 import uuid
-from typing import Dict, Optional
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import pandas as pd
@@ -18,7 +20,9 @@ class Session:
     created_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
     data: Optional[pd.DataFrame] = None
+    data_key: Optional[str] = None  # Content hash of shared baseline data
     data_analyzer: Optional[Any] = None
+    summary_cache: Optional[Dict] = None  # data_analyzer.get_summary(), refreshed when data changes
     chat_agent: Optional[Any] = None
     conversation_history: list = field(default_factory=list)
     user_data: Dict = field(default_factory=dict)
@@ -45,7 +49,12 @@ class SessionManager:
         """
         self.timeout_seconds = timeout_seconds
         self.max_sessions = max_sessions
-        self.sessions: Dict[str, Session] = {}
+        # Ordered least- to most-recently active (LRU)
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        
+        # Content-addressed baseline DataFrames shared across sessions
+        self._df_cache: Dict[str, pd.DataFrame] = {}
+        self._refcount: Dict[str, int] = {}
     
     def create_session(self, user_id: Optional[str] = None) -> Session:
         """
@@ -57,15 +66,11 @@ class SessionManager:
         Returns:
             New Session object
         """
-        # Cleanup expired sessions
-        self.cleanup_expired()
-        
-        # Check session limit
+        # Check session limit (expired sessions are swept by cleanup_loop)
         if len(self.sessions) >= self.max_sessions:
-            # Remove oldest session
-            oldest_id = min(self.sessions.keys(), 
-                          key=lambda k: self.sessions[k].last_activity)
-            del self.sessions[oldest_id]
+            # Remove least recently active session (front of the LRU order)
+            oldest_id = next(iter(self.sessions))
+            self._remove_session(oldest_id)
         
         # Create new session
         session_id = str(uuid.uuid4())
@@ -92,11 +97,11 @@ class SessionManager:
         
         if session and session.is_expired(self.timeout_seconds):
             # Session expired, remove it
-            del self.sessions[session_id]
+            self._remove_session(session_id)
             return None
         
         if session:
-            session.touch()
+            self._touch(session)
         
         return session
     
@@ -119,22 +124,124 @@ class SessionManager:
             else:
                 session.user_data[key] = value
         
-        session.touch()
+        self._touch(session)
     
     def delete_session(self, session_id: str):
         """Delete session"""
         if session_id in self.sessions:
-            del self.sessions[session_id]
+            self._remove_session(session_id)
     
     def cleanup_expired(self):
         """Cleanup expired sessions"""
-        expired = [
-            sid for sid, session in self.sessions.items()
-            if session.is_expired(self.timeout_seconds)
-        ]
+        # Sessions are in activity order, so stop at the first live one
+        while self.sessions:
+            sid, session = next(iter(self.sessions.items()))
+            if not session.is_expired(self.timeout_seconds):
+                break
+            self._remove_session(sid)
+    
+    def _touch(self, session: Session):
+        """Mark session as most recently active"""
+        session.touch()
+        self.sessions.move_to_end(session.id)
+    
+    def _remove_session(self, session_id: str):
+        """Remove session and release its shared data"""
+        session = self.sessions.pop(session_id)
+        self._release_dataframe(session)
+    
+    def get_cached_dataframe(self, df_hash: str) -> Optional[pd.DataFrame]:
+        """Get shared DataFrame by content hash, if any session holds it"""
+        return self._df_cache.get(df_hash)
+    
+    def attach_dataframe(self, session_id: str, df_hash: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Attach data to a session, sharing one baseline DataFrame per content hash
+        
+        The shared frame must be treated as read-only; DataAnalyzer works on
+        its own (copy-on-write) copy.
+        
+        Args:
+            session_id: Session ID
+            df_hash: Content hash of the source file
+            df: Parsed DataFrame (ignored if the hash is already cached)
+            
+        Returns:
+            Shared DataFrame stored on the session
+        """
+        session = self.get_session(session_id)
+        
+        if not session:
+            raise ValueError(f"Session {session_id} not found or expired")
         
-        for sid in expired:
-            del self.sessions[sid]
+        if session.data_key == df_hash:
+            return session.data
+        
+        self._release_dataframe(session)
+        
+        if df_hash not in self._df_cache:
+            self._df_cache[df_hash] = df
+            self._refcount[df_hash] = 0
+        self._refcount[df_hash] += 1
+        
+        session.data = self._df_cache[df_hash]
+        session.data_key = df_hash
+        
+        return session.data
+    
+    def _release_dataframe(self, session: Session):
+        """Drop session's reference to shared data, evicting it when unused"""
+        df_hash = session.data_key
+        if df_hash is None:
+            return
+        
+        self._refcount[df_hash] -= 1
+        if self._refcount[df_hash] <= 0:
+            del self._refcount[df_hash]
+            del self._df_cache[df_hash]
+        
+        session.data = None
+        session.data_key = None
+    
+    async def cleanup_loop(self, interval_seconds: Optional[float] = None):
+        """
+        Periodically cleanup expired sessions (run as a background task)
+        
+        Args:
+            interval_seconds: Sweep interval, defaults to a tenth of the timeout
+        """
+        interval = interval_seconds or max(self.timeout_seconds / 10, 1)
+        while True:
+            await asyncio.sleep(interval)
+            await self._run(self.cleanup_expired)
+    
+    async def _run(self, func, *args, **kwargs):
+        """Run a manager method from async code (in-memory state needs no thread)"""
+        return func(*args, **kwargs)
+    
+    async def create_session_async(self, user_id: Optional[str] = None) -> Session:
+        """create_session for async callers"""
+        return await self._run(self.create_session, user_id)
+    
+    async def get_session_async(self, session_id: str) -> Optional[Session]:
+        """get_session for async callers"""
+        return await self._run(self.get_session, session_id)
+    
+    async def delete_session_async(self, session_id: str):
+        """delete_session for async callers"""
+        return await self._run(self.delete_session, session_id)
+    
+    async def get_cached_dataframe_async(self, df_hash: str) -> Optional[pd.DataFrame]:
+        """get_cached_dataframe for async callers"""
+        return await self._run(self.get_cached_dataframe, df_hash)
+    
+    async def attach_dataframe_async(self, session_id: str, df_hash: str, df: pd.DataFrame) -> pd.DataFrame:
+        """attach_dataframe for async callers"""
+        return await self._run(self.attach_dataframe, session_id, df_hash, df)
+    
+    async def get_session_info_async(self, session_id: str) -> Optional[Dict]:
+        """get_session_info for async callers"""
+        return await self._run(self.get_session_info, session_id)
     
     def get_active_session_count(self) -> int:
         """Get number of active sessions"""
@@ -155,11 +262,3 @@ class SessionManager:
             'has_data': session.data is not None,
             'conversation_length': len(session.conversation_history)
         }
-
-
-# Typing import fix
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    Any = object
-else:
-    from typing import Any
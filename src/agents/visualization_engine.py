@@ -13,8 +13,6 @@ from datetime import datetime
 import os
 
 # For PPT generation (extend existing)
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from generators.ppt_generator import PPTGenerator
 
 # For PDF generation
@@ -0,0 +1,20 @@
+"""
+API Dependencies
+
+Process-wide service singletons created in the app lifespan, injected with Depends
+"""
+
+from fastapi import Request
+
+from .services.file_service import FileService
+from .services.merge_service import MergeService
+
+
+def get_file_service(request: Request) -> FileService:
+    """Shared FileService for this worker"""
+    return request.app.state.file_service
+
+
+def get_merge_service(request: Request) -> MergeService:
+    """Shared MergeService for this worker"""
+    return request.app.state.merge_service
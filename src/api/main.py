@@ -6,16 +6,89 @@ RESTful API for document merging service
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import asyncio
+import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 
-# Add parent to path
+# Uploaded documents are parsed once per task: keep their contents out of the on-disk
+# parse cache, which task cleanup does not reach (set HOPPER_CACHE_DIR to opt back in)
+os.environ.setdefault('HOPPER_CACHE_DIR', '')
+
+# Put src/ on the path once, at the entry point; the api package imports relatively below it
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.routes import upload_router, merge_router, download_router
-from api.routes.chat import router as chat_router
+from api.routes.chat import router as chat_router, session_manager
 from api.models.task import HealthResponse
+from api.services.file_service import FileService
+from api.services.merge_service import MergeService
+from api.services.task_store import get_task_store
+from agents.chat_agent import close_shared_clients
+import pandas as pd
+
+# Copy-on-write: DataFrame copies and slices share memory until modified
+pd.set_option("mode.copy_on_write", True)
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so the event loop never blocks on stream I/O
+    
+    Returns:
+        Listener writing queued records to stderr from a background thread (not yet started)
+    """
+    log_queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    
+    return logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Per-worker startup/shutdown: app state and background tasks"""
+    # Track app start time
+    app.state.start_time = datetime.now()
+    
+    log_listener = configure_logging(getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO))
+    log_listener.start()
+    
+    # CPU-bound merges run in separate processes so they neither hold the GIL nor block the loop
+    merge_workers = int(os.getenv("MERGE_WORKERS", "0")) or os.cpu_count()
+    app.state.pool = ProcessPoolExecutor(max_workers=merge_workers)
+    
+    # One service instance per worker, injected into routes via Depends
+    app.state.file_service = FileService()
+    app.state.merge_service = MergeService(executor=app.state.pool)
+    
+    # Sweep expired chat sessions in the background instead of on every request
+    cleanup_task = asyncio.create_task(session_manager.cleanup_loop())
+    
+    # Remove stale uploads/results off the event loop
+    file_cleanup_task = asyncio.create_task(app.state.file_service.cleanup_loop())
+    
+    yield
+    
+    cleanup_task.cancel()
+    file_cleanup_task.cancel()
+    await close_shared_clients()
+    await get_task_store().close()
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+    log_listener.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -23,7 +96,9 @@ app = FastAPI(
     description="RESTful API for merging multiple document formats into Excel",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for mobile app
@@ -35,9 +110,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Track app start time
-start_time = datetime.now()
-
 # Include routers
 app.include_router(upload_router, prefix="/api/v1", tags=["Upload"])
 app.include_router(merge_router, prefix="/api/v1", tags=["Merge"])
@@ -59,7 +131,7 @@ async def root():
 @app.get("/api/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    uptime = datetime.now() - start_time
+    uptime = datetime.now() - app.state.start_time
     uptime_seconds = int(uptime.total_seconds())
     
     return HealthResponse(
@@ -72,16 +144,37 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
     
+    host = os.getenv("API_HOST", "0.0.0.0")
+    port = int(os.getenv("API_PORT", "8000"))
+    
+    # Auto-reload is for development only: it runs a single worker behind a file watcher
+    reload = os.getenv("API_RELOAD", "").lower() in ("1", "true", "yes")
+    
+    # Tasks, chat sessions and results live in process memory unless Redis holds them,
+    # so run one worker by default; WORKERS overrides, REDIS_URL scales to all cores
+    if reload:
+        workers = 1
+    elif os.getenv("WORKERS"):
+        workers = int(os.getenv("WORKERS"))
+    elif os.getenv("REDIS_URL"):
+        workers = os.cpu_count() or 1
+    else:
+        workers = 1
+    
     print("=" * 60)
     print("🚀 Starting Smart Document Factory API")
     print("=" * 60)
-    print("📖 API Docs: http://localhost:8000/api/docs")
-    print("💊 Health Check: http://localhost:8000/api/health")
+    print(f"📖 API Docs: http://localhost:{port}/api/docs")
+    print(f"💊 Health Check: http://localhost:{port}/api/health")
     print("=" * 60)
     
+    # uvloop + httptools ship with uvicorn[standard]
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
+        host=host,
+        port=port,
+        reload=reload,
+        workers=workers,
+        loop="uvloop",
+        http="httptools"
     )
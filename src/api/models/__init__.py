@@ -3,6 +3,7 @@ Models Module
 """
 
 from .task import (
+    FastModel,
     Task,
     TaskStatus,
     UploadResponse,
@@ -11,13 +12,16 @@ from .task import (
     TaskResponse,
     HealthResponse
 )
+from .chat import ChatMessageRequest
 
 __all__ = [
+    'FastModel',
     'Task',
     'TaskStatus',
     'UploadResponse',
     'MergeRequest',
     'MergeResponse',
     'TaskResponse',
-    'HealthResponse'
+    'HealthResponse',
+    'ChatMessageRequest'
 ]
@@ -0,0 +1,12 @@
+"""
+Chat Data Models
+
+Pydantic models for chat API requests
+"""
+
+from .task import FastModel
+
+
+class ChatMessageRequest(FastModel):
+    """Chat message request model"""
+    message: str
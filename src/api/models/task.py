@@ -4,13 +4,24 @@ Task Data Models
 Pydantic models for API request/response
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 import uuid
 
 
+class FastModel(BaseModel):
+    """Base model for API payloads: unknown fields are dropped, assignment is not re-validated"""
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        from_attributes=True,
+        ser_json_timedelta='iso8601'
+    )
+
+
 class TaskStatus(str, Enum):
     """Task status enumeration"""
     QUEUED = "queued"
@@ -19,7 +30,7 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
-class Task(BaseModel):
+class Task(FastModel):
     """Task model"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     status: TaskStatus = TaskStatus.QUEUED
@@ -29,8 +40,8 @@ class Task(BaseModel):
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "status": "completed",
@@ -40,9 +51,10 @@ class Task(BaseModel):
                 "completed_at": "2024-02-01T10:00:05Z"
             }
         }
+    )
 
 
-class UploadResponse(BaseModel):
+class UploadResponse(FastModel):
     """Upload response model"""
     task_id: str
     files_received: int
@@ -50,13 +62,13 @@ class UploadResponse(BaseModel):
     message: str = "Files uploaded successfully"
 
 
-class MergeRequest(BaseModel):
+class MergeRequest(FastModel):
     """Merge request model"""
     task_id: str
     output_filename: str = "merged_result.xlsx"
 
 
-class MergeResponse(BaseModel):
+class MergeResponse(FastModel):
     """Merge response model"""
     task_id: str
     status: str
@@ -64,7 +76,7 @@ class MergeResponse(BaseModel):
     estimated_time: str = "5s"
 
 
-class TaskResponse(BaseModel):
+class TaskResponse(FastModel):
     """Task status response"""
     task_id: str
     status: str
@@ -76,7 +88,7 @@ class TaskResponse(BaseModel):
     error: Optional[str] = None
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(FastModel):
     """Health check response"""
     status: str = "healthy"
     version: str = "1.0.0"
@@ -5,33 +5,81 @@ WebSocket and REST endpoints for conversational agent
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import List
-import json
-import sys
+import os
+import hashlib
+import tempfile
+import orjson
 from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from agents.chat_agent import ChatAgent, AgentResponse
+from agents.chat_agent import ChatAgent, AgentResponse, Intent
 from agents.data_analyzer import DataAnalyzer
 from agents.session_manager import SessionManager
+from agents.redis_session_manager import RedisSessionManager
 from agents.visualization_engine import VisualizationEngine
+from ..models.chat import ChatMessageRequest
+from ..services.file_service import CHUNK_SIZE
 from parsers.parser_factory import ParserFactory
+import numpy as np
 import pandas as pd
 
 router = APIRouter()
 
+# orjson handles datetime/numpy natively; _default covers pandas scalars and frames
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
 # Global managers (in production, use dependency injection)
-session_manager = SessionManager()
+# Set REDIS_URL to share sessions across API workers
+session_manager = (
+    RedisSessionManager(os.environ['REDIS_URL']) if os.getenv('REDIS_URL')
+    else SessionManager()
+)
 viz_engine = VisualizationEngine()
 
+# RAM-backed tmpfs for short-lived upload copies on Linux, system default elsewhere
+_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _default(obj):
+    """orjson fallback for values it cannot serialize natively"""
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient='records')
+    if isinstance(obj, pd.Series):
+        return obj.tolist()
+    return str(obj)
+
+
+class InboundMsg:
+    """Raw inbound frame, parsed at most once however many handlers read it"""
+    __slots__ = ('raw', '_parsed')
+    
+    def __init__(self, raw):
+        self.raw = raw
+        self._parsed = None
+    
+    @property
+    def parsed(self) -> dict:
+        if self._parsed is None:
+            self._parsed = orjson.loads(self.raw)
+        return self._parsed
+
+
+def _dumps(payload) -> bytes:
+    """Encode a reply for the wire"""
+    return orjson.dumps(payload, option=_ORJSON_OPTIONS, default=_default)
+
 
 @router.post("/sessions")
 async def create_chat_session():
     """Create new chat session"""
-    session = session_manager.create_session()
+    session = await session_manager.create_session_async()
     
     # Initialize chat agent
     session.chat_agent = ChatAgent()
@@ -46,44 +94,53 @@ async def create_chat_session():
 @router.post("/sessions/{session_id}/upload")
 async def upload_file_to_session(session_id: str, file: UploadFile = File(...)):
     """Upload file to chat session"""
-    session = session_manager.get_session(session_id)
+    session = await session_manager.get_session_async(session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    temp_path = None
     try:
-        # Save file temporarily
-        temp_path = Path(f"/tmp/{file.filename}")
-        with open(temp_path, 'wb') as f:
-            content = await file.read()
-            f.write(content)
+        # Stream to a private temp file (tmpfs when available), hashing as we go
+        hasher = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=_TEMP_DIR, suffix=Path(file.filename).suffix, delete=False) as tmp:
+            temp_path = Path(tmp.name)
+            while chunk := await file.read(CHUNK_SIZE):
+                hasher.update(chunk)
+                tmp.write(chunk)
         
-        # Parse file
-        parser = ParserFactory.create_parser(str(temp_path))
-        parsed_data = parser.parse()
+        # Identical uploads share one parsed DataFrame across sessions
+        df_hash = hasher.hexdigest()
+        df = await session_manager.get_cached_dataframe_async(df_hash)
         
-        # Get tables
-        tables = parsed_data['content'].get('tables', [])
-        
-        if not tables:
-            raise HTTPException(status_code=400, detail="No tables found in file")
+        if df is None:
+            # Parse file
+            parser = ParserFactory.create_parser(str(temp_path))
+            parsed_data = await parser.parse_async(include_text=False, include_metrics=False)
+            
+            # Get tables
+            tables = parsed_data['content'].get('tables', [])
+            
+            if not tables:
+                raise HTTPException(status_code=400, detail="No tables found in file")
+            
+            # Use first table (or let user choose)
+            df = tables[0]
         
-        # Use first table (or let user choose)
-        df = tables[0]
+        # Update session
+        df = await session_manager.attach_dataframe_async(session_id, df_hash, df)
         
         # Create data analyzer
         analyzer = DataAnalyzer(df)
-        
-        # Update session
-        session.data = df
         session.data_analyzer = analyzer
         
-        # Get data summary for agent
+        # Get data summary for agent (cached until the data changes)
         summary = analyzer.get_summary()
+        session.summary_cache = summary
         
         # Update agent context
         if session.chat_agent:
-            session.chat_agent.data_context = summary
+            session.chat_agent.set_context(summary)
         
         return {
             "message": "File uploaded successfully",
@@ -91,8 +148,13 @@ async def upload_file_to_session(session_id: str, file: UploadFile = File(...)):
             "data_summary": summary
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
 
 
 @router.websocket("/ws/{session_id}")
@@ -100,20 +162,22 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time chat"""
     await websocket.accept()
     
-    session = session_manager.get_session(session_id)
+    session = await session_manager.get_session_async(session_id)
     
     if not session:
-        await websocket.send_json({"error": "Session not found"})
+        await websocket.send_bytes(_dumps({"error": "Session not found"}))
         await websocket.close()
         return
     
     try:
         while True:
-            # Receive message
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            # Receive message (text or binary frame; orjson parses either without re-decoding)
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                raise WebSocketDisconnect(message.get('code', 1000))
+            msg = InboundMsg(message.get('bytes') or message.get('text'))
             
-            user_message = message_data.get('message', '')
+            user_message = msg.parsed.get('message', '')
             
             if not user_message:
                 continue
@@ -124,7 +188,7 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
             
             response = await session.chat_agent.process_message(
                 user_message,
-                context=session.data_analyzer.get_summary() if session.data_analyzer else None
+                context=session.summary_cache
             )
             
             # Execute intent if present
@@ -137,18 +201,54 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
                 )
             
             # Send response
-            await websocket.send_json({
+            await websocket.send_bytes(_dumps({
                 "type": "message",
                 "message": response.message,
                 "intent": response.intent.to_dict() if response.intent else None,
                 "quick_actions": response.quick_actions,
                 "result": result_data
-            })
+            }))
             
     except WebSocketDisconnect:
         print(f"Client disconnected from session {session_id}")
 
 
+@router.post("/sessions/{session_id}/stream")
+async def stream_chat(session_id: str, request: ChatMessageRequest):
+    """Server-Sent Events endpoint streaming the agent reply as it is generated"""
+    session = await session_manager.get_session_async(session_id)
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if not session.chat_agent:
+        session.chat_agent = ChatAgent()
+    
+    async def event_stream():
+        async for event in session.chat_agent.process_stream(request.message, context=session.summary_cache):
+            # Execute intent once the full reply has been parsed
+            if event['type'] == 'message':
+                result_data = None
+                if event['intent'] and session.data_analyzer:
+                    intent = Intent(**event['intent'])
+                    result_data = await execute_intent(intent, session.data_analyzer, session_id)
+                event['result'] = result_data
+            
+            yield b"data: " + _dumps(event) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+async def refresh_summary(session_id: str, analyzer: DataAnalyzer):
+    """Recompute the cached data summary after the analyzer's data changed"""
+    session = await session_manager.get_session_async(session_id)
+    
+    if session:
+        session.summary_cache = analyzer.get_summary()
+        if session.chat_agent:
+            session.chat_agent.set_context(session.summary_cache)
+
+
 async def execute_intent(intent, analyzer: DataAnalyzer, session_id: str):
     """Execute user intent and return results"""
     
@@ -156,11 +256,22 @@ async def execute_intent(intent, analyzer: DataAnalyzer, session_id: str):
         # Apply filters
         params = intent.parameters
         if 'category' in params:
-            # Find category column
+            # Use the named column, or find category column
             categories = analyzer.metadata.categories
-            if categories:
+            category_col = params.get('column')
+            if not category_col and categories:
                 category_col = list(categories.keys())[0]
+            # Column names from "/filter Col=val" are user-typed; report unknown ones
+            # instead of letting apply_filter's ValueError close the socket
+            if category_col and category_col not in analyzer.df.columns:
+                return {
+                    "action": "error",
+                    "message": f"Column '{category_col}' not found. "
+                               f"Available columns: {', '.join(map(str, analyzer.df.columns))}"
+                }
+            if category_col:
                 analyzer.apply_filter(category_col, params['category'])
+                await refresh_summary(session_id, analyzer)
                 
                 return {
                     "action": "filter_applied",
@@ -196,7 +307,7 @@ async def execute_intent(intent, analyzer: DataAnalyzer, session_id: str):
 @router.get("/sessions/{session_id}")
 async def get_session_info(session_id: str):
     """Get session information"""
-    info = session_manager.get_session_info(session_id)
+    info = await session_manager.get_session_info_async(session_id)
     
     if not info:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -207,5 +318,5 @@ async def get_session_info(session_id: str):
 @router.delete("/sessions/{session_id}")
 async def delete_session(session_id: str):
     """Delete session"""
-    session_manager.delete_session(session_id)
+    await session_manager.delete_session_async(session_id)
     return {"message": "Session deleted"}
@@ -4,26 +4,18 @@ Download Routes
 Handles file download endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse
-import sys
 from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from api.services.file_service import FileService
-from api.services.merge_service import MergeService
+from ..services.merge_service import MergeService
+from ..dependencies import get_merge_service
 
 router = APIRouter()
 
-# Services
-file_service = FileService()
-merge_service = MergeService()
-
 
 @router.get("/download/{task_id}")
-async def download_result(task_id: str):
+async def download_result(task_id: str, merge_service: MergeService = Depends(get_merge_service)):
     """
     Download merged result file
     
@@ -35,7 +27,7 @@ async def download_result(task_id: str):
     """
     try:
         # Get task
-        task = merge_service.get_task(task_id)
+        task = await merge_service.get_task(task_id)
         
         if task.status != "completed":
             raise HTTPException(
@@ -49,19 +41,23 @@ async def download_result(task_id: str):
                 detail="Result file not found"
             )
         
-        # Get result file
+        # Get result file (one stat serves both the existence check and the response headers)
         result_path = Path(task.result_path)
         
-        if not result_path.exists():
+        try:
+            stat_result = result_path.stat()
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail="Result file not found on server"
             )
         
-        # Return file
+        # Return file (streamed as-is; keep body-buffering middleware off this route)
         return FileResponse(
             path=str(result_path),
             filename=result_path.name,
+            stat_result=stat_result,
+            headers={"Content-Length": str(stat_result.st_size)},
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
     
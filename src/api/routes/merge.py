@@ -4,29 +4,29 @@ Merge Routes
 Handles merge operation endpoints
 """
 
-from fastapi import APIRouter, HTTPException
-import sys
-from pathlib import Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+import hashlib
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from api.models.task import MergeRequest, MergeResponse, TaskResponse
-from api.services.file_service import FileService
-from api.services.merge_service import MergeService
+from ..models.task import MergeRequest, MergeResponse, TaskResponse, TaskStatus
+from ..services.file_service import FileService
+from ..services.merge_service import MergeService
+from ..dependencies import get_file_service, get_merge_service
 
 router = APIRouter()
 
-# Services
-file_service = FileService()
-merge_service = MergeService()
-
 
 @router.post("/merge", response_model=MergeResponse)
-async def start_merge(request: MergeRequest):
+async def start_merge(
+    request: MergeRequest,
+    background_tasks: BackgroundTasks,
+    file_service: FileService = Depends(get_file_service),
+    merge_service: MergeService = Depends(get_merge_service)
+):
     """
     Start merge operation for uploaded files
     
+    The merge runs in the background; poll /tasks/{task_id} for completion.
+    
     Args:
         request: Merge request with task ID
         
@@ -35,7 +35,7 @@ async def start_merge(request: MergeRequest):
     """
     try:
         # Get task
-        task = merge_service.get_task(request.task_id)
+        task = await merge_service.get_task(request.task_id)
         
         if not task.files:
             raise HTTPException(
@@ -49,20 +49,14 @@ async def start_merge(request: MergeRequest):
             request.output_filename
         )
         
-        # Start merge (synchronous for now, can be async with Celery later)
-        success = merge_service.merge_files(request.task_id, output_path)
-        
-        if not success:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Merge failed: {task.error}"
-            )
+        # Start merge in the worker pool after the response is sent
+        await merge_service.update_task_status(request.task_id, TaskStatus.PROCESSING)
+        background_tasks.add_task(merge_service.merge_files, request.task_id, output_path)
         
-        return MergeResponse(
+        return MergeResponse.model_construct(
             task_id=request.task_id,
-            status="completed",
-            message="Files merged successfully",
-            estimated_time="0s"
+            status=TaskStatus.PROCESSING.value,
+            message="Merge started"
         )
     
     except HTTPException:
@@ -74,10 +68,18 @@ async def start_merge(request: MergeRequest):
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-async def get_task_status(task_id: str):
+async def get_task_status(
+    task_id: str,
+    request: Request,
+    response: Response,
+    merge_service: MergeService = Depends(get_merge_service)
+):
     """
     Get task status and progress
     
+    Responds 304 Not Modified when the client's If-None-Match still matches,
+    so pollers skip re-downloading an unchanged status.
+    
     Args:
         task_id: Task ID to query
         
@@ -85,17 +87,28 @@ async def get_task_status(task_id: str):
         Task status response
     """
     try:
-        task = merge_service.get_task(task_id)
-        progress = merge_service.get_task_progress(task_id)
+        task = await merge_service.get_task(task_id)
+        progress = merge_service.progress_for(task)
+        
+        etag = '"%s"' % hashlib.blake2b(
+            f"{task.status.value}:{progress}:{task.completed_at}".encode(),
+            digest_size=8
+        ).hexdigest()
+        
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+        
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'no-cache'
         
         # Build result URL if completed
         result_url = None
         if task.status == "completed" and task.result_path:
             result_url = f"/api/v1/download/{task_id}"
         
-        return TaskResponse(
+        return TaskResponse.model_construct(
             task_id=task.id,
-            status=task.status,
+            status=task.status.value,
             progress=progress,
             result_url=result_url,
             files_count=len(task.files),
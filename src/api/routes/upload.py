@@ -4,27 +4,23 @@ Upload Routes
 Handles file upload endpoints
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException
 from typing import List
-import sys
-from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from api.models.task import UploadResponse
-from api.services.file_service import FileService
-from api.services.merge_service import MergeService
+from ..models.task import UploadResponse
+from ..services.file_service import FileService
+from ..services.merge_service import MergeService
+from ..dependencies import get_file_service, get_merge_service
 
 router = APIRouter()
 
-# Services (these will be injected from main app)
-file_service = FileService()
-merge_service = MergeService()
-
 
 @router.post("/upload", response_model=UploadResponse)
-async def upload_files(files: List[UploadFile] = File(...)):
+async def upload_files(
+    files: List[UploadFile] = File(...),
+    file_service: FileService = Depends(get_file_service),
+    merge_service: MergeService = Depends(get_merge_service)
+):
     """
     Upload multiple files for merging
     
@@ -35,32 +31,33 @@ async def upload_files(files: List[UploadFile] = File(...)):
         Upload response with task ID
     """
     try:
+        # Validate all filenames up front, before any task or file is created
+        invalid = await file_service.find_invalid_files([file.filename for file in files])
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid file type: {invalid[0]}. Supported: Excel, CSV, Word, PDF"
+            )
+        
         # Create new task
-        task = merge_service.create_task()
+        task = await merge_service.create_task()
         
-        # Validate and save files
+        # Save files
         saved_files = []
         for file in files:
-            # Validate file
-            if not file_service.validate_file(file.filename):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid file type: {file.filename}. Supported: Excel, CSV, Word, PDF"
-                )
-            
-            # Read and save file
-            content = await file.read()
-            file_path = await file_service.save_uploaded_file(
+            # Stream file to disk
+            file_path = await file_service.save_uploaded_stream(
                 task.id,
                 file.filename,
-                content
+                file
             )
             saved_files.append(file_path)
         
         # Update task with file paths
         task.files = saved_files
+        await merge_service.save_task(task)
         
-        return UploadResponse(
+        return UploadResponse.model_construct(
             task_id=task.id,
             files_received=len(saved_files),
             status="queued",
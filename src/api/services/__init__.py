@@ -4,5 +4,6 @@ Services Module
 
 from .file_service import FileService
 from .merge_service import MergeService
+from .task_store import TaskStore, RedisTaskStore, get_task_store
 
-__all__ = ['FileService', 'MergeService']
+__all__ = ['FileService', 'MergeService', 'TaskStore', 'RedisTaskStore', 'get_task_store']
@@ -5,12 +5,29 @@ Manages file uploads and storage
 """
 
 import aiofiles
+from fastapi import UploadFile
 from pathlib import Path
 from typing import List
+import glob
 import shutil
+import asyncio
+import re
 from datetime import datetime, timedelta
 import os
 
+# Upload streaming chunk size (1 MiB)
+CHUNK_SIZE = 1 << 20
+
+# Supported upload extensions (lowercase, with dot)
+_ALLOWED_EXT = frozenset({'.xlsx', '.xls', '.csv', '.docx', '.doc', '.pdf'})
+_ALLOWED_EXT_RE = re.compile(
+    r'\.(?:%s)\Z' % '|'.join(sorted((ext[1:] for ext in _ALLOWED_EXT), key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Batches larger than this are validated in a worker thread
+_BATCH_THREAD_THRESHOLD = 256
+
 
 class FileService:
     """Service for managing file uploads and storage"""
@@ -56,6 +73,27 @@ class FileService:
         
         return str(file_path)
     
+    async def save_uploaded_stream(self, task_id: str, filename: str, upload_file: UploadFile) -> str:
+        """
+        Save uploaded file by streaming it to disk in fixed-size chunks
+        
+        Args:
+            task_id: Task ID
+            filename: Original filename
+            upload_file: Incoming upload (read chunk by chunk, never fully buffered)
+            
+        Returns:
+            Path to saved file
+        """
+        task_dir = self.get_task_upload_dir(task_id)
+        file_path = task_dir / filename
+        
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await upload_file.read(CHUNK_SIZE):
+                await f.write(chunk)
+        
+        return str(file_path)
+    
     def get_task_files(self, task_id: str) -> List[str]:
         """Get all files for a task"""
         task_dir = self.get_task_upload_dir(task_id)
@@ -63,18 +101,21 @@ class FileService:
         if not task_dir.exists():
             return []
         
-        return [str(f) for f in task_dir.iterdir() if f.is_file()]
+        with os.scandir(task_dir) as it:
+            return [entry.path for entry in it if entry.is_file()]
     
     def get_result_path(self, task_id: str, filename: str = "merged_result.xlsx") -> str:
         """Get path for result file"""
         return str(self.result_dir / f"{task_id}_{filename}")
     
+    def _task_results(self, task_id: str) -> List[Path]:
+        """Result files of a task (named "{task_id}_{filename}"), read from disk so every worker agrees"""
+        return list(self.result_dir.glob(f"{glob.escape(task_id)}_*"))
+    
     def get_result(self, task_id: str) -> Path:
         """Get result file for a task"""
-        # Find result file starting with task_id
-        for file_path in self.result_dir.iterdir():
-            if file_path.name.startswith(task_id):
-                return file_path
+        for path in self._task_results(task_id):
+            return path
         
         raise FileNotFoundError(f"No result file found for task {task_id}")
     
@@ -86,27 +127,47 @@ class FileService:
             shutil.rmtree(task_dir)
         
         # Remove result files
-        for file_path in self.result_dir.iterdir():
-            if file_path.name.startswith(task_id):
-                file_path.unlink()
+        for path in self._task_results(task_id):
+            path.unlink(missing_ok=True)
+    
+    async def cleanup_task_async(self, task_id: str):
+        """Clean up all files for a task without blocking the event loop"""
+        await asyncio.to_thread(self.cleanup_task, task_id)
+    
+    async def cleanup_old_files_async(self, hours: int = 24):
+        """Clean up files older than specified hours without blocking the event loop"""
+        await asyncio.to_thread(self.cleanup_old_files, hours)
+    
+    async def cleanup_loop(self, interval_seconds: float = 3600, hours: int = 24):
+        """
+        Periodically clean up old files (run as a background task)
+        
+        Args:
+            interval_seconds: Sweep interval
+            hours: Age in hours after which files are removed
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.cleanup_old_files_async(hours)
+            except OSError as e:
+                print(f"⚠️  File cleanup failed: {e}")
     
     def cleanup_old_files(self, hours: int = 24):
-        """Clean up files older than specified hours"""
-        cutoff = datetime.now() - timedelta(hours=hours)
+        """Clean up files older than specified hours (blocking; use cleanup_old_files_async from async code)"""
+        cutoff_ts = (datetime.now() - timedelta(hours=hours)).timestamp()
         
-        # Cleanup uploads
-        for task_dir in self.upload_dir.iterdir():
-            if task_dir.is_dir():
-                mtime = datetime.fromtimestamp(task_dir.stat().st_mtime)
-                if mtime < cutoff:
-                    shutil.rmtree(task_dir)
+        # Cleanup uploads (DirEntry caches type and stat, saving a syscall per entry)
+        with os.scandir(self.upload_dir) as it:
+            for entry in it:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff_ts:
+                    shutil.rmtree(entry.path)
         
         # Cleanup results
-        for file_path in self.result_dir.iterdir():
-            if file_path.is_file():
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if mtime < cutoff:
-                    file_path.unlink()
+        with os.scandir(self.result_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                    os.unlink(entry.path)
     
     def get_file_size(self, file_path: str) -> int:
         """Get file size in bytes"""
@@ -124,7 +185,22 @@ class FileService:
             True if valid
         """
         # Check extension
-        allowed_extensions = {'.xlsx', '.xls', '.csv', '.docx', '.doc', '.pdf'}
-        ext = Path(filename).suffix.lower()
+        return _ALLOWED_EXT_RE.search(filename) is not None
+    
+    async def find_invalid_files(self, filenames: List[str]) -> List[str]:
+        """
+        Validate a batch of filenames
+        
+        Args:
+            filenames: Filenames to validate
+            
+        Returns:
+            Filenames with unsupported extensions (empty if all valid)
+        """
+        def scan() -> List[str]:
+            search = _ALLOWED_EXT_RE.search
+            return [name for name in filenames if search(name) is None]
         
-        return ext in allowed_extensions
+        if len(filenames) > _BATCH_THREAD_THRESHOLD:
+            return await asyncio.to_thread(scan)
+        return scan()
@@ -4,50 +4,88 @@ Merge Service
 Handles document merging operations
 """
 
-import sys
-from pathlib import Path
+from mergers.excel_merger import ExcelMerger
+from ..models.task import Task, TaskStatus
+from .task_store import TaskStore, get_task_store
+from concurrent.futures import Executor
+from typing import List, Optional
+import asyncio
+import logging
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+log = logging.getLogger("hopper.merge")
 
-from mergers.excel_merger import ExcelMerger
-from api.models.task import Task, TaskStatus
-from typing import Dict
-import traceback
+
+def _merge_worker(files: List[str], output_path: str):
+    """
+    Merge files to Excel (runs in a worker process, so takes only picklable args)
+    
+    Args:
+        files: Input file paths
+        output_path: Output file path
+    """
+    merger = ExcelMerger()
+    
+    # Add all files
+    success_count = merger.add_files(files)
+    
+    if success_count == 0:
+        raise ValueError("No files were successfully processed")
+    
+    # Merge to Excel
+    if not merger.merge_to_excel(output_path):
+        raise ValueError("Merge operation failed")
 
 
 class MergeService:
     """Service for handling merge operations"""
     
-    def __init__(self):
-        """Initialize merge service"""
-        self.tasks: Dict[str, Task] = {}
+    def __init__(self,
+                 store: Optional[TaskStore] = None,
+                 executor: Optional[Executor] = None):
+        """
+        Initialize merge service
+        
+        Args:
+            store: Task store (defaults to the shared process-wide store)
+            executor: Pool running the CPU-bound merge (defaults to the loop's thread pool)
+        """
+        self.store = store or get_task_store()
+        self.executor = executor
     
-    def create_task(self) -> Task:
+    async def create_task(self) -> Task:
         """Create a new task"""
         task = Task()
-        self.tasks[task.id] = task
+        await self.store.set(task.id, task)
         return task
     
-    def get_task(self, task_id: str) -> Task:
+    async def get_task(self, task_id: str) -> Task:
         """Get task by ID"""
-        if task_id not in self.tasks:
+        task = await self.store.get(task_id)
+        if task is None:
             raise ValueError(f"Task {task_id} not found")
-        return self.tasks[task_id]
+        return task
+    
+    async def save_task(self, task: Task):
+        """Persist changes made to a task"""
+        await self.store.set(task.id, task)
     
-    def update_task_status(self, task_id: str, status: TaskStatus, error: str = None):
+    async def update_task_status(self, task_id: str, status: TaskStatus, error: str = None) -> Task:
         """Update task status"""
-        task = self.get_task(task_id)
-        task.status = status
+        fields = {'status': status}
         
         if error:
-            task.error = error
+            fields['error'] = error
         
         if status == TaskStatus.COMPLETED or status == TaskStatus.FAILED:
             from datetime import datetime
-            task.completed_at = datetime.now()
+            fields['completed_at'] = datetime.now()
+        
+        task = await self.store.update(task_id, **fields)
+        if task is None:
+            raise ValueError(f"Task {task_id} not found")
+        return task
     
-    def merge_files(self, task_id: str, output_path: str) -> bool:
+    async def merge_files(self, task_id: str, output_path: str) -> bool:
         """
         Merge files for a task
         
@@ -59,41 +97,31 @@ class MergeService:
             True if successful
         """
         try:
-            task = self.get_task(task_id)
+            task = await self.get_task(task_id)
             
             if not task.files:
                 raise ValueError("No files to merge")
             
             # Update status
-            self.update_task_status(task_id, TaskStatus.PROCESSING)
-            
-            # Create merger
-            merger = ExcelMerger()
-            
-            # Add all files
-            success_count = merger.add_files(task.files)
+            await self.update_task_status(task_id, TaskStatus.PROCESSING)
             
-            if success_count == 0:
-                raise ValueError("No files were successfully processed")
-            
-            # Merge to Excel
-            if not merger.merge_to_excel(output_path):
-                raise ValueError("Merge operation failed")
+            # Merge off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, _merge_worker, task.files, output_path)
             
             # Update task
-            task.result_path = output_path
-            self.update_task_status(task_id, TaskStatus.COMPLETED)
+            await self.store.update(task_id, result_path=output_path)
+            await self.update_task_status(task_id, TaskStatus.COMPLETED)
             
             return True
             
         except Exception as e:
             error_msg = f"Merge failed: {str(e)}"
-            print(error_msg)
-            traceback.print_exc()
-            self.update_task_status(task_id, TaskStatus.FAILED, error=error_msg)
+            log.exception("Merge failed for task %s", task_id)
+            await self.update_task_status(task_id, TaskStatus.FAILED, error=error_msg)
             return False
     
-    def get_task_progress(self, task_id: str) -> int:
+    async def get_task_progress(self, task_id: str) -> int:
         """
         Get task progress percentage
         
@@ -103,8 +131,13 @@ class MergeService:
         Returns:
             Progress percentage (0-100)
         """
-        task = self.get_task(task_id)
+        task = await self.get_task(task_id)
         
+        return self.progress_for(task)
+    
+    @staticmethod
+    def progress_for(task: Task) -> int:
+        """Progress percentage (0-100) for an already loaded task"""
         if task.status == TaskStatus.QUEUED:
             return 0
         elif task.status == TaskStatus.PROCESSING:
@@ -0,0 +1,133 @@
+"""
+Task Store
+
+Shared storage for merge tasks, so every router and worker sees the same state
+"""
+
+import os
+from typing import Dict, Optional
+
+from ..models.task import Task
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class TaskStore:
+    """In-process task store (single worker)"""
+    
+    def __init__(self):
+        """Initialize task store"""
+        self.tasks: Dict[str, Task] = {}
+    
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Get task by ID, or None if unknown"""
+        return self.tasks.get(task_id)
+    
+    async def set(self, task_id: str, task: Task):
+        """Store task"""
+        self.tasks[task_id] = task
+    
+    async def update(self, task_id: str, **fields) -> Optional[Task]:
+        """
+        Update task fields
+        
+        Args:
+            task_id: Task ID
+            **fields: Task attributes to set
+        
+        Returns:
+            Updated task or None if not found
+        """
+        task = await self.get(task_id)
+        
+        if task is None:
+            return None
+        
+        for key, value in fields.items():
+            setattr(task, key, value)
+        
+        await self.set(task_id, task)
+        return task
+    
+    async def delete(self, task_id: str):
+        """Delete task"""
+        self.tasks.pop(task_id, None)
+    
+    async def close(self):
+        """Release backend resources"""
+
+
+class RedisTaskStore(TaskStore):
+    """
+    Task store backed by Redis
+    
+    Tasks are stored as pydantic JSON under one key each, with a TTL so
+    abandoned tasks expire together with their uploaded files.
+    """
+    
+    def __init__(self,
+                 redis_url: str = "redis://localhost:6379/0",
+                 ttl_seconds: int = 24 * 3600,
+                 key_prefix: str = "hopper:"):
+        """
+        Initialize Redis task store
+        
+        Args:
+            redis_url: Redis connection URL
+            ttl_seconds: Task expiry in seconds
+            key_prefix: Prefix for all Redis keys
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is not installed. Install it with: pip install redis")
+        
+        super().__init__()
+        self.redis = aioredis.from_url(redis_url)
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+    
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.key_prefix}task:{task_id}"
+    
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Get task by ID, or None if unknown/expired"""
+        data = await self.redis.get(self._task_key(task_id))
+        
+        if data is None:
+            return None
+        
+        return Task.model_validate_json(data)
+    
+    async def set(self, task_id: str, task: Task):
+        """Store task and refresh its TTL"""
+        await self.redis.set(self._task_key(task_id), task.model_dump_json(), ex=self.ttl_seconds)
+    
+    async def delete(self, task_id: str):
+        """Delete task"""
+        await self.redis.delete(self._task_key(task_id))
+    
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+
+
+_task_store: Optional[TaskStore] = None
+
+
+def get_task_store() -> TaskStore:
+    """
+    Get the process-wide task store
+    
+    Uses Redis when REDIS_URL is set (required for multiple API workers),
+    otherwise an in-process store.
+    """
+    global _task_store
+    
+    if _task_store is None:
+        redis_url = os.getenv('REDIS_URL')
+        _task_store = RedisTaskStore(redis_url) if redis_url else TaskStore()
+    
+    return _task_store
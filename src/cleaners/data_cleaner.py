@@ -7,9 +7,36 @@ Intelligent data cleaning and preprocessing
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+import os
 import re
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Only probed here; pandas loads pyarrow for the 'string[pyarrow]' dtype
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# numpy dtype kinds treated as numeric (bool, int, uint, float, complex)
+NUMERIC_KINDS = 'biufc'
+
+# Rows sampled to decide whether a full-column type conversion is worth trying
+INFERENCE_SAMPLE_SIZE = 1024
+
+# Frames at least this long convert several columns concurrently during type inference
+PARALLEL_INFERENCE_MIN_ROWS = 100_000
+
 
 @dataclass
 class CleaningConfig:
@@ -28,6 +55,8 @@ class CleaningConfig:
     # Type inference
     infer_types: bool = True
     parse_dates: bool = True
+    downcast: bool = True  # Shrink converted integer columns to the smallest dtype that fits
+    downcast_floats: bool = False  # Also shrink float columns to float32 (loses precision)
     
     # Column normalization
     normalize_names: bool = True
@@ -35,6 +64,9 @@ class CleaningConfig:
     # Outlier detection
     detect_outliers: bool = False
     outlier_method: str = 'iqr'  # 'iqr' or 'zscore'
+    
+    # Execution engine
+    engine: str = 'auto'  # 'auto' (Polars if installed), 'polars' or 'pandas'
 
 
 @dataclass
@@ -89,21 +121,158 @@ class CleaningReport:
         return "\n".join(lines)
 
 
+def _null_counts(df: pd.DataFrame) -> pd.Series:
+    """
+    Per-column null counts without materializing a full boolean DataFrame
+    
+    NumPy float columns are counted with one np.isnan pass over their 2D block;
+    NumPy int/uint/bool columns cannot hold nulls; only the rest (object,
+    datetime, nullable extension types) go through isna.
+    """
+    counts = pd.Series(0, index=df.columns, dtype='int64')
+    
+    float_cols, other_cols = [], []
+    for col, dtype in df.dtypes.items():
+        if not isinstance(dtype, np.dtype):
+            other_cols.append(col)
+        elif dtype.kind == 'f':
+            float_cols.append(col)
+        elif dtype.kind not in 'biu':
+            other_cols.append(col)
+    
+    if float_cols:
+        counts[float_cols] = np.isnan(df[float_cols].to_numpy()).sum(axis=0)
+    if other_cols:
+        counts[other_cols] = pd.isna(df[other_cols]).to_numpy().sum(axis=0)
+    
+    return counts
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _iqr_mask(arr, lower, upper, out):
+        """Flag values outside [lower[j], upper[j]], one column per thread"""
+        for j in prange(arr.shape[1]):
+            lo = lower[j]
+            hi = upper[j]
+            for i in range(arr.shape[0]):
+                out[i, j] = arr[i, j] < lo or arr[i, j] > hi
+
+
+def _to_numeric_or_nan(col: pd.Series) -> pd.Series:
+    """pd.to_numeric with coercion; unconvertible object types become all-NaN"""
+    try:
+        result = pd.to_numeric(col, errors='coerce')
+    except (TypeError, ValueError):
+        return pd.Series(np.nan, index=col.index)
+    
+    # string[pyarrow] input gives nullable Int64/Float64; return the NumPy dtypes object input gets
+    if not isinstance(result.dtype, np.dtype):
+        if result.dtype.kind in 'iu' and not result.hasnans:
+            return result.astype(result.dtype.numpy_dtype)
+        return pd.Series(result.to_numpy(dtype=np.float64, na_value=np.nan), index=col.index, name=col.name)
+    return result
+
+
+def _downcast_numeric(col: pd.Series, floats: bool = False) -> pd.Series:
+    """Smallest integer dtype that holds col; floats shrink to float32 only when requested"""
+    col = pd.to_numeric(col, downcast='integer')
+    if floats and col.dtype.kind == 'f':
+        col = pd.to_numeric(col, downcast='float')
+    return col
+
+
+def _to_datetime_or_none(col: pd.Series) -> Optional[pd.Series]:
+    """pd.to_datetime with coercion; None when the column cannot be parsed at all"""
+    try:
+        return pd.to_datetime(col, errors='coerce', format='mixed')
+    except (TypeError, ValueError):
+        return None
+
+
+def _map_columns(func: Callable, frame: pd.DataFrame, cols: List) -> Dict:
+    """
+    Apply func to each column, on a thread pool for large frames
+    
+    The pandas conversion kernels release the GIL for much of their work, so
+    independent columns overlap across cores. Results are only collected
+    here; callers assign them to the frame serially.
+    
+    Args:
+        func: Per-column conversion
+        frame: Source DataFrame
+        cols: Columns to convert
+        
+    Returns:
+        Dict of column -> func(frame[column])
+    """
+    if len(cols) < 2 or len(frame) < PARALLEL_INFERENCE_MIN_ROWS:
+        return {col: func(frame[col]) for col in cols}
+    
+    with ThreadPoolExecutor(max_workers=min(len(cols), os.cpu_count() or 1)) as pool:
+        futures = {col: pool.submit(func, frame[col]) for col in cols}
+        return {col: future.result() for col, future in futures.items()}
+
+
+# Date-ish tokens: 2024-01-31, 31/01/2024, 2024年1月, Jan 31, 31 Jan, 09:30
+_RE_DATE_LIKE = re.compile(
+    r'\d{1,4}[-/.年]\d{1,2}|[A-Za-z]{3,9}\.?\s+\d{1,2}|\d{1,2}\s+[A-Za-z]{3,9}|\d{1,2}:\d{2}'
+)
+
+# Longer values are free text, not dates (the longest ISO timestamps are ~35 chars)
+_DATE_MAX_LEN = 40
+
+
+def _looks_like_dates(col: pd.Series, sample_size: int = 64) -> bool:
+    """Cheap pre-check on a few values before a full-column datetime parse"""
+    sample = col.dropna().head(sample_size)
+    if sample.empty:
+        return False
+    
+    hits = 0
+    for value in sample:
+        text = str(value)
+        if len(text) <= _DATE_MAX_LEN and _RE_DATE_LIKE.search(text):
+            hits += 1
+    return hits / len(sample) > 0.5
+
+
 class DataCleaner:
     """Intelligent data cleaner for DataFrames"""
     
-    def __init__(self, df: pd.DataFrame, config: Optional[CleaningConfig] = None):
+    # Column name normalization patterns (compiled once)
+    _RE_SPECIAL = re.compile(r'[^\w\s]')
+    _RE_WS = re.compile(r'\s+')
+    _SNAKE_OK = re.compile(r'[a-z0-9_]+').fullmatch
+    
+    # Packed outlier flags: bit j of word j // 64 is set when outlier_columns[j] is an outlier
+    OUTLIER_BITS = 'outlier_bits'
+    
+    # Input row positions carried through the Polars pipeline to restore the index
+    POLARS_ROW_COL = '__row_position'
+    
+    def __init__(self, df: pd.DataFrame, config: Optional[CleaningConfig] = None, copy: bool = False):
         """
         Initialize data cleaner
         
+        The input frame is never modified: every step replaces whole columns
+        or returns a new frame, so by default only a shallow copy (sharing the
+        column data) is taken instead of duplicating the data up front.
+        
         Args:
             df: DataFrame to clean
             config: Cleaning configuration
+            copy: Take a deep copy of df first
         """
-        self.df = df.copy()
         self.config = config or CleaningConfig()
+        
+        if self.config.engine == 'polars' and not POLARS_AVAILABLE:
+            raise ImportError("polars is not installed. Install it with: pip install polars")
+        
+        self.df = df.copy(deep=copy)
         self.report = CleaningReport()
         self.report.original_shape = df.shape
+        self.outlier_columns: List[str] = []
     
     def clean(self) -> pd.DataFrame:
         """
@@ -114,17 +283,25 @@ class DataCleaner:
         """
         print("\n🧹 Starting data cleaning...")
         
-        if self.config.remove_duplicates:
-            self.remove_duplicates()
-        
-        if self.config.handle_nulls:
-            self.handle_nulls()
-        
-        if self.config.normalize_names:
-            self.normalize_columns()
-        
-        if self.config.infer_types:
-            self.infer_types()
+        with pd.option_context('mode.copy_on_write', True):
+            return self._clean()
+    
+    def _clean(self) -> pd.DataFrame:
+        """Run the configured cleaning steps"""
+        if not (self.config.engine != 'pandas' and POLARS_AVAILABLE and self._clean_polars()):
+            self._to_arrow_strings()
+            
+            if self.config.remove_duplicates:
+                self.remove_duplicates()
+            
+            if self.config.handle_nulls:
+                self.handle_nulls()
+            
+            if self.config.normalize_names:
+                self.normalize_columns()
+            
+            if self.config.infer_types:
+                self.infer_types()
         
         if self.config.detect_outliers:
             self.detect_outliers()
@@ -135,16 +312,248 @@ class DataCleaner:
         
         return self.df
     
-    def remove_duplicates(self):
-        """Remove duplicate rows"""
+    def _clean_polars(self) -> bool:
+        """
+        Apply duplicate, null, type and name cleaning as one Polars lazy pipeline
+        
+        Polars does not share work between separate collects, so the frame is
+        materialized once after deduplication and once after filling; the
+        statistics each step needs (null counts, conversion ratios) are then
+        read from those frames instead of re-running the whole pipeline.
+        
+        Returns:
+            True if successful, False if the caller should use the pandas steps
+        """
+        try:
+            self.df = self._run_polars_pipeline()
+            return True
+        except Exception as e:
+            # Unsupported column types etc.
+            print(f"  ⚠️  Polars cleaning failed ({e}), using pandas")
+            self.report = CleaningReport(original_shape=self.report.original_shape)
+            return False
+    
+    def _run_polars_pipeline(self) -> pd.DataFrame:
+        """Build and execute the lazy cleaning pipeline"""
+        cfg = self.config
         initial_count = len(self.df)
         
-        self.df = self.df.drop_duplicates(
+        # Row positions ride along as a column (never null, never a string, already
+        # snake_case) so the input index can be restored after dedup and row drops
+        row_col = self.POLARS_ROW_COL
+        while row_col in self.df.columns:
+            row_col = f"_{row_col}"
+        pl_df = pl.from_pandas(self.df).with_row_index(row_col)
+        
+        if cfg.remove_duplicates:
+            pl_df = pl_df.lazy().unique(
+                subset=cfg.duplicate_subset or list(self.df.columns),
+                keep=cfg.keep_duplicate, maintain_order=True
+            ).collect()
+            
+            removed = initial_count - pl_df.height
+            self.report.duplicates_removed = removed
+            if removed > 0:
+                print(f"  ✓ Removed {removed} duplicate rows")
+        
+        lf = pl_df.lazy()
+        
+        text_fills = []
+        if cfg.handle_nulls:
+            null_counts = pl_df.null_count().row(0, named=True)
+            lf, text_fills = self._handle_nulls_polars(lf, pl_df.height, null_counts)
+        
+        if cfg.infer_types:
+            # Type inference reads the filled values; fill them once, not per statistic
+            if cfg.handle_nulls:
+                lf = lf.collect().lazy()
+            lf = self._infer_types_polars(lf)
+        
+        if cfg.normalize_names:
+            renamed = self._normalized_names(lf.collect_schema().names())
+            if renamed:
+                lf = lf.rename(renamed)
+                self.report.columns_renamed = renamed
+                print(f"  ✓ Normalized {len(renamed)} column names")
+                text_fills = [renamed.get(col, col) for col in text_fills]
+        
+        result = lf.collect().to_pandas()
+        result.index = self.df.index[result.pop(row_col).to_numpy()]
+        
+        if text_fills:
+            # Non-numeric, non-string columns (bool, datetime...) get '' like the pandas
+            # steps; Polars cannot mix '' into those dtypes, so fill after conversion
+            result[text_fills] = result[text_fills].astype(object).fillna('')
+        
+        return result
+    
+    def _handle_nulls_polars(self, lf: "pl.LazyFrame", row_count: int,
+                             null_counts: Dict[str, int]) -> "tuple[pl.LazyFrame, List[str]]":
+        """
+        Drop mostly-null columns and fill the rest with a single with_columns
+        
+        Returns:
+            The pipeline, and the columns whose nulls must be filled with '' after
+            conversion to pandas
+        """
+        cfg = self.config
+        schema = lf.collect_schema()
+        
+        cols_to_drop = [
+            col for col, count in null_counts.items()
+            if row_count and count / row_count > cfg.null_threshold
+        ]
+        if cols_to_drop:
+            lf = lf.drop(cols_to_drop)
+            self.report.columns_dropped.extend(cols_to_drop)
+            print(f"  ✓ Dropped {len(cols_to_drop)} columns with >{cfg.null_threshold*100}% nulls")
+        
+        null_cols = [col for col, count in null_counts.items() if count > 0 and col not in cols_to_drop]
+        
+        filled = null_cols
+        text_fills = []
+        if cfg.fill_strategy == 'drop':
+            if null_cols:
+                lf = lf.drop_nulls(subset=null_cols)
+        else:
+            fills = []
+            filled = []
+            for col in null_cols:
+                numeric = schema[col].is_numeric()
+                c = pl.col(col)
+                
+                if cfg.fill_strategy == 'mean' and numeric:
+                    fills.append(c.fill_null(c.mean()))
+                elif cfg.fill_strategy == 'median' and numeric:
+                    fills.append(c.fill_null(c.median()))
+                elif cfg.fill_strategy == 'mode':
+                    # pandas returns the smallest of tied modes
+                    fills.append(c.fill_null(c.drop_nulls().mode().sort().first()))
+                elif cfg.fill_strategy == 'ffill':
+                    fills.append(c.fill_null(strategy='forward'))
+                elif cfg.fill_strategy == 'bfill':
+                    fills.append(c.fill_null(strategy='backward'))
+                elif numeric:
+                    fills.append(c.fill_null(0))
+                elif schema[col] == pl.Utf8:
+                    fills.append(c.fill_null(''))
+                elif schema[col].is_temporal():
+                    # pandas' fillna('') leaves NaT in datetime columns
+                    continue
+                else:
+                    text_fills.append(col)
+                filled.append(col)
+            
+            if fills:
+                lf = lf.with_columns(fills)
+        
+        for col in filled:
+            self.report.nulls_filled[col] = null_counts[col]
+        
+        if self.report.nulls_filled:
+            print(f"  ✓ Filled nulls in {len(self.report.nulls_filled)} columns")
+        
+        return lf, text_fills
+    
+    def _infer_types_polars(self, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """Cast string columns that are mostly numeric (or dates) in one with_columns"""
+        str_cols = [col for col, dtype in lf.collect_schema().items() if dtype == pl.Utf8]
+        if not str_cols:
+            return lf
+        
+        # Conversion success ratio (and whether the values are whole numbers) in one pass
+        stats = lf.select([
+            pl.col(col).cast(pl.Float64, strict=False).is_not_null().mean().alias(col)
+            for col in str_cols
+        ] + [
+            (pl.col(col).cast(pl.Float64, strict=False) % 1 == 0).all().alias(f"__int_{i}")
+            for i, col in enumerate(str_cols)
+        ]).collect().row(0, named=True)
+        
+        casts = []
+        numeric_cols = []
+        for i, col in enumerate(str_cols):
+            if (stats[col] or 0) > 0.8:
+                expr = pl.col(col).cast(pl.Float64, strict=False)
+                if self.config.downcast and stats[f"__int_{i}"]:
+                    expr = expr.cast(pl.Int64).shrink_dtype()
+                elif self.config.downcast_floats:
+                    expr = expr.cast(pl.Float32)
+                casts.append(expr)
+                numeric_cols.append(col)
+        
+        if self.config.parse_dates:
+            date_cols = [col for col in str_cols if col not in numeric_cols]
+            for col in self._parse_dates_polars(lf, date_cols):
+                casts.append(pl.col(col).str.to_datetime(strict=False))
+                self.report.types_converted[col] = "object → datetime"
+        
+        if casts:
+            lf = lf.with_columns(casts)
+        
+        if numeric_cols:
+            schema = lf.collect_schema()
+            for col in numeric_cols:
+                self.report.types_converted[col] = f"object → {str(schema[col]).lower()}"
+        
+        if self.report.types_converted:
+            print(f"  ✓ Converted {len(self.report.types_converted)} column types")
+        
+        return lf
+    
+    @staticmethod
+    def _parse_dates_polars(lf: "pl.LazyFrame", columns: List[str]) -> List[str]:
+        """Columns whose values mostly parse as dates, from one select over lf"""
+        if not columns:
+            return []
+        
+        # Polars infers the date format from each column's first non-null value; check
+        # those values alone so one unrecognizable column does not fail the whole select
+        firsts = lf.select([pl.col(col).drop_nulls().first() for col in columns]).collect().row(0, named=True)
+        parseable = []
+        for col in columns:
+            if firsts[col] is None:
+                continue
+            try:
+                pl.Series(col, [firsts[col]]).str.to_datetime(strict=False)
+            except pl.exceptions.PolarsError:
+                # No recognizable date format
+                continue
+            parseable.append(col)
+        
+        if not parseable:
+            return []
+        
+        ratios = lf.select([
+            pl.col(col).str.to_datetime(strict=False).is_not_null().mean()
+            for col in parseable
+        ]).collect().row(0, named=True)
+        return [col for col in parseable if (ratios[col] or 0) > 0.8]
+    
+    def _to_arrow_strings(self):
+        """Store pure-string object columns as Arrow-backed strings for the pandas steps"""
+        if not PYARROW_AVAILABLE:
+            return
+        
+        # Mixed object columns (numbers, dates, None alongside text) are left untouched
+        str_cols = [
+            col for col, dtype in self.df.dtypes.items()
+            if dtype == object and pd.api.types.infer_dtype(self.df[col], skipna=True) == 'string'
+        ]
+        
+        if str_cols:
+            self.df[str_cols] = self.df[str_cols].astype('string[pyarrow]')
+    
+    def remove_duplicates(self):
+        """Remove duplicate rows"""
+        duplicated = self.df.duplicated(
             subset=self.config.duplicate_subset,
             keep=self.config.keep_duplicate
         )
         
-        removed = initial_count - len(self.df)
+        removed = int(duplicated.sum())
+        if removed > 0:
+            self.df = self.df.loc[~duplicated]
         self.report.duplicates_removed = removed
         
         if removed > 0:
@@ -152,96 +561,150 @@ class DataCleaner:
     
     def handle_nulls(self):
         """Handle missing values"""
+        # Null counts and dtype kinds for every column in one pass
+        dtype_kind = {col: dtype.kind for col, dtype in self.df.dtypes.items()}
+        null_counts = _null_counts(self.df)
+        
         # Drop columns with too many nulls
-        null_ratio = self.df.isnull().sum() / len(self.df)
+        null_ratio = null_counts / len(self.df)
         cols_to_drop = null_ratio[null_ratio > self.config.null_threshold].index.tolist()
         
         if cols_to_drop:
             self.df = self.df.drop(columns=cols_to_drop)
+            null_counts = null_counts.drop(cols_to_drop)
             self.report.columns_dropped.extend(cols_to_drop)
             print(f"  ✓ Dropped {len(cols_to_drop)} columns with >{self.config.null_threshold*100}% nulls")
         
-        # Fill remaining nulls
-        for col in self.df.columns:
-            null_count = self.df[col].isnull().sum()
-            
-            if null_count == 0:
-                continue
+        # Fill remaining nulls with one bulk call instead of one per column
+        null_counts = null_counts[null_counts > 0]
+        null_cols = null_counts.index.tolist()
+        
+        if null_cols:
+            strategy = self.config.fill_strategy
+            numeric = [col for col in null_cols if dtype_kind[col] in NUMERIC_KINDS]
+            other = [col for col in null_cols if dtype_kind[col] not in NUMERIC_KINDS]
             
-            if self.config.fill_strategy == 'drop':
+            if strategy == 'drop':
                 # Drop rows with nulls
-                self.df = self.df.dropna(subset=[col])
-            elif self.config.fill_strategy == 'mean' and pd.api.types.is_numeric_dtype(self.df[col]):
-                self.df[col] = self.df[col].fillna(self.df[col].mean())
-            elif self.config.fill_strategy == 'median' and pd.api.types.is_numeric_dtype(self.df[col]):
-                self.df[col] = self.df[col].fillna(self.df[col].median())
-            elif self.config.fill_strategy == 'mode':
-                mode_val = self.df[col].mode()
-                if len(mode_val) > 0:
-                    self.df[col] = self.df[col].fillna(mode_val[0])
-            elif self.config.fill_strategy == 'ffill':
-                self.df[col] = self.df[col].fillna(method='ffill')
-            elif self.config.fill_strategy == 'bfill':
-                self.df[col] = self.df[col].fillna(method='bfill')
+                self.df = self.df.dropna(subset=null_cols)
+            elif strategy == 'ffill':
+                self.df[null_cols] = self.df[null_cols].ffill()
+            elif strategy == 'bfill':
+                self.df[null_cols] = self.df[null_cols].bfill()
             else:
-                # Default: fill with empty string or 0
-                if pd.api.types.is_numeric_dtype(self.df[col]):
-                    self.df[col] = self.df[col].fillna(0)
+                if strategy == 'mode':
+                    # Most frequent value per column from a hash count (mode() also sorts
+                    # every tied value); ties go to the smallest, as with mode(). All-null
+                    # columns have none
+                    fill_map = {}
+                    for col in null_cols:
+                        counts = self.df[col].value_counts(dropna=True)
+                        if len(counts):
+                            tied = counts.index[counts.to_numpy() == counts.iloc[0]]
+                            try:
+                                fill_map[col] = tied.min()
+                            except TypeError:
+                                # Unorderable mixed values; mode() leaves these unsorted too
+                                fill_map[col] = tied[0]
+                elif strategy in ('mean', 'median'):
+                    fill_map = self.df[numeric].agg(strategy).to_dict()
+                    fill_map.update(dict.fromkeys(other, ''))
                 else:
-                    self.df[col] = self.df[col].fillna('')
+                    # Default: fill with empty string or 0
+                    fill_map = dict.fromkeys(numeric, 0)
+                    fill_map.update(dict.fromkeys(other, ''))
+                
+                self.df = self.df.fillna(fill_map)
             
-            self.report.nulls_filled[col] = null_count
+            self.report.nulls_filled.update(null_counts.to_dict())
         
         if self.report.nulls_filled:
             print(f"  ✓ Filled nulls in {len(self.report.nulls_filled)} columns")
     
     def normalize_columns(self):
         """Normalize column names to snake_case"""
+        renamed = self._normalized_names(self.df.columns)
+        
+        if renamed:
+            self.df = self.df.rename(columns=renamed)
+            self.report.columns_renamed = renamed
+            print(f"  ✓ Normalized {len(renamed)} column names")
+    
+    @classmethod
+    def _normalized_names(cls, columns) -> Dict[str, str]:
+        """Map each column name that changes under snake_case normalization to its new name"""
         renamed = {}
         
-        for col in self.df.columns:
+        for col in columns:
+            # Already snake_case: normalization would leave it unchanged
+            if isinstance(col, str) and cls._SNAKE_OK(col):
+                continue
+            
             # Convert to snake_case
-            new_name = re.sub(r'[^\w\s]', '', col)  # Remove special chars
-            new_name = re.sub(r'\s+', '_', new_name.strip())  # Replace spaces
+            new_name = cls._RE_SPECIAL.sub('', col)  # Remove special chars
+            new_name = cls._RE_WS.sub('_', new_name.strip())  # Replace spaces
             new_name = new_name.lower()
             
             if new_name != col:
                 renamed[col] = new_name
         
-        if renamed:
-            self.df = self.df.rename(columns=renamed)
-            self.report.columns_renamed = renamed
-            print(f"  ✓ Normalized {len(renamed)} column names")
+        return renamed
     
     def infer_types(self):
         """Infer and convert data types"""
-        for col in self.df.columns:
-            # Try to convert to numeric
-            if self.df[col].dtype == 'object':
-                try:
-                    # Try converting to numeric
-                    converted = pd.to_numeric(self.df[col], errors='coerce')
-                    
-                    # If most values converted successfully, use it
-                    if converted.notna().sum() / len(converted) > 0.8:
-                        original_type = str(self.df[col].dtype)
-                        self.df[col] = converted
-                        self.report.types_converted[col] = f"{original_type} → numeric"
-                
-                except:
-                    pass
-                
-                # Try parsing dates
-                if self.config.parse_dates:
-                    try:
-                        converted = pd.to_datetime(self.df[col], errors='coerce')
-                        
-                        if converted.notna().sum() / len(converted) > 0.8:
-                            original_type = str(self.df[col].dtype)
-                            self.df[col] = converted
-                            self.report.types_converted[col] = f"{original_type} → datetime"
-                    except:
-                        pass
+        dtype_kind = {col: dtype.kind for col, dtype in self.df.dtypes.items()}
+        obj_cols = [col for col, kind in dtype_kind.items() if kind == 'O']
+        
+        if not obj_cols or len(self.df) == 0:
+            return
+        
+        obj = self.df[obj_cols]
+        
+        # Gate on a bounded sample first; only candidate columns get a full conversion
+        sample = obj if len(obj) <= INFERENCE_SAMPLE_SIZE else obj.sample(INFERENCE_SAMPLE_SIZE, random_state=0)
+        sample_ok = sample.apply(_to_numeric_or_nan).notna().mean() > 0.8
+        candidates = sample_ok[sample_ok].index.tolist()
+        
+        # Try converting candidate columns to numeric (concurrently on large frames)
+        numeric_try = _map_columns(_to_numeric_or_nan, obj, candidates)
+        
+        # If most values converted successfully, use it
+        numeric_cols = [col for col, converted in numeric_try.items() if converted.notna().mean() > 0.8]
+        
+        if numeric_cols:
+            converted = {col: numeric_try[col] for col in numeric_cols}
+            if self.config.downcast:
+                converted = {
+                    col: _downcast_numeric(values, floats=self.config.downcast_floats)
+                    for col, values in converted.items()
+                }
+            
+            self.df[numeric_cols] = pd.DataFrame(
+                {col: converted[col].array for col in numeric_cols},
+                index=self.df.index
+            )
+            for col in numeric_cols:
+                self.report.types_converted[col] = f"{obj[col].dtype} → {converted[col].dtype}"
+        
+        # Try parsing dates, only for remaining columns whose values look like dates
+        if self.config.parse_dates:
+            converted_cols = set(numeric_cols)
+            date_cols = [
+                col for col in obj_cols
+                if col not in converted_cols and _looks_like_dates(obj[col])
+            ]
+            
+            if sample is not obj and date_cols:
+                sample_dates = _map_columns(_to_datetime_or_none, sample, date_cols)
+                date_cols = [
+                    col for col in date_cols
+                    if sample_dates[col] is not None and sample_dates[col].notna().mean() > 0.8
+                ]
+            
+            for col, converted in _map_columns(_to_datetime_or_none, obj, date_cols).items():
+                if converted is not None and converted.notna().mean() > 0.8:
+                    self.df[col] = converted
+                    self.report.types_converted[col] = f"{obj[col].dtype} → datetime"
         
         if self.report.types_converted:
             print(f"  ✓ Converted {len(self.report.types_converted)} column types")
@@ -249,24 +712,64 @@ class DataCleaner:
     def detect_outliers(self):
         """Detect outliers in numeric columns"""
         outlier_count = 0
+        num = self.df.select_dtypes(include=[np.number])
+        num = num[[c for c in num.columns if not str(c).startswith(self.OUTLIER_BITS)]]
         
-        for col in self.df.select_dtypes(include=[np.number]).columns:
-            if self.config.outlier_method == 'iqr':
-                Q1 = self.df[col].quantile(0.25)
-                Q3 = self.df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = ((self.df[col] < lower_bound) | (self.df[col] > upper_bound))
-                outlier_count += outliers.sum()
-                
-                # Mark outliers (add a flag column)
-                if outliers.sum() > 0:
-                    self.df[f'{col}_outlier'] = outliers
+        if self.config.outlier_method == 'iqr' and not num.empty:
+            # Both quartiles for every column in one call
+            q = num.quantile([0.25, 0.75])
+            IQR = q.loc[0.75] - q.loc[0.25]
+            
+            lower_bound = q.loc[0.25] - 1.5 * IQR
+            upper_bound = q.loc[0.75] + 1.5 * IQR
+            
+            if NUMBA_AVAILABLE:
+                # Column-major so each thread scans contiguous memory
+                arr = np.asfortranarray(num.to_numpy(dtype=np.float64, na_value=np.nan))
+                out = np.empty(arr.shape, dtype=np.bool_, order='F')
+                _iqr_mask(arr, lower_bound.to_numpy(dtype=np.float64), upper_bound.to_numpy(dtype=np.float64), out)
+                outliers = pd.DataFrame(out, index=num.index, columns=num.columns)
+            else:
+                # Nullable columns compare to NA at missing values; those are not outliers
+                outliers = (num.lt(lower_bound) | num.gt(upper_bound)).fillna(False)
+            per_column = outliers.sum()
+            outlier_count = int(per_column.sum())
+            
+            # Mark outliers (pack the flags into uint64 words instead of one bool column each)
+            flagged = per_column[per_column > 0].index
+            if len(flagged) > 0:
+                self.outlier_columns = list(flagged)
+                flags = outliers[flagged].to_numpy(dtype=np.uint64)
+                words = {}
+                for start in range(0, flags.shape[1], 64):
+                    block = flags[:, start:start + 64]
+                    shifts = np.arange(block.shape[1], dtype=np.uint64)
+                    words[self._outlier_word(start // 64)] = np.bitwise_or.reduce(block << shifts, axis=1)
+                self.df = self.df.assign(**words)
         
         self.report.outliers_detected = outlier_count
         
         if outlier_count > 0:
             print(f"  ✓ Detected {outlier_count} outliers")
+    
+    def is_outlier(self, col: str) -> pd.Series:
+        """
+        Outlier flags for one column, unpacked from the outlier bitmask
+        
+        Args:
+            col: Numeric column name
+            
+        Returns:
+            Boolean Series aligned with the cleaned DataFrame
+        """
+        if col not in self.outlier_columns:
+            return pd.Series(False, index=self.df.index)
+        
+        word, bit = divmod(self.outlier_columns.index(col), 64)
+        bits = self.df[self._outlier_word(word)].to_numpy(dtype=np.uint64)
+        return pd.Series((bits >> np.uint64(bit)) & np.uint64(1) != 0, index=self.df.index)
+    
+    @classmethod
+    def _outlier_word(cls, word: int) -> str:
+        """Column holding bits [64 * word, 64 * word + 64) of the outlier mask"""
+        return cls.OUTLIER_BITS if word == 0 else f"{cls.OUTLIER_BITS}_{word}"
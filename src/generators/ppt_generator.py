@@ -12,7 +12,9 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
+from pptx.dml.color import RGBColor
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, Any, List
 from pathlib import Path
 
@@ -51,6 +53,12 @@ class StyleConfig:
 class PPTGenerator:
     """PowerPoint generator"""
     
+    CHART_TYPES = {
+        'bar': XL_CHART_TYPE.COLUMN_CLUSTERED,
+        'line': XL_CHART_TYPE.LINE,
+        'pie': XL_CHART_TYPE.PIE
+    }
+    
     def __init__(self, style: str = 'conservative'):
         """
         Initialize generator
@@ -70,6 +78,12 @@ class PPTGenerator:
         }
         self.style = style_map.get(style, StyleConfig.CONSERVATIVE)
         
+        # Resolved once and reused by every slide
+        self._blank_layout = self.prs.slide_layouts[6]
+        self._bg_rgb = self._rgb_tuple_to_color(self.style['background'])
+        self._primary_rgb = self._rgb_tuple_to_color(self.style['primary_color'])
+        self._font_rgb = self._rgb_tuple_to_color(self.style['font_color'])
+        
     def add_title_slide(self, title: str, subtitle: str = None):
         """
         Add title slide
@@ -78,15 +92,7 @@ class PPTGenerator:
             title: Main title
             subtitle: Subtitle
         """
-        # Use blank layout
-        blank_layout = self.prs.slide_layouts[6]
-        slide = self.prs.slides.add_slide(blank_layout)
-        
-        # Add background color
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._rgb_tuple_to_color(self.style['background'])
+        slide = self._new_slide()
         
         # Add title
         left = Inches(1)
@@ -103,7 +109,7 @@ class PPTGenerator:
         p.alignment = PP_ALIGN.CENTER
         p.font.size = Pt(44)
         p.font.bold = True
-        p.font.color.rgb = self._rgb_tuple_to_color(self.style['primary_color'])
+        p.font.color.rgb = self._primary_rgb
         
         # Add subtitle
         if subtitle:
@@ -115,7 +121,7 @@ class PPTGenerator:
             sub_p = sub_frame.paragraphs[0]
             sub_p.alignment = PP_ALIGN.CENTER
             sub_p.font.size = Pt(24)
-            sub_p.font.color.rgb = self._rgb_tuple_to_color(self.style['font_color'])
+            sub_p.font.color.rgb = self._font_rgb
         
         return slide
     
@@ -127,23 +133,7 @@ class PPTGenerator:
             title: Title
             df: pandas DataFrame
         """
-        blank_layout = self.prs.slide_layouts[6]
-        slide = self.prs.slides.add_slide(blank_layout)
-        
-        # Background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._rgb_tuple_to_color(self.style['background'])
-        
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        p = title_frame.paragraphs[0]
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = self._rgb_tuple_to_color(self.style['primary_color'])
+        slide = self._new_slide(title)
         
         # Table
         rows, cols = min(df.shape[0] + 1, 10), min(df.shape[1], 6)  # Limit size
@@ -159,18 +149,17 @@ class PPTGenerator:
             cell = table.cell(0, col_idx)
             cell.text = str(col_name)
             cell.fill.solid()
-            cell.fill.fore_color.rgb = self._rgb_tuple_to_color(self.style['primary_color'])
-            cell.text_frame.paragraphs[0].font.color.rgb = self._rgb_tuple_to_color(
-                self.style['background']
-            )
+            cell.fill.fore_color.rgb = self._primary_rgb
+            cell.text_frame.paragraphs[0].font.color.rgb = self._bg_rgb
             cell.text_frame.paragraphs[0].font.bold = True
         
-        # Fill data
-        for row_idx in range(min(rows - 1, df.shape[0])):
-            for col_idx in range(cols):
-                cell = table.cell(row_idx + 1, col_idx)
-                value = df.iloc[row_idx, col_idx]
-                cell.text = str(value) if pd.notna(value) else ""
+        # Fill data (extract the visible block once instead of per-cell .iloc)
+        values = df.iloc[:rows - 1, :cols].to_numpy(dtype=object)
+        missing = pd.isna(values)
+        
+        for row, row_values, row_missing in zip(list(table.rows)[1:], values, missing):
+            for cell, value, is_missing in zip(row.cells, row_values, row_missing):
+                cell.text = "" if is_missing else str(value)
                 cell.text_frame.paragraphs[0].font.size = Pt(12)
         
         return slide
@@ -184,44 +173,74 @@ class PPTGenerator:
             data: Chart data {'categories': [...], 'series': {'Series1': [...], ...}}
             chart_type: Chart type ('bar', 'line', 'pie')
         """
-        blank_layout = self.prs.slide_layouts[6]
-        slide = self.prs.slides.add_slide(blank_layout)
+        return self.add_chart_slide_raw(title, self.build_chart_data(data), chart_type)
+    
+    def add_chart_slide_raw(self, title: str, chart_data: CategoryChartData, chart_type: str = 'bar'):
+        """
+        Add chart slide from prebuilt chart data (reusable across generators)
         
-        # Background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._rgb_tuple_to_color(self.style['background'])
+        Args:
+            title: Title
+            chart_data: Chart data from build_chart_data
+            chart_type: Chart type ('bar', 'line', 'pie')
+        """
+        slide = self._new_slide(title)
         
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.6))
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        p = title_frame.paragraphs[0]
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = self._rgb_tuple_to_color(self.style['primary_color'])
+        # Add chart
+        x, y, cx, cy = Inches(1), Inches(2), Inches(8), Inches(5)
+        
+        chart = slide.shapes.add_chart(
+            self.CHART_TYPES.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED),
+            x, y, cx, cy, chart_data
+        ).chart
         
-        # Chart data
+        return slide
+    
+    @staticmethod
+    def build_chart_data(data: Dict[str, List]) -> CategoryChartData:
+        """
+        Build chart data once so it can be rendered into several presentations
+        
+        Args:
+            data: Chart data {'categories': [...], 'series': {'Series1': [...], ...}}
+            
+        Returns:
+            CategoryChartData for add_chart_slide_raw
+        """
         chart_data = CategoryChartData()
         chart_data.categories = data.get('categories', [])
         
         for series_name, values in data.get('series', {}).items():
             chart_data.add_series(series_name, values)
         
-        # Add chart
-        x, y, cx, cy = Inches(1), Inches(2), Inches(8), Inches(5)
+        return chart_data
+    
+    def _new_slide(self, title: str = None):
+        """
+        Add a blank slide with the style background and, optionally, a standard title
         
-        chart_type_map = {
-            'bar': XL_CHART_TYPE.COLUMN_CLUSTERED,
-            'line': XL_CHART_TYPE.LINE,
-            'pie': XL_CHART_TYPE.PIE
-        }
+        Args:
+            title: Title text placed at the top of the slide
+            
+        Returns:
+            The new slide
+        """
+        slide = self.prs.slides.add_slide(self._blank_layout)
         
-        chart = slide.shapes.add_chart(
-            chart_type_map.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED),
-            x, y, cx, cy, chart_data
-        ).chart
+        # Background
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = self._bg_rgb
+        
+        # Title
+        if title is not None:
+            title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.6))
+            title_frame = title_box.text_frame
+            title_frame.text = title
+            p = title_frame.paragraphs[0]
+            p.font.size = Pt(32)
+            p.font.bold = True
+            p.font.color.rgb = self._primary_rgb
         
         return slide
     
@@ -237,14 +256,29 @@ class PPTGenerator:
         self.prs.save(str(output_file))
         print(f"✅ PPT saved: {output_path}")
     
-    def _rgb_tuple_to_color(self, rgb_tuple):
-        """Convert RGB tuple to RGBColor"""
-        from pptx.dml.color import RGBColor
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _rgb_tuple_to_color(rgb_tuple):
+        """Convert RGB tuple to RGBColor (cached; styles only use a handful of colors)"""
         return RGBColor(*rgb_tuple)
 
 
 def main():
     """Test function"""
+    # Sample data is shared by all three styles, so build it once
+    sample_df = pd.DataFrame({
+        'Metric': ['Return Rate', 'Volatility', 'Sharpe Ratio'],
+        'Q3': [8.5, 12.3, 0.69],
+        'Q4': [12.8, 15.1, 0.85]
+    })
+    chart_data = PPTGenerator.build_chart_data({
+        'categories': ['Jan', 'Feb', 'Mar'],
+        'series': {
+            'Return Rate': [5.2, 7.8, 12.8],
+            'Benchmark': [4.1, 6.5, 9.2]
+        }
+    })
+    
     # Generate three style examples
     for style_name in ['conservative', 'visual', 'detailed']:
         gen = PPTGenerator(style=style_name)
@@ -256,22 +290,10 @@ def main():
         )
         
         # Add data slide
-        sample_df = pd.DataFrame({
-            'Metric': ['Return Rate', 'Volatility', 'Sharpe Ratio'],
-            'Q3': [8.5, 12.3, 0.69],
-            'Q4': [12.8, 15.1, 0.85]
-        })
         gen.add_data_slide("Key Metrics Comparison", sample_df)
         
         # Add chart slide
-        chart_data = {
-            'categories': ['Jan', 'Feb', 'Mar'],
-            'series': {
-                'Return Rate': [5.2, 7.8, 12.8],
-                'Benchmark': [4.1, 6.5, 9.2]
-            }
-        }
-        gen.add_chart_slide("Monthly Return Trend", chart_data, chart_type='line')
+        gen.add_chart_slide_raw("Monthly Return Trend", chart_data, chart_type='line')
         
         # Save
         gen.save(f'data/output/demo_{style_name}.pptx')
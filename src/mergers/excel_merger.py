@@ -6,9 +6,28 @@ Merge multiple document sources (Excel, CSV, Word, PDF) into a single Excel file
 
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+import importlib.util
+import io
+import os
 import sys
+import zipfile
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+# Only probed here; pandas imports xlsxwriter itself when it opens the writer
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
+try:
+    from pyexcelerate import Workbook as PyExcelerateWorkbook
+    from pyexcelerate import Panes
+    PYEXCELERATE_AVAILABLE = True
+except ImportError:
+    PYEXCELERATE_AVAILABLE = False
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,23 +35,128 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from parsers.parser_factory import ParserFactory
 from cleaners.data_cleaner import DataCleaner, CleaningConfig
 
+# Upper bound on files parsed at once by add_files
+MAX_PARSE_WORKERS = 8
+
+# Parsed files remembered across mergers (same file merged with several templates)
+PARSE_CACHE_SIZE = 64
+
+# Workbook writer: 'auto' streams with xlsxwriter when installed, 'openpyxl' forces
+# openpyxl's write-only mode (both style rows as they are written), 'pyexcelerate'
+# writes whole sheets at once and styles them by range
+XLSX_BACKEND = os.getenv('HOPPER_XLSX_BACKEND', 'auto').lower()
+
+# HOPPER_FAST_COMPRESS=1 deflates workbooks at zlib level 1 instead of the default 6:
+# several times faster to write, somewhat larger files (for throwaway/test output)
+FAST_COMPRESS = os.getenv('HOPPER_FAST_COMPRESS') == '1'
+FAST_COMPRESS_LEVEL = 1
+
+
+def _use_fast_compression():
+    """Make the openpyxl and xlsxwriter writers open their zip archives at FAST_COMPRESS_LEVEL"""
+    fast_zip = partial(zipfile.ZipFile, compresslevel=FAST_COMPRESS_LEVEL)
+    
+    # Neither writer exposes a level, so swap the ZipFile name each module saves with
+    import openpyxl.writer.excel
+    openpyxl.writer.excel.ZipFile = fast_zip
+    if XLSXWRITER_AVAILABLE:
+        import xlsxwriter.workbook
+        xlsxwriter.workbook.ZipFile = fast_zip
+
+
+if FAST_COMPRESS:
+    _use_fast_compression()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a file for merging, memoized per (path, mtime, size)
+    
+    The result (and its tables) is shared by every merger that adds the file;
+    merging and cleaning only read it. Failures are not cached.
+    
+    Args:
+        path: Resolved file path
+        mtime_ns: Modification time (cache key only)
+        size: File size (cache key only)
+        
+    Returns:
+        Parse result with tables and metadata
+    """
+    parser = ParserFactory.create_parser(path)
+    # Only tables and metadata are merged
+    return parser.parse(include_text=False, include_metrics=False)
+
+
+def _write_file(path: Path, data: memoryview) -> int:
+    """
+    Write a finished workbook to disk with one open and back-to-back write calls
+    
+    Args:
+        path: Output file path (created or truncated)
+        data: Workbook bytes
+        
+    Returns:
+        Number of bytes written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        remaining = data
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+    return len(data)
+
+
+def _unique_sheet_name(name: str, used: set) -> str:
+    """
+    Excel-safe sheet name not yet taken in the workbook
+    
+    Truncates to Excel's 31-character limit and appends _2, _3, ... on a
+    collision (Excel compares sheet names case-insensitively).
+    
+    Args:
+        name: Wanted sheet name
+        used: Lowercased names already in the workbook (the result is added)
+        
+    Returns:
+        Unique sheet name
+    """
+    base = candidate = name[:31]
+    n = 2
+    while candidate.lower() in used:
+        suffix = f"_{n}"
+        candidate = base[:31 - len(suffix)] + suffix
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _clean_one(df: pd.DataFrame, config: CleaningConfig) -> pd.DataFrame:
+    """Clean one table (runs in a worker process, so takes only picklable args)"""
+    return DataCleaner(df, config).clean()
+
 
 class ExcelMerger:
     """Merge multiple document files into one Excel workbook"""
     
-    def __init__(self, auto_clean: bool = False, cleaning_config: Optional[CleaningConfig] = None):
+    def __init__(self, auto_clean: bool = False, cleaning_config: Optional[CleaningConfig] = None,
+                 template_engine=None):
         """
         Initialize the merger
         
         Args:
             auto_clean: Automatically clean data before merging
             cleaning_config: Configuration for data cleaning
+            template_engine: Optional TemplateEngine styling every data sheet
         """
         self.sources = []  # List of parsed data from each file
         self.file_paths = []  # Original file paths
         self.auto_clean = auto_clean
         self.cleaning_config = cleaning_config or CleaningConfig()
-
+        self.template_engine = template_engine
         
     def add_file(self, file_path: str) -> bool:
         """
@@ -44,42 +168,83 @@ class ExcelMerger:
         Returns:
             True if successfully added, False otherwise
         """
-        try:
-            print(f"  📄 Processing: {Path(file_path).name}")
-            
-            # Create parser and parse file
-            parser = ParserFactory.create_parser(file_path)
-            data = parser.parse()
-            
-            # Store parsed data
-            self.sources.append(data)
-            self.file_paths.append(file_path)
-            
-            # Show quick stats
-            tables = data['content'].get('tables', [])
-            print(f"     ✓ Extracted {len(tables)} table(s)")
-            
-            return True
-            
-        except Exception as e:
-            print(f"     ✗ Error: {e}")
-            return False
+        return self._store(file_path, *self._parse_one(file_path))
     
     def add_files(self, file_paths: List[str]) -> int:
         """
         Add multiple files at once
         
+        Files are parsed concurrently (parsing is mostly disk I/O and zip
+        decompression, which release the GIL) and then added in input order,
+        so sheet order stays deterministic.
+        
         Args:
             file_paths: List of file paths
             
         Returns:
             Number of successfully added files
         """
-        success_count = 0
-        for file_path in file_paths:
-            if self.add_file(file_path):
-                success_count += 1
-        return success_count
+        if len(file_paths) <= 1:
+            return sum(self.add_file(file_path) for file_path in file_paths)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(file_paths))) as executor:
+            results = list(executor.map(self._parse_one, file_paths))
+        
+        return sum(self._store(file_path, data, error) for file_path, (data, error) in zip(file_paths, results))
+    
+    def add_frame(self, df: pd.DataFrame, source_name: str, file_format: str = 'dataframe') -> bool:
+        """
+        Add an already-loaded table to the merge queue, skipping file parsing
+        
+        Lets one parsed frame feed several mergers (e.g. one per template).
+        
+        Args:
+            df: Table to merge
+            source_name: Name used for the sheet and the summary row
+            file_format: Format label shown in the summary
+            
+        Returns:
+            True (the frame is queued as is)
+        """
+        data = {
+            'metadata': {
+                'file_name': source_name,
+                'file_format': file_format,
+                'file_size_mb': None  # Not read from disk
+            },
+            'content': {'tables': [df]},
+            'metrics': {}
+        }
+        return self._store(source_name, data, None)
+    
+    @staticmethod
+    def _parse_one(file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        """Parse one file (or reuse an earlier parse of it); returns (data, None) on success or (None, error)"""
+        try:
+            # Keyed on the current stat, so an edited file is parsed again
+            path = Path(file_path).resolve()
+            st = path.stat()
+            return _parse_cached(str(path), st.st_mtime_ns, st.st_size), None
+        except Exception as e:
+            return None, e
+    
+    def _store(self, file_path: str, data: Optional[Dict[str, Any]], error: Optional[Exception]) -> bool:
+        """Queue a parsed file and report the outcome"""
+        print(f"  📄 Processing: {Path(file_path).name}")
+        
+        if error is not None:
+            print(f"     ✗ Error: {error}")
+            return False
+        
+        # Store parsed data
+        self.sources.append(data)
+        self.file_paths.append(file_path)
+        
+        # Show quick stats
+        tables = data['content'].get('tables', [])
+        print(f"     ✓ Extracted {len(tables)} table(s)")
+        
+        return True
     
     def merge_to_excel(self, output_path: str) -> bool:
         """
@@ -101,54 +266,18 @@ class ExcelMerger:
             
             print(f"\n📝 Merging {len(self.sources)} file(s) into Excel...")
             
-            # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                sheet_count = 0
-                
-                # Process each source file
-                for idx, (data, file_path) in enumerate(zip(self.sources, self.file_paths), 1):
-                    file_name = Path(file_path).stem  # Filename without extension
-                    file_format = data['metadata']['file_format']
-                    tables = data['content'].get('tables', [])
-                    
-                    print(f"  {idx}. {file_name} ({file_format}): {len(tables)} table(s)")
-                    
-                    # Write each table as a separate sheet
-                    for table_idx, df in enumerate(tables):
-                        # Clean data if enabled
-                        if self.auto_clean:
-                            print(f"     🧹 Cleaning table {table_idx + 1}...")
-                            cleaner = DataCleaner(df, self.cleaning_config)
-                            df = cleaner.clean()
-                        
-                        # Generate sheet name
-                        if len(tables) == 1:
-                            sheet_name = f"{file_name}"
-                        else:
-                            sheet_name = f"{file_name}_T{table_idx + 1}"
-                        
-                        # Excel sheet names must be <= 31 characters
-                        sheet_name = sheet_name[:31]
-                        
-                        # Write to Excel
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        sheet_count += 1
-                        
-                        # Apply template if available
-                        if self.template_engine:
-                            worksheet = writer.sheets[sheet_name]
-                            self.template_engine.apply_to_worksheet(worksheet, has_header=True)
-                        
-                        print(f"     → Sheet: '{sheet_name}' ({df.shape[0]} rows × {df.shape[1]} cols)")
-                
-                # Create summary sheet
-                self._create_summary_sheet(writer, sheet_count)
+            # Build the workbook in memory, so the zip writer's many small writes and
+            # seeks never hit the file and a failed merge leaves no partial output
+            buffer = io.BytesIO()
+            if PYEXCELERATE_AVAILABLE and XLSX_BACKEND == 'pyexcelerate':
+                sheet_count = self._save_pyexcelerate(buffer)
+            else:
+                sheet_count = self._save_pandas(buffer)
             
-            # Get output file size
-            file_size = output_file.stat().st_size
+            file_size = _write_file(output_file, buffer.getbuffer())
             file_size_kb = round(file_size / 1024, 2)
             
-            print(f"\n✅ Merge complete!")
+            print("\n✅ Merge complete!")
             print(f"   📁 Output: {output_path}")
             print(f"   📊 Sheets: {sheet_count} data + 1 summary = {sheet_count + 1} total")
             print(f"   💾 Size: {file_size_kb} KB")
@@ -161,65 +290,378 @@ class ExcelMerger:
             traceback.print_exc()
             return False
     
-    def _create_summary_sheet(self, writer: pd.ExcelWriter, total_sheets: int):
+    @staticmethod
+    def merge_to_multisheet_excel(sheets: Dict[str, Tuple[pd.DataFrame, Any]], output_path: str) -> bool:
         """
-        Create a summary sheet with metadata about all merged files
+        Write tables styled with different templates as the sheets of one workbook
+        
+        One workbook (one zip, one styles part) instead of a file per template;
+        each template's formats or named styles are built once for the workbook.
         
         Args:
-            writer: Excel writer object
-            total_sheets: Total number of data sheets created
+            sheets: {sheet name: (table, TemplateEngine or None)}, in sheet order
+            output_path: Path for the output Excel file
+            
+        Returns:
+            True if successful, False otherwise
         """
-        summary_data = []
+        if not sheets:
+            print("❌ Error: No sheets to write")
+            return False
+        
+        try:
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            print(f"\n📝 Writing {len(sheets)} sheet(s) into one workbook...")
+            
+            buffer = io.BytesIO()
+            with ExcelMerger._open_writer(buffer) as writer:
+                # xlsxwriter formats per distinct template
+                formats_by_template = {}
+                used_names = set()
+                
+                for sheet_name, (df, template) in sheets.items():
+                    formats = None
+                    if template is not None and writer.engine == 'xlsxwriter':
+                        if id(template) not in formats_by_template:
+                            formats_by_template[id(template)] = template.xlsxwriter_formats(writer.book)
+                        formats = formats_by_template[id(template)]
+                    
+                    sheet_name = _unique_sheet_name(sheet_name, used_names)
+                    ExcelMerger._write_sheet(writer, df, sheet_name, formats, template)
+                    print(f"     → Sheet: '{sheet_name}' ({df.shape[0]} rows × {df.shape[1]} cols)")
+            
+            file_size_kb = round(_write_file(output_file, buffer.getbuffer()) / 1024, 2)
+            
+            print("\n✅ Workbook complete!")
+            print(f"   📁 Output: {output_path}")
+            print(f"   📊 Sheets: {len(sheets)}")
+            print(f"   💾 Size: {file_size_kb} KB")
+            
+            return True
+            
+        except Exception as e:
+            print(f"\n❌ Write failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def _iter_sheets(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Yield (sheet name, table) for every data sheet in merge order"""
+        tables_in_order = self._iter_tables()
         
-        for data, file_path in zip(self.sources, self.file_paths):
-            metadata = data['metadata']
-            metrics = data['metrics']
+        # The summary sheet keeps its name; sources that clash with it (or each other) get a suffix
+        used_names = {'summary'}
+        
+        # Process each source file
+        for idx, (data, file_path) in enumerate(zip(self.sources, self.file_paths), 1):
+            file_name = Path(file_path).stem  # Filename without extension
+            file_format = data['metadata']['file_format']
             tables = data['content'].get('tables', [])
             
-            # Calculate total rows
-            total_rows = sum(len(df) for df in tables)
+            print(f"  {idx}. {file_name} ({file_format}): {len(tables)} table(s)")
             
-            summary_data.append({
-                'Source File': metadata['file_name'],
-                'Format': metadata['file_format'].upper(),
-                'Tables': len(tables),
-                'Total Rows': total_rows,
-                'File Size (MB)': metadata['file_size_mb'],
-                'Status': '✓ Merged'
-            })
-        
-        # Add merge metadata
-        summary_data.append({
-            'Source File': '--- MERGE INFO ---',
-            'Format': '',
-            'Tables': '',
-            'Total Rows': '',
-            'File Size (MB)': '',
-            'Status': ''
-        })
+            # Write each table as a separate sheet
+            for table_idx in range(len(tables)):
+                # Cleaned ahead of time if enabled
+                df = next(tables_in_order)
+                
+                # Generate sheet name
+                if len(tables) == 1:
+                    sheet_name = f"{file_name}"
+                else:
+                    sheet_name = f"{file_name}_T{table_idx + 1}"
+                
+                # Excel sheet names must be unique and <= 31 characters
+                sheet_name = _unique_sheet_name(sheet_name, used_names)
+                
+                yield sheet_name, df
+                
+                print(f"     → Sheet: '{sheet_name}' ({df.shape[0]} rows × {df.shape[1]} cols)")
+    
+    def _save_pandas(self, target: io.BytesIO) -> int:
+        """
+        Write the workbook through a pandas ExcelWriter (xlsxwriter or openpyxl)
         
-        summary_data.append({
-            'Source File': 'Total Files Merged',
-            'Format': len(self.sources),
-            'Tables': total_sheets,
-            'Total Rows': sum(row['Total Rows'] for row in summary_data[:-2]),
-            'File Size (MB)': '',
-            'Status': ''
-        })
+        Args:
+            target: Buffer receiving the .xlsx bytes
+            
+        Returns:
+            Number of data sheets written
+        """
+        with self._open_writer(target) as writer:
+            sheet_count = 0
+            
+            # Template styles built once per workbook and shared by every sheet
+            formats = None
+            if self.template_engine and writer.engine == 'xlsxwriter':
+                formats = self.template_engine.xlsxwriter_formats(writer.book)
+            
+            for sheet_name, df in self._iter_sheets():
+                # Write to Excel (styled with the template, if any)
+                self._write_sheet(writer, df, sheet_name, formats, self.template_engine)
+                sheet_count += 1
+            
+            # Create summary sheet
+            self._write_sheet(writer, self._summary_frame(sheet_count), 'Summary')
+            print("     → Sheet: 'Summary' (metadata)")
         
-        summary_data.append({
-            'Source File': 'Merge Timestamp',
-            'Format': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'Tables': '',
-            'Total Rows': '',
-            'File Size (MB)': '',
-            'Status': ''
-        })
+        return sheet_count
+    
+    @staticmethod
+    def _open_writer(target: io.BytesIO) -> pd.ExcelWriter:
+        """Create the Excel writer (stream rows with xlsxwriter; templates become xlsxwriter formats)"""
+        if XLSXWRITER_AVAILABLE and XLSX_BACKEND != 'openpyxl':
+            return pd.ExcelWriter(
+                target,
+                engine='xlsxwriter',
+                engine_kwargs={'options': {
+                    'constant_memory': True,
+                    'strings_to_urls': False,
+                    'nan_inf_to_errors': True,
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+                }}
+            )
+        
+        # Write-only workbooks stream rows instead of holding a cell grid
+        return pd.ExcelWriter(target, engine='openpyxl', engine_kwargs={'write_only': True})
+    
+    def _save_pyexcelerate(self, target: io.BytesIO) -> int:
+        """
+        Write the workbook with PyExcelerate
+        
+        Each sheet's values go in as one 2-D block and the template is applied
+        per range (one style record for the header row, one per data row)
+        instead of per cell.
+        
+        Args:
+            target: Buffer receiving the .xlsx bytes
+            
+        Returns:
+            Number of data sheets written
+        """
+        wb = PyExcelerateWorkbook()
+        styles = self.template_engine.pyexcelerate_styles() if self.template_engine else None
+        
+        sheet_count = 0
+        for sheet_name, df in self._iter_sheets():
+            self._write_pyexcelerate_sheet(wb, df, sheet_name, styles, self.template_engine)
+            sheet_count += 1
+        
+        self._write_pyexcelerate_sheet(wb, self._summary_frame(sheet_count), 'Summary')
+        print("     → Sheet: 'Summary' (metadata)")
+        
+        wb.save(target)
+        return sheet_count
+    
+    @staticmethod
+    def _write_pyexcelerate_sheet(wb, df: pd.DataFrame, sheet_name: str,
+                                  styles: Optional[Dict[str, Any]] = None, template=None):
+        """
+        Add a table to a PyExcelerate workbook
+        
+        Args:
+            wb: PyExcelerate Workbook
+            df: Table to write
+            sheet_name: Sheet name
+            styles: TemplateEngine.pyexcelerate_styles (unstyled apart from a bold header if None)
+            template: TemplateEngine whose layout options go with styles
+        """
+        n_rows, n_cols = df.shape
+        values = df.astype(object).where(df.notna(), None)
+        # One header tuple plus one plain tuple per row (no per-row list copies)
+        rows = [tuple(str(col) for col in df.columns)]
+        rows.extend(values.itertuples(index=False, name=None))
+        ws = wb.new_sheet(sheet_name, data=rows)
+        
+        if not n_cols:
+            return
         
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        if styles is None:
+            ws.range((1, 1), (1, n_cols)).style.font.bold = True
+            return
         
-        print(f"     → Sheet: 'Summary' (metadata)")
+        ws.range((1, 1), (1, n_cols)).style = styles['header']
+        for row_idx in range(2, n_rows + 2):
+            # Alternate row colors
+            ws.range((row_idx, 1), (row_idx, n_cols)).style = styles['body_alt' if row_idx % 2 else 'body']
+        
+        config = template.config
+        if config.column_width == "auto":
+            for col_idx, (col_name, col) in enumerate(df.items(), start=1):
+                lengths = col.dropna().astype(str).str.len()
+                max_length = max(len(str(col_name)), int(lengths.max()) if len(lengths) else 0)
+                ws.set_col_style(col_idx, styles['column'](min(max_length + 2, 50)))  # Max 50 chars
+        
+        if config.freeze_panes:
+            ws.panes = Panes(0, 1)
+    
+    def _iter_tables(self) -> Iterator[pd.DataFrame]:
+        """
+        Yield every source table in merge order, cleaned first if auto_clean is on
+        
+        Cleaning runs on a process pool a few tables ahead of the consumer, so
+        cleaning table N+1 overlaps with writing table N to the workbook.
+        """
+        tables = [df for data in self.sources for df in data['content'].get('tables', [])]
+        
+        if not self.auto_clean:
+            yield from tables
+            return
+        
+        if len(tables) <= 1:
+            for df in tables:
+                yield _clean_one(df, self.cleaning_config)
+            return
+        
+        workers = max(1, (os.cpu_count() or 2) // 2)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Bounded in-flight window caps how many cleaned frames sit in memory
+            pending = deque()
+            for df in tables:
+                pending.append(executor.submit(_clean_one, df, self.cleaning_config))
+                if len(pending) > workers:
+                    yield pending.popleft().result()
+            
+            while pending:
+                yield pending.popleft().result()
+    
+    @staticmethod
+    def _write_sheet(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str,
+                     formats: Optional[Dict[str, Any]] = None, template=None):
+        """
+        Write a table to a new sheet
+        
+        With xlsxwriter the rows go straight to write_row, skipping pandas'
+        per-cell ExcelFormatter; openpyxl workbooks are write-only, so rows are
+        appended in order. Other engines (and MultiIndex headers) use to_excel.
+        
+        Args:
+            writer: Excel writer object
+            df: Table to write
+            sheet_name: Sheet name
+            formats: TemplateEngine.xlsxwriter_formats for this workbook (xlsxwriter only)
+            template: TemplateEngine styling the sheet
+        """
+        if writer.engine == 'openpyxl':
+            worksheet = writer.book.create_sheet(sheet_name)
+            if template is not None:
+                template.append_styled(worksheet, df)
+            else:
+                ExcelMerger._append_rows(worksheet, df)
+            return
+        
+        if writer.engine != 'xlsxwriter' or isinstance(df.columns, pd.MultiIndex):
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            return
+        
+        worksheet = writer.book.add_worksheet(sheet_name)
+        
+        dated = []
+        if formats is not None:
+            header_format = formats['header']
+            row_formats = (formats['body'], formats['body_alt'])
+            ExcelMerger._apply_template_layout(worksheet, df, template.config)
+            # Template formats carry no num_format; date columns get dated variants
+            dated = [
+                j for j in range(df.shape[1])
+                if pd.api.types.infer_dtype(df.iloc[:, j], skipna=True) in ('datetime64', 'datetime', 'date')
+            ]
+        else:
+            header_format = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            row_formats = (None, None)
+        
+        worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+        
+        # Native Python values per column, missing values as None (written as blanks)
+        columns = [
+            df.iloc[:, j].astype(object).where(df.iloc[:, j].notna(), None).tolist()
+            for j in range(df.shape[1])
+        ]
+        
+        # Row order is required by constant_memory mode
+        if not dated:
+            for row_idx, row in enumerate(zip(*columns), start=1):
+                worksheet.write_row(row_idx, 0, row, row_formats[(row_idx - 1) % 2])
+            return
+        
+        cell_formats = []
+        for row_format, date_format in ((formats['body'], formats['body_date']),
+                                        (formats['body_alt'], formats['body_alt_date'])):
+            row_cell_formats = [row_format] * df.shape[1]
+            for j in dated:
+                row_cell_formats[j] = date_format
+            cell_formats.append(row_cell_formats)
+        
+        for row_idx, row in enumerate(zip(*columns), start=1):
+            for col_idx, (value, cell_format) in enumerate(zip(row, cell_formats[(row_idx - 1) % 2])):
+                worksheet.write(row_idx, col_idx, value, cell_format)
+    
+    @staticmethod
+    def _append_rows(worksheet, df: pd.DataFrame):
+        """Stream an unstyled table into a write-only openpyxl sheet (bold, boxed header like to_excel)"""
+        side = Side(style='thin')
+        header_font = Font(bold=True)
+        header_border = Border(left=side, right=side, top=side, bottom=side)
+        header_alignment = Alignment(horizontal='center')
+        
+        header = []
+        for col_name in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(col_name))
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header.append(cell)
+        worksheet.append(header)
+        
+        # Missing values as None (written as blanks)
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            worksheet.append(row)
+    
+    @staticmethod
+    def _apply_template_layout(worksheet, df: pd.DataFrame, config):
+        """Column widths, frozen header and auto-filter from a TemplateConfig (xlsxwriter sheets)"""
+        n_rows, n_cols = df.shape
+        
+        if config.column_width == "auto":
+            for col_idx, (col_name, col) in enumerate(df.items()):
+                lengths = col.dropna().astype(str).str.len()
+                max_length = max(len(str(col_name)), int(lengths.max()) if len(lengths) else 0)
+                worksheet.set_column(col_idx, col_idx, min(max_length + 2, 50))  # Max 50 chars
+        
+        if config.freeze_panes:
+            worksheet.freeze_panes(1, 0)
+        
+        if config.auto_filter and n_cols:
+            worksheet.autofilter(0, 0, n_rows, n_cols - 1)
+    
+    def _summary_frame(self, total_sheets: int) -> pd.DataFrame:
+        """
+        Build the summary sheet with metadata about all merged files
+        
+        Args:
+            total_sheets: Total number of data sheets created
+            
+        Returns:
+            One row per source file followed by the merge info rows
+        """
+        metadata = [data['metadata'] for data in self.sources]
+        table_counts = [len(data['content'].get('tables', [])) for data in self.sources]
+        total_rows = [sum(map(len, data['content'].get('tables', []))) for data in self.sources]
+        
+        # One row per source file, then the merge info rows
+        return pd.DataFrame({
+            'Source File': [meta['file_name'] for meta in metadata]
+                + ['--- MERGE INFO ---', 'Total Files Merged', 'Merge Timestamp'],
+            'Format': [meta['file_format'].upper() for meta in metadata]
+                + ['', len(self.sources), datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            'Tables': table_counts + ['', total_sheets, ''],
+            'Total Rows': total_rows + ['', sum(total_rows), ''],
+            'File Size (MB)': [meta['file_size_mb'] for meta in metadata] + ['', '', ''],
+            'Status': ['✓ Merged'] * len(metadata) + ['', '', '']
+        })
 
 
 def main():
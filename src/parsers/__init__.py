@@ -4,13 +4,26 @@ Parser Module
 Provides document parsing capabilities for multiple formats
 """
 
+import importlib
+
 from .base_parser import BaseParser
-from .excel_parser import ExcelParser
-from .csv_parser import CSVParser
-from .word_parser import WordParser
-from .pdf_parser import PDFParser
 from .parser_factory import ParserFactory
 
+# Format parsers pull in heavy libraries (openpyxl, python-docx, pdfplumber),
+# so they are imported on first attribute access
+_LAZY_PARSERS = {
+    'ExcelParser': '.excel_parser',
+    'CSVParser': '.csv_parser',
+    'WordParser': '.word_parser',
+    'PDFParser': '.pdf_parser'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PARSERS:
+        return getattr(importlib.import_module(_LAZY_PARSERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'BaseParser',
     'ExcelParser',
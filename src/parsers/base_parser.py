@@ -6,9 +6,117 @@ Defines unified interface for all document parsers
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Sequence
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cached_property, partial
+import asyncio
+import hashlib
+import os
+import pickle
+import tempfile
+
+# Parse results cached by file content (used by the slow PDF and Word parsers);
+# HOPPER_CACHE_DIR= (empty) turns the cache off
+_cache_dir = os.getenv('HOPPER_CACHE_DIR', str(Path.home() / '.hopper_cache'))
+PARSE_CACHE_DIR = Path(_cache_dir) if _cache_dir else None
+
+# Cache size cap; least recently used entries are evicted past it
+PARSE_CACHE_MAX_BYTES = int(os.getenv('HOPPER_CACHE_MAX_MB', '512')) << 20
+
+# Entries not read or written for this long are evicted
+PARSE_CACHE_MAX_AGE_SECONDS = int(os.getenv('HOPPER_CACHE_MAX_AGE_HOURS', '168')) * 3600
+
+# Bump when parse() output changes so older cache entries are ignored
+PARSER_VERSION = 1
+
+# Bytes read per step while hashing a file
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def frame_to_text(df: pd.DataFrame) -> str:
+    """
+    Plain-text rendering of a table as tab-separated lines ("" for an empty one)
+    
+    Uses pandas' C CSV writer; to_string's column alignment formats every
+    cell in Python and is many times slower on large tables.
+    """
+    return df.to_csv(sep='\t', index=False) if not df.empty else ""
+
+
+def text_metrics(text: str) -> Dict[str, int]:
+    """
+    Word, character and line counts of a text
+    
+    len() is O(1) on str, so this is one split() pass and one count() pass;
+    split() keeps Python's whitespace rules (Unicode spaces, runs of blanks).
+    """
+    return {
+        'word_count': len(text.split()),
+        'character_count': len(text),
+        'line_count': text.count('\n') + 1
+    }
+
+
+def _evict_parse_cache(cache_dir: Path):
+    """Drop expired entries, then the least recently used ones until the cache fits its cap"""
+    cutoff_ts = datetime.now().timestamp() - PARSE_CACHE_MAX_AGE_SECONDS
+    
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith('.pkl') or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted concurrently by another process
+            if stat.st_mtime < cutoff_ts:
+                Path(entry.path).unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= PARSE_CACHE_MAX_BYTES:
+            break
+        Path(path).unlink(missing_ok=True)
+        total -= size
+
+
+def _parse_path(parser_class, file_path: str) -> Dict[str, Any]:
+    """Parse one file for parse_batch (runs in a worker process); errors become {'error': ...}"""
+    try:
+        return parser_class(file_path).parse()
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+
+class LazyContent(dict):
+    """
+    Parsed content dict whose expensive entries are computed on first access
+    
+    Entries given in `lazy` (e.g. 'text', a full-table rendering) stay out of
+    the dict until they are read with [] or get(); after that they are cached
+    like any other entry. Thunks should be picklable (functions or partials).
+    """
+    
+    def __init__(self, data: Dict[str, Any], lazy: Dict[str, Callable[[], Any]]):
+        super().__init__(data)
+        self._lazy = dict(lazy)
+    
+    def __missing__(self, key):
+        if key not in self._lazy:
+            raise KeyError(key)
+        value = self[key] = self._lazy.pop(key)()
+        return value
+    
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._lazy
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
 
 
 class BaseParser(ABC):
@@ -23,14 +131,26 @@ class BaseParser(ABC):
         """
         self.file_path = Path(file_path)
         
-        if not self.file_path.exists():
+        # One stat serves both the existence check and the metadata
+        try:
+            self._stat = self.file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
     
     @abstractmethod
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, *, include_text: bool = True, include_tables: bool = True,
+              include_metrics: bool = True) -> Dict[str, Any]:
         """
         Parse document and return standardized data structure
         
+        Callers that need only part of the result can switch the rest off;
+        skipped content entries are left out and skipped metrics are empty.
+        
+        Args:
+            include_text: Include content['text']
+            include_tables: Include content['tables']
+            include_metrics: Compute 'metrics' (an empty dict otherwise)
+            
         Returns:
             {
                 'metadata': {...},     # File metadata
@@ -40,6 +160,41 @@ class BaseParser(ABC):
         """
         pass
     
+    async def parse_async(self, **options) -> Dict[str, Any]:
+        """
+        parse() on a worker thread, so an event loop keeps serving while a document parses
+        
+        Args:
+            options: parse() keyword arguments (include_text, include_tables, include_metrics)
+            
+        Returns:
+            Standardized data structure
+        """
+        return await asyncio.to_thread(self.parse, **options)
+    
+    @classmethod
+    def parse_batch(cls, paths: Sequence[str], workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse many files in one run on a process pool
+        
+        Imports and warm-up are paid once per worker instead of once per file,
+        and a failing file is reported without aborting the rest.
+        
+        Args:
+            paths: Files to parse
+            workers: Worker processes (default: CPU count)
+            
+        Returns:
+            {path: parse result, or {'error': message} if that file failed}
+        """
+        paths = [str(path) for path in paths]
+        if not paths:
+            return {}
+        
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(paths))) as executor:
+            results = executor.map(partial(_parse_path, cls), paths, chunksize=4)
+            return dict(zip(paths, results))
+    
     @abstractmethod
     def extract_text(self) -> str:
         """
@@ -65,20 +220,98 @@ class BaseParser(ABC):
         Get file metadata
         
         Returns:
-            Dictionary containing file information
+            Dictionary containing file information (a copy callers may extend)
         """
-        stat = self.file_path.stat()
+        return dict(self.metadata)
+    
+    @cached_property
+    def metadata(self) -> Dict[str, Any]:
+        """File metadata, computed once per parser from the stat taken at init"""
+        stat = self._stat
         
         return {
             'file_name': self.file_path.name,
             'file_path': str(self.file_path.absolute()),
             'file_format': self.get_format(),
+            'file_ext': self.file_path.suffix.lstrip('.').lower(),
             'file_size': stat.st_size,
             'file_size_mb': round(stat.st_size / (1024 * 1024), 2),
             'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
             'parsed_at': datetime.now().isoformat()
         }
     
+    def _cache_path(self, *variant: Any) -> Optional[Path]:
+        """
+        Parse cache file for this document's content
+        
+        Args:
+            variant: Options that change the parse result (e.g. include_* flags)
+            
+        Returns:
+            Path keyed by BLAKE2b of the file bytes, parser class and PARSER_VERSION,
+            or None when the cache is off
+        """
+        if PARSE_CACHE_DIR is None:
+            return None
+        
+        hasher = hashlib.blake2b()
+        with open(self.file_path, 'rb') as f:
+            while chunk := f.read(HASH_CHUNK_BYTES):
+                hasher.update(chunk)
+        
+        suffix = ''.join(f"_{int(v) if isinstance(v, bool) else v}" for v in variant)
+        return PARSE_CACHE_DIR / f"{hasher.hexdigest()}_{type(self).__name__}_v{PARSER_VERSION}{suffix}.pkl"
+    
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """
+        Cached parse result, or None on a miss, an unreadable entry or no cache
+        
+        The file metadata is refreshed, since identical content may live at another path.
+        """
+        if cache_path is None:
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"  ⚠️  Ignoring unreadable parse cache entry: {e}")
+            return None
+        
+        # Mark the entry recently used for eviction
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        
+        result['metadata'].update(self.get_metadata())
+        return result
+    
+    def _store_cached(self, cache_path: Optional[Path], result: Dict[str, Any]):
+        """
+        Write a parse result atomically (temp file + rename), then evict past the cache caps
+        
+        Failures only skip caching; without a cache this does nothing.
+        """
+        if cache_path is None:
+            return
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _evict_parse_cache(cache_path.parent)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"  ⚠️  Could not write parse cache: {e}")
+    
     def get_format(self) -> str:
         """
         Get file format
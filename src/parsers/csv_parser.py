@@ -5,10 +5,122 @@ Supports automatic encoding detection and standardized data output
 """
 
 import pandas as pd
-import chardet
+import codecs
+import csv
+import os
 from pathlib import Path
-from typing import Dict, Any, List
-from .base_parser import BaseParser
+from typing import Dict, Any, Iterator, List, Optional
+from .base_parser import BaseParser, LazyContent, frame_to_text
+from functools import lru_cache, partial
+
+# Fastest available chardet-compatible detector: cchardet and charset-normalizer are
+# compiled, chardet is a pure-Python fallback
+try:
+    from cchardet import detect as detect_encoding
+except ImportError:
+    try:
+        from charset_normalizer import detect as detect_encoding
+    except ImportError:
+        from chardet import detect as detect_encoding
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Bytes per block the Arrow reader tokenizes on each thread
+ARROW_BLOCK_SIZE = 8 << 20
+
+# Rows Polars scans to infer column types; files whose later rows disagree fall back to pandas
+POLARS_INFER_ROWS = 10_000
+
+# pandas' default missing-value markers (read_csv na_values), applied to the Polars reader too
+# so a column's dtype doesn't depend on which reader ran
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Bytes sampled from the start of the file for encoding detection
+ENCODING_SNIFF_BYTES = 10000
+
+# Default rows per chunk for iter_chunks / scan_metrics
+CHUNK_ROWS = 1_000_000
+
+# Detected encodings remembered across parser instances (re-runs, watch loops)
+ENCODING_CACHE_SIZE = 256
+
+# Byte order marks identify the encoding without any detection
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _arrow_string_types(arrow_type):
+    """
+    to_pandas types_mapper keeping Arrow string columns Arrow-backed
+    
+    The column then shares the Arrow buffers ("string[pyarrow]") instead of
+    allocating one Python str object per cell; other types convert as usual.
+    Only 32-bit offset strings qualify: pandas' ArrowStringArray rejects large_string.
+    """
+    if pa.types.is_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+@lru_cache(maxsize=ENCODING_CACHE_SIZE)
+def _detect_encoding_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Detect a file's encoding, memoized per (path, mtime, size) across parser instances
+    
+    Args:
+        path: Resolved file path
+        mtime_ns: Modification time (cache key only)
+        size: File size (cache key only)
+        
+    Returns:
+        Encoding name
+    """
+    # Read first 10000 bytes for detection (raw fd: no buffered file object needed)
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        raw_data = os.read(fd, ENCODING_SNIFF_BYTES)
+    finally:
+        os.close(fd)
+    
+    for bom, encoding in _BOMS:
+        if raw_data.startswith(bom):
+            print(f"  🔍 Detected encoding: {encoding} (byte order mark)")
+            return encoding
+    
+    # Valid UTF-8 (incl. plain ASCII) needs no statistical detection; the
+    # incremental decoder tolerates a character cut off at the 10000-byte mark
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+        print("  🔍 Detected encoding: utf-8")
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    result = detect_encoding(raw_data)
+    detected_encoding = result['encoding']
+    
+    print(f"  🔍 Detected encoding: {detected_encoding} (confidence: {(result['confidence'] or 0):.2%})")
+    
+    return detected_encoding or 'utf-8'
 
 
 class CSVParser(BaseParser):
@@ -32,18 +144,19 @@ class CSVParser(BaseParser):
         Returns:
             Encoding name (e.g. 'utf-8', 'gbk')
         """
-        with open(self.file_path, 'rb') as f:
-            # Read first 10000 bytes for detection
-            raw_data = f.read(10000)
-            result = chardet.detect(raw_data)
-            detected_encoding = result['encoding']
-            
-            print(f"  🔍 Detected encoding: {detected_encoding} (confidence: {result['confidence']:.2%})")
-            
-            return detected_encoding or 'utf-8'
+        # Keyed on the stat taken at init, so an edited file is sniffed again
+        return _detect_encoding_cached(
+            str(self.file_path.resolve()), self._stat.st_mtime_ns, self._stat.st_size
+        )
     
     def _load_dataframe(self) -> pd.DataFrame:
         """Load DataFrame (lazy loading)"""
+        if self._df is None:
+            self._df = self._read_polars()
+        
+        if self._df is None:
+            self._df = self._read_arrow()
+        
         if self._df is None:
             try:
                 self._df = pd.read_csv(
@@ -62,33 +175,168 @@ class CSVParser(BaseParser):
         
         return self._df
     
-    def parse(self) -> Dict[str, Any]:
+    def _read_polars(self) -> Optional[pd.DataFrame]:
+        """
+        Read with Polars' multi-threaded CSV reader
+        
+        Returns:
+            pandas DataFrame, or None when Polars is unavailable, the file is not
+            UTF-8, or Polars rejects it (the pandas reader then handles it)
+        """
+        # Conversion to pandas goes through Arrow
+        if not POLARS_AVAILABLE or not PYARROW_AVAILABLE or self.encoding != 'utf-8':
+            return None
+        
+        names = self._pandas_header()
+        if names is None:
+            return None
+        
+        try:
+            pl_df = pl.read_csv(
+                self.file_path,
+                infer_schema_length=POLARS_INFER_ROWS,
+                null_values=PANDAS_NA_VALUES,
+                new_columns=names
+            )
+            pl_df = self._cast_padded_numbers(pl_df)
+            table = pl_df.to_arrow()
+            
+            # Polars exports text as large_string; narrow it so it stays Arrow-backed in pandas
+            schema = pa.schema([
+                field.with_type(pa.string()) if pa.types.is_large_string(field.type) else field
+                for field in table.schema
+            ])
+            return table.cast(schema).to_pandas(types_mapper=_arrow_string_types)
+        except (pl.exceptions.PolarsError, pa.ArrowException, ImportError, ValueError) as e:
+            print(f"  ⚠️  Polars reader failed ({type(e).__name__}), using pandas")
+            return None
+    
+    def _pandas_header(self) -> Optional[List[str]]:
+        """
+        Column names as pd.read_csv would give them (empty header cells become 'Unnamed: i')
+        
+        Returns:
+            Column names, or None for duplicate names (pandas' a, a.1 renaming is left to pandas)
+        """
+        with open(self.file_path, encoding=self.encoding, newline='') as f:
+            header = next(csv.reader(f), [])
+        
+        names = [name if name else f"Unnamed: {i}" for i, name in enumerate(header)]
+        if len(set(names)) != len(names):
+            return None
+        return names
+    
+    @staticmethod
+    def _cast_padded_numbers(pl_df: "pl.DataFrame") -> "pl.DataFrame":
+        """
+        Cast text columns whose values are all numbers with surrounding spaces
+        
+        pd.read_csv parses ' 5' as 5 where Polars keeps the string; columns with
+        missing values become floats, as in pandas.
+        """
+        str_cols = [col for col, dtype in pl_df.schema.items() if dtype == pl.Utf8]
+        if not str_cols:
+            return pl_df
+        
+        def parses_as(col: str, dtype) -> "pl.Expr":
+            parsed = pl.col(col).str.strip_chars().cast(dtype, strict=False)
+            return (parsed.is_not_null() == pl.col(col).is_not_null()).all() & pl.col(col).is_not_null().any()
+        
+        checks = pl_df.select(
+            [parses_as(col, pl.Int64).alias(f"int_{i}") for i, col in enumerate(str_cols)]
+            + [parses_as(col, pl.Float64).alias(f"float_{i}") for i, col in enumerate(str_cols)]
+        ).row(0, named=True)
+        
+        casts = []
+        for i, col in enumerate(str_cols):
+            if checks[f"int_{i}"]:
+                casts.append(pl.col(col).str.strip_chars().cast(pl.Int64))
+            elif checks[f"float_{i}"]:
+                casts.append(pl.col(col).str.strip_chars().cast(pl.Float64))
+        
+        return pl_df.with_columns(casts) if casts else pl_df
+    
+    def _read_arrow(self) -> Optional[pd.DataFrame]:
+        """
+        Read with Arrow's multi-threaded block reader (handles any detected encoding)
+        
+        Returns:
+            pandas DataFrame, or None when pyarrow is unavailable or rejects the file
+        """
+        if not PYARROW_AVAILABLE:
+            return None
+        
+        read_options = pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, encoding=self.encoding)
+        try:
+            # Arrow infers dates, times and timestamps from the first block; the Polars
+            # and pandas readers keep those columns as text, so read them as strings
+            schema = pacsv.open_csv(self.file_path, read_options=read_options).schema
+            text_types = {
+                field.name: pa.string() for field in schema
+                if pa.types.is_temporal(field.type)
+            }
+            table = pacsv.read_csv(
+                self.file_path,
+                read_options=read_options,
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True,
+                    column_types=text_types
+                )
+            )
+        except (pa.ArrowException, UnicodeDecodeError, LookupError) as e:
+            print(f"  ⚠️  Arrow reader failed ({type(e).__name__}), using pandas")
+            return None
+        
+        # pandas renames duplicate headers (a, a.1); leave those files to pandas
+        if len(set(table.column_names)) != table.num_columns:
+            return None
+        
+        # Release Arrow buffers column by column while converting
+        return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=_arrow_string_types)
+    
+    def parse(self, *, include_text: bool = True, include_tables: bool = True,
+              include_metrics: bool = True) -> Dict[str, Any]:
         """
         Parse CSV file
         
+        Args:
+            include_text: Include content['text']
+            include_tables: Include content['tables']
+            include_metrics: Compute 'metrics' (an empty dict otherwise)
+            
         Returns:
             Standardized data structure
         """
         df = self._load_dataframe()
         
-        return {
-            'metadata': self.get_metadata(),
-            'content': {
-                'text': df.to_string(index=False),
-                'tables': [df],
-                'structure': {
-                    'columns': df.columns.tolist(),
-                    'rows': len(df),
-                    'encoding': self.encoding
-                }
-            },
-            'metrics': {
+        content = {
+            'structure': {
+                'columns': df.columns.tolist(),
+                'rows': len(df),
+                'encoding': self.encoding
+            }
+        }
+        if include_tables:
+            content['tables'] = [df]
+        
+        metrics = {}
+        if include_metrics:
+            # Count column kinds straight from the dtypes (select_dtypes builds a sub-frame per call);
+            # object and Arrow string columns both report kind 'O'
+            kinds = [dtype.kind for dtype in df.dtypes]
+            metrics = {
                 'row_count': len(df),
                 'column_count': len(df.columns),
                 'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'numeric_columns': len(df.select_dtypes(include=['number']).columns),
-                'text_columns': len(df.select_dtypes(include=['object']).columns)
+                'numeric_columns': sum(1 for kind in kinds if kind in 'iufc'),
+                'text_columns': kinds.count('O')
             }
+        
+        return {
+            'metadata': self.get_metadata(),
+            # Text is rendered only if someone reads it
+            'content': LazyContent(content, lazy={'text': partial(frame_to_text, df)} if include_text else {}),
+            'metrics': metrics
         }
     
     def extract_text(self) -> str:
@@ -101,6 +349,15 @@ class CSVParser(BaseParser):
         df = self._load_dataframe()
         return df.to_string(index=False)
     
+    def extract_text_tsv(self) -> str:
+        """
+        Extract plain text quickly as tab-separated values (no column alignment)
+        
+        Returns:
+            Tab-separated CSV content
+        """
+        return frame_to_text(self._load_dataframe())
+    
     def extract_tables(self) -> List[pd.DataFrame]:
         """
         Extract tables
@@ -110,6 +367,84 @@ class CSVParser(BaseParser):
         """
         df = self._load_dataframe()
         return [df]
+    
+    def iter_chunks(self, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Stream the file as DataFrames of at most chunksize rows
+        
+        Peak memory is bounded by one chunk, so files larger than RAM can be
+        scanned; use this instead of parse() when the full table isn't needed.
+        
+        Args:
+            chunksize: Rows per chunk
+            
+        Yields:
+            Consecutive row chunks
+        """
+        with pd.read_csv(
+            self.file_path,
+            encoding=self.encoding,
+            encoding_errors='replace',
+            chunksize=chunksize
+        ) as reader:
+            yield from reader
+    
+    def scan_metrics(self, chunksize: int = CHUNK_ROWS) -> Dict[str, Any]:
+        """
+        Compute table metrics in one streaming pass, without loading the whole file
+        
+        Args:
+            chunksize: Rows per chunk
+            
+        Returns:
+            Row/column counts plus count/sum/mean/min/max for columns numeric in every chunk
+        """
+        row_count = 0
+        columns: List[str] = []
+        numeric = None
+        stats = None
+        
+        for chunk in self.iter_chunks(chunksize):
+            if not columns:
+                columns = chunk.columns.tolist()
+            row_count += len(chunk)
+            
+            num = chunk.select_dtypes(include=['number'])
+            numeric = set(num.columns) if numeric is None else numeric & set(num.columns)
+            if num.empty:
+                continue
+            
+            # Running per-column accumulators (rows: count, sum, min, max)
+            part = num.agg(['count', 'sum', 'min', 'max'])
+            if stats is None:
+                stats = part
+            else:
+                stats = pd.DataFrame({
+                    'count': stats.loc['count'].add(part.loc['count'], fill_value=0),
+                    'sum': stats.loc['sum'].add(part.loc['sum'], fill_value=0),
+                    'min': pd.concat([stats.loc['min'], part.loc['min']], axis=1).min(axis=1),
+                    'max': pd.concat([stats.loc['max'], part.loc['max']], axis=1).max(axis=1)
+                }).T
+        
+        summary = {}
+        for col in columns:
+            if stats is None or not numeric or col not in numeric:
+                continue
+            count = stats.at['count', col]
+            summary[col] = {
+                'count': int(count),
+                'sum': stats.at['sum', col],
+                'mean': stats.at['sum', col] / count if count else float('nan'),
+                'min': stats.at['min', col],
+                'max': stats.at['max', col]
+            }
+        
+        return {
+            'row_count': row_count,
+            'column_count': len(columns),
+            'numeric_columns': len(summary),
+            'summary': summary
+        }
 
 
 def main():
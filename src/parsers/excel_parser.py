@@ -7,10 +7,69 @@ Features:
 3. Handle merged cells and formatting
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from xml.etree import ElementTree
+import zipfile
 from pathlib import Path
-from .base_parser import BaseParser
+from .base_parser import BaseParser, LazyContent, frame_to_text
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Rust-based calamine reader when installed (pandas reads with it from 2.2 on),
+# otherwise the pure-Python openpyxl reader
+_PANDAS_HAS_CALAMINE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+EXCEL_ENGINE = 'calamine' if CALAMINE_AVAILABLE and _PANDAS_HAS_CALAMINE else 'openpyxl'
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Upper bound on sheets read at once by _load_sheets
+MAX_SHEET_WORKERS = 8
+
+# Sheets at least this long get their numeric summary from the Numba kernel
+NUMBA_MIN_ROWS = 200_000
+
+# Row order of the Numba summary kernel's output
+_SUMMARY_STATS = ('mean', 'max', 'min', 'sum')
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _summary_stats(arr):
+        """NaN-skipping mean/max/min/sum of each column in one pass, one column per thread"""
+        n_cols = arr.shape[1]
+        out = np.full((4, n_cols), np.nan)
+        for j in prange(n_cols):
+            total = 0.0
+            count = 0
+            hi = -np.inf
+            lo = np.inf
+            for i in range(arr.shape[0]):
+                v = arr[i, j]
+                if not np.isnan(v):
+                    total += v
+                    count += 1
+                    if v > hi:
+                        hi = v
+                    if v < lo:
+                        lo = v
+            out[3, j] = total
+            if count > 0:
+                out[0, j] = total / count
+                out[1, j] = hi
+                out[2, j] = lo
+        return out
 
 
 class ExcelParser(BaseParser):
@@ -24,13 +83,18 @@ class ExcelParser(BaseParser):
             file_path: Path to Excel file
         """
         super().__init__(file_path)
-        self.workbook = None
         self.data = {}
         
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, *, include_text: bool = True, include_tables: bool = True,
+              include_metrics: bool = True) -> Dict[str, Any]:
         """
         Parse Excel file and return standardized data structure
         
+        Args:
+            include_text: Include content['text']
+            include_tables: Include content['tables']
+            include_metrics: Compute 'metrics' (an empty dict otherwise)
+            
         Returns:
             Standardized data dictionary
         """
@@ -38,28 +102,36 @@ class ExcelParser(BaseParser):
         self._load_sheets()
         
         # Get first sheet
-        first_sheet = list(self.data.keys())[0] if self.data else None
-        df = self.data.get(first_sheet) if first_sheet else pd.DataFrame()
+        df = next(iter(self.data.values()), None)
+        if df is None:
+            df = pd.DataFrame()
         
-        # Extract metrics
-        metrics = self.extract_metrics(first_sheet)
+        content = {
+            'structure': {
+                'sheet_names': list(self.data.keys()),
+                'sheet_count': len(self.data)
+            }
+        }
+        if include_tables:
+            content['tables'] = list(self.data.values())
         
-        return {
-            'metadata': self.get_metadata(),
-            'content': {
-                'text': df.to_string(index=False) if not df.empty else "",
-                'tables': list(self.data.values()),
-                'structure': {
-                    'sheet_names': list(self.data.keys()),
-                    'sheet_count': len(self.data)
-                 }
-            },
-            'metrics': {
+        metrics = {}
+        if include_metrics:
+            # Only the first sheet's shape is reported here; extract_metrics() has the
+            # per-column summary for callers that want it
+            row_count, column_count = df.shape
+            metrics = {
                 'sheet_count': len(self.data),
-                'row_count': metrics.get('row_count', 0),
-                'column_count': metrics.get('column_count', 0),
-                'total_cells': metrics.get('row_count', 0) * metrics.get('column_count', 0)
+                'row_count': row_count,
+                'column_count': column_count,
+                'total_cells': row_count * column_count
             }
+        
+        return {
+            'metadata': self.get_metadata(),
+            # Text is rendered only if someone reads it
+            'content': LazyContent(content, lazy={'text': partial(frame_to_text, df)} if include_text else {}),
+            'metrics': metrics
         }
     
     def _load_sheets(self):
@@ -68,14 +140,48 @@ class ExcelParser(BaseParser):
             if not self.file_path.exists():
                 raise FileNotFoundError(f"File not found: {self.file_path}")
             
-            excel_file = pd.ExcelFile(self.file_path)
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(
-                    self.file_path, 
-                    sheet_name=sheet_name,
-                    engine='openpyxl'
-                )
-                self.data[sheet_name] = df
+            if CALAMINE_AVAILABLE:
+                sheet_names = CalamineWorkbook.from_path(str(self.file_path)).sheet_names
+            else:
+                sheet_names = self._fast_sheet_names()
+            
+            if sheet_names is None:
+                with pd.ExcelFile(self.file_path) as excel_file:
+                    sheet_names = excel_file.sheet_names
+            
+            # Each sheet is an independent read, so overlap them (zip inflation releases the GIL)
+            if len(sheet_names) <= 1:
+                frames = [self._read_sheet(name) for name in sheet_names]
+            else:
+                with ThreadPoolExecutor(max_workers=min(MAX_SHEET_WORKERS, len(sheet_names))) as executor:
+                    frames = list(executor.map(self._read_sheet, sheet_names))
+            
+            self.data = dict(zip(sheet_names, frames))
+    
+    def _fast_sheet_names(self) -> Optional[List[str]]:
+        """
+        Sheet names straight from xl/workbook.xml, without parsing styles or shared strings
+        
+        Returns:
+            Sheet names in workbook order, or None if the file isn't a readable xlsx
+        """
+        try:
+            with zipfile.ZipFile(self.file_path) as archive:
+                root = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError, OSError):
+            return None
+        
+        # <sheets><sheet name="..." .../></sheets>, in whatever namespace the writer used
+        names = [el.get('name') for el in root.iter() if el.tag.rsplit('}', 1)[-1] == 'sheet']
+        return names if names and None not in names else None
+    
+    def _read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """Read one sheet (safe to call from worker threads)"""
+        return pd.read_excel(
+            self.file_path,
+            sheet_name=sheet_name,
+            engine=EXCEL_ENGINE
+        )
     
     def extract_text(self) -> str:
         """
@@ -90,38 +196,27 @@ class ExcelParser(BaseParser):
             text_parts.append(f"=== {sheet_name} ===\n{df.to_string(index=False)}")
         return '\n\n'.join(text_parts)
     
-    def extract_tables(self) -> List[pd.DataFrame]:
+    def extract_text_tsv(self) -> str:
         """
-        Extract all tables (each sheet is a table)
+        Extract plain text quickly as tab-separated values (no column alignment)
         
         Returns:
-            List of tables
+            Tab-separated content of every sheet
         """
         self._load_sheets()
-        return list(self.data.values())
+        return '\n\n'.join(
+            f"=== {sheet_name} ===\n{frame_to_text(df)}" for sheet_name, df in self.data.items()
+        )
     
-    def parse_old(self) -> Dict[str, Any]:
+    def extract_tables(self) -> List[pd.DataFrame]:
         """
-        Parse Excel file and extract structured data
+        Extract all tables (each sheet is a table)
         
         Returns:
-            Dictionary containing parsed data
+            List of tables
         """
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
-        
-        # Read all sheets
-        excel_file = pd.ExcelFile(self.file_path)
-        
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(
-                self.file_path, 
-                sheet_name=sheet_name,
-                engine='openpyxl'
-            )
-            self.data[sheet_name] = df
-        
-        return self.data
+        self._load_sheets()
+        return list(self.data.values())
     
     def extract_metrics(self, sheet_name: str = None) -> Dict[str, Any]:
         """
@@ -137,7 +232,7 @@ class ExcelParser(BaseParser):
         
         # Use first sheet
         if sheet_name is None:
-            sheet_name = list(self.data.keys())[0] if self.data else None
+            sheet_name = next(iter(self.data), None)
         
         if not sheet_name or sheet_name not in self.data:
             return {}
@@ -153,14 +248,18 @@ class ExcelParser(BaseParser):
         }
         
         # Extract statistics for numeric columns
+        # (all four reductions for every column in one call; to_dict gives {col: {stat: value}})
         numeric_cols = df.select_dtypes(include=['number']).columns
-        for col in numeric_cols:
-            metrics['summary'][col] = {
-                'mean': df[col].mean(),
-                'max': df[col].max(),
-                'min': df[col].min(),
-                'sum': df[col].sum()
+        if len(numeric_cols) > 0 and NUMBA_AVAILABLE and len(df) >= NUMBA_MIN_ROWS:
+            # One fused pass per column over a column-major float64 block
+            arr = np.asfortranarray(df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+            stats = _summary_stats(arr)
+            metrics['summary'] = {
+                col: dict(zip(_SUMMARY_STATS, stats[:, j].tolist()))
+                for j, col in enumerate(numeric_cols)
             }
+        elif len(numeric_cols) > 0:
+            metrics['summary'] = df[numeric_cols].agg(list(_SUMMARY_STATS)).to_dict()
         
         return metrics
     
@@ -177,7 +276,7 @@ class ExcelParser(BaseParser):
         self._load_sheets()
         
         if sheet_name is None:
-            sheet_name = list(self.data.keys())[0] if self.data else None
+            sheet_name = next(iter(self.data), None)
         
         return self.data.get(sheet_name, pd.DataFrame())
 
@@ -4,27 +4,51 @@ Parser Factory
 Automatically selects appropriate parser based on file type
 """
 
-from pathlib import Path
-from typing import Union
-from .excel_parser import ExcelParser
-from .csv_parser import CSVParser
-from .word_parser import WordParser
-from .pdf_parser import PDFParser
+from types import MappingProxyType
+from typing import Dict, Type, Union
+import importlib
+import os
+import sys
 from .base_parser import BaseParser
 
 
 class ParserFactory:
     """Parser factory class - automatically selects the appropriate parser"""
     
-    # File extension to parser mapping
-    PARSERS = {
-        '.xlsx': ExcelParser,
-        '.xls': ExcelParser,
-        '.csv': CSVParser,
-        '.docx': WordParser,
-        '.doc': WordParser,
-        '.pdf': PDFParser
-    }
+    # File extension to parser (module, class) mapping; modules are imported on first use
+    # so e.g. a CSV run never loads openpyxl, python-docx or pdfplumber.
+    # Read-only, with interned keys so lookups of interned extensions match by identity
+    PARSERS = MappingProxyType({sys.intern(ext): parser for ext, parser in {
+        '.xlsx': ('.excel_parser', 'ExcelParser'),
+        '.xls': ('.excel_parser', 'ExcelParser'),
+        '.csv': ('.csv_parser', 'CSVParser'),
+        '.docx': ('.word_parser', 'WordParser'),
+        '.doc': ('.word_parser', 'WordParser'),
+        '.pdf': ('.pdf_parser', 'PDFParser')
+    }.items()})
+    
+    # Resolved parser classes by extension
+    _classes: Dict[str, Type[BaseParser]] = {}
+    
+    @classmethod
+    def get_parser_class(cls, ext: str) -> Type[BaseParser]:
+        """
+        Parser class for a file extension, importing its module on first use
+        
+        Args:
+            ext: Lowercase extension including the dot
+            
+        Returns:
+            Parser class, or None if the extension is unsupported
+        """
+        parser_class = cls._classes.get(ext)
+        
+        if parser_class is None and ext in cls.PARSERS:
+            module_name, class_name = cls.PARSERS[ext]
+            module = importlib.import_module(module_name, __package__)
+            parser_class = cls._classes[ext] = getattr(module, class_name)
+        
+        return parser_class
     
     @staticmethod
     def create_parser(file_path: str) -> BaseParser:
@@ -38,17 +62,12 @@ class ParserFactory:
             Corresponding parser instance
             
         Raises:
-            FileNotFoundError: File does not exist
+            FileNotFoundError: File does not exist (raised by the parser's own stat)
             ValueError: Unsupported file format
         """
-        path = Path(file_path)
+        ext = sys.intern(os.path.splitext(file_path)[1].lower())
         
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        ext = path.suffix.lower()
-        
-        parser_class = ParserFactory.PARSERS.get(ext)
+        parser_class = ParserFactory.get_parser_class(ext)
         
         if parser_class is None:
             supported = ', '.join(ParserFactory.PARSERS.keys())
@@ -82,14 +101,12 @@ class ParserFactory:
         Returns:
             Whether the format is supported
         """
-        ext = Path(file_path).suffix.lower()
+        ext = sys.intern(os.path.splitext(file_path)[1].lower())
         return ext in ParserFactory.PARSERS
 
 
 def main():
     """Test function"""
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python parser_factory.py <file_path>")
         print(f"\nSupported formats: {', '.join(ParserFactory.get_supported_formats())}")
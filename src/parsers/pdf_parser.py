@@ -7,93 +7,345 @@ Supports text extraction and table recognition
 import pdfplumber
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
-from .base_parser import BaseParser
+from typing import AsyncIterator, Dict, Any, List, Optional, Sequence, Tuple
+from .base_parser import BaseParser, text_metrics
+import asyncio
+import io
+import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+import os
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Per-table warnings go through logging: formatted only if emitted, and
+# routed to the API's queue handler instead of blocking on stdout
+log = logging.getLogger("hopper.parsers.pdf")
+
+# Documents with at least this many pages are extracted on a process pool
+PARALLEL_MIN_PAGES = 8
+
+# Page texts remembered across parser instances, keyed by (path, mtime, size, page)
+PAGE_TEXT_CACHE_SIZE = 512
+_page_text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _page_tables(page, page_num: int) -> List[pd.DataFrame]:
+    """Tables found on one page, first row as header"""
+    page_tables = []
+    for table_idx, table in enumerate(page.extract_tables()):
+        if not table or len(table) < 2:
+            continue
+        try:
+            # Fill and strip column-wise instead of cell by cell
+            cleaned = pd.DataFrame(table, dtype=object).fillna('').apply(lambda col: col.str.strip())
+            headers = cleaned.iloc[0].tolist()
+            rows = cleaned.iloc[1:]
+            rows = rows[(rows != '').any(axis=1)]
+            if rows.empty:
+                continue
+            df = rows.set_axis(headers, axis=1).reset_index(drop=True)
+            df.attrs['page_number'] = page_num
+            df.attrs['table_index'] = table_idx
+            df.attrs['source'] = 'pdf_document'
+            page_tables.append(df)
+        except Exception as e:
+            log.warning("Page %d table %d parsing failed: %s", page_num, table_idx + 1, e)
+    return page_tables
+
+
+def _page_text(page) -> str:
+    """
+    Plain text of one page in pdfplumber's cheapest mode (no layout reconstruction)
+    
+    Graphics-only pages (figures, scans) have no characters, so they skip the
+    word clustering entirely.
+    """
+    if not page.chars:
+        return ""
+    return page.extract_text(layout=False, x_tolerance=3, y_tolerance=3) or ""
+
+
+def _extract_page(page, page_num: int, text: bool, tables: bool) -> Tuple[Optional[str], List[pd.DataFrame], int, int]:
+    """
+    Text and/or tables of one page
+    
+    Returns:
+        (text, tables, word count, newline count); the counts are taken here so
+        the joined document text never has to be scanned again for metrics
+    """
+    return _page_result(
+        _page_text(page) if text else None,
+        _page_tables(page, page_num) if tables else []
+    )
+
+
+def _page_result(page_text: Optional[str], page_tables: List[pd.DataFrame]):
+    """Bundle one page's extraction with its word and newline counts"""
+    if not page_text:
+        return page_text, page_tables, 0, 0
+    counts = text_metrics(page_text)
+    return page_text, page_tables, counts['word_count'], counts['line_count'] - 1
+
+
+def _extract_pages(file_path: str, page_nums: Sequence[int], text: bool, tables: bool):
+    """
+    Extract a run of pages (runs in a worker process, so it opens its own copy of the PDF)
+    
+    Returns:
+        _extract_page results, in page order
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return [_extract_page(pdf.pages[n - 1], n, text, tables) for n in page_nums]
 
 
 class PDFParser(BaseParser):
     """PDF document parser"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, fast_text: bool = True):
+        """
+        Initialize PDF parser
+        
+        Args:
+            file_path: Path to PDF file
+            fast_text: Use PyMuPDF (when installed) for text-only extraction
+        """
         super().__init__(file_path)
-        self.pdf = pdfplumber.open(str(self.file_path))
+        self.fast_text = fast_text
+        
+        # Per-page extraction results kept for the parser's lifetime:
+        # 'text' -> [(text, words, newlines), ...], 'tables' -> [[DataFrame, ...], ...]
+        self._page_cache: Dict[str, list] = {}
+    
+    @cached_property
+    def pdf(self):
+        """The open pdfplumber document (opened on first use, so metadata-only or cached runs never open it)"""
+        return pdfplumber.open(str(self.file_path))
     
-    def parse(self) -> Dict[str, Any]:
-        text = self.extract_text()
-        tables = self.extract_tables()
+    def parse(self, *, include_text: bool = True, include_tables: bool = True,
+              include_metrics: bool = True) -> Dict[str, Any]:
+        # Unchanged documents are served from the content-hash cache
+        cache_path = self._cache_path(include_text, include_tables, include_metrics)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
         
         metadata = self.get_metadata()
         metadata['pdf_metadata'] = self.pdf.metadata or {}
         metadata['page_count'] = len(self.pdf.pages)
         
-        return {
-            'metadata': metadata,
-            'content': {
-                'text': text,
-                'tables': tables,
-                'structure': {
-                    'pages': len(self.pdf.pages)
-                }
-            },
-            'metrics': {
+        content = {
+            'structure': {
+                'pages': len(self.pdf.pages)
+            }
+        }
+        
+        # Text and table extraction are the expensive parts; skip whatever isn't needed
+        text, tables, text_stats = self._extract_all(
+            text=include_text or include_metrics,
+            tables=include_tables or include_metrics
+        )
+        
+        if include_text:
+            content['text'] = text
+        if include_tables:
+            content['tables'] = tables
+        
+        metrics = {}
+        if include_metrics:
+            metrics = {
                 'page_count': len(self.pdf.pages),
-                'word_count': len(text.split()),
-                'character_count': len(text),
+                'word_count': text_stats['word_count'],
+                'character_count': text_stats['character_count'],
                 'table_count': len(tables),
-                'line_count': text.count('\n') + 1
+                'line_count': text_stats['line_count']
             }
+        
+        result = {
+            'metadata': metadata,
+            'content': content,
+            'metrics': metrics
         }
+        self._store_cached(cache_path, result)
+        
+        return result
     
     def extract_text(self) -> str:
-        text_parts = []
-        for page_num, page in enumerate(self.pdf.pages, 1):
-            text = page.extract_text()
-            if text:
-                text_parts.append(f"=== Page {page_num} ===\n{text}")
-        return '\n\n'.join(text_parts)
+        return self._extract_all(text=True, tables=False)[0]
     
     def extract_tables(self) -> List[pd.DataFrame]:
+        return self._extract_all(text=False, tables=True)[1]
+    
+    def _extract_all(self, text: bool = True,
+                     tables: bool = True) -> Tuple[str, List[pd.DataFrame], Dict[str, int]]:
+        """
+        Extract text and tables in one pass over the pages
+        
+        Each side is extracted at most once per parser; later calls (e.g.
+        extract_text after parse) reuse the per-page results.
+        
+        Args:
+            text: Extract page text
+            tables: Extract page tables
+            
+        Returns:
+            (joined page text, all tables in page order, word/character/line
+            counts of the joined text)
+        """
+        want_text = text and 'text' not in self._page_cache
+        want_tables = tables and 'tables' not in self._page_cache
+        
+        if want_text or want_tables:
+            pages = None
+            if want_text and not want_tables and self.fast_text and PYMUPDF_AVAILABLE:
+                pages = self._extract_text_mupdf()
+            if pages is None:
+                pages = self._extract_pages_pdfplumber(want_text, want_tables)
+            
+            if want_text:
+                self._page_cache['text'] = [(page_text, words, newlines) for page_text, _, words, newlines in pages]
+            if want_tables:
+                self._page_cache['tables'] = [page_tables for _, page_tables, _, _ in pages]
+        
+        # Assemble the text and its counts in one pass; pages are separated by a blank line
+        buffer = io.StringIO()
         all_tables = []
-        for page_num, page in enumerate(self.pdf.pages, 1):
-            tables = page.extract_tables()
-            for table_idx, table in enumerate(tables):
-                if not table or len(table) < 2:
-                    continue
-                try:
-                    cleaned_table = [[( cell or '').strip() for cell in row] for row in table]
-                    headers = cleaned_table[0]
-                    rows = [row for row in cleaned_table[1:] if any(cell for cell in row)]
-                    if not rows:
-                        continue
-                    df = pd.DataFrame(rows, columns=headers)
-                    df.attrs['page_number'] = page_num
-                    df.attrs['table_index'] = table_idx
-                    df.attrs['source'] = 'pdf_document'
-                    all_tables.append(df)
-                except Exception as e:
-                    print(f"  ⚠️  Page {page_num} table {table_idx + 1} parsing failed: {e}")
-        return all_tables
+        word_count = 0
+        newline_count = 0
+        char_count = 0
+        for page_num, (page_text, page_words, page_newlines) in enumerate(self._page_cache['text'] if text else [], 1):
+            if page_text:
+                separator = '\n\n' if char_count else ''
+                header = f"{separator}=== Page {page_num} ===\n"
+                buffer.write(header)
+                buffer.write(page_text)
+                # The "=== Page N ===" header adds four words; header and separator add newlines
+                word_count += page_words + 4
+                newline_count += page_newlines + header.count('\n')
+                char_count += len(header) + len(page_text)
+        
+        for page_tables in self._page_cache['tables'] if tables else []:
+            all_tables.extend(page_tables)
+        
+        text_stats = {
+            'word_count': word_count,
+            'character_count': char_count,
+            'line_count': newline_count + 1
+        }
+        
+        return buffer.getvalue(), all_tables, text_stats
+    
+    def _extract_pages_pdfplumber(self, text: bool, tables: bool) -> list:
+        """
+        Per-page _extract_page results from pdfplumber
+        
+        Long documents are split into contiguous page runs, one per worker
+        process; pdfplumber's layout analysis is pure Python and CPU-bound.
+        """
+        page_count = len(self.pdf.pages)
+        n_workers = min(os.cpu_count() or 1, page_count)
+        
+        if page_count < PARALLEL_MIN_PAGES or n_workers < 2:
+            return [
+                _extract_page(page, page_num, text, tables)
+                for page_num, page in enumerate(self.pdf.pages, 1)
+            ]
+        
+        run = -(-page_count // n_workers)
+        runs = [range(start, min(start + run, page_count + 1)) for start in range(1, page_count + 1, run)]
+        extract = partial(_extract_pages, str(self.file_path), text=text, tables=tables)
+        with ProcessPoolExecutor(max_workers=len(runs)) as executor:
+            return [page for batch in executor.map(extract, runs) for page in batch]
+    
+    def _extract_text_mupdf(self) -> Optional[list]:
+        """
+        Page texts via MuPDF's C extractor (no per-character layout model),
+        shaped like _extract_page results
+        
+        Returns:
+            Per-page results, or None if MuPDF can't read the file (pdfplumber then tries)
+        """
+        try:
+            with fitz.open(str(self.file_path)) as doc:
+                return [_page_result(page.get_text('text').rstrip(), []) for page in doc]
+        except RuntimeError as e:
+            log.warning("PyMuPDF failed (%s), using pdfplumber", e)
+            return None
+    
+    async def iter_pages_async(self) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Yield (page number, text) page by page, each page extracted on a worker thread
+        
+        Lets async consumers (e.g. a chat session) start on the first pages
+        while the rest of the document is still being read.
+        """
+        pdf = await asyncio.to_thread(lambda: self.pdf)
+        for page_num, page in enumerate(pdf.pages, 1):
+            yield page_num, await asyncio.to_thread(_page_text, page)
     
     def extract_page_text(self, page_num: int) -> str:
-        if 1 <= page_num <= len(self.pdf.pages):
-            return self.pdf.pages[page_num - 1].extract_text() or ""
-        return ""
+        # Revisited pages (chat/agent lookups) skip pdfplumber's layout analysis;
+        # the stat in the key invalidates entries when the file changes
+        key = (str(self.file_path.resolve()), self._stat.st_mtime_ns, self._stat.st_size, page_num)
+        text = _page_text_cache.get(key)
+        if text is not None:
+            _page_text_cache.move_to_end(key)
+            return text
+        
+        page_texts = self._page_cache.get('text')
+        if page_texts is not None:
+            # Already extracted by a document-wide pass on this parser
+            if not 1 <= page_num <= len(page_texts):
+                return ""
+            text = page_texts[page_num - 1][0] or ""
+        elif not 1 <= page_num <= len(self.pdf.pages):
+            return ""
+        else:
+            text = _page_text(self.pdf.pages[page_num - 1])
+        
+        _page_text_cache[key] = text
+        while len(_page_text_cache) > PAGE_TEXT_CACHE_SIZE:
+            _page_text_cache.popitem(last=False)
+        return text
     
     def __del__(self):
-        if hasattr(self, 'pdf'):
+        if 'pdf' in self.__dict__:
             try:
-                self.pdf.close()
+                self.__dict__['pdf'].close()
             except:
                 pass
 
 
 
 def main():
-    import sys
-    if len(sys.argv) < 2:
-        print("Usage: python pdf_parser.py <pdf_file_path>")
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description='Parse PDF documents')
+    arg_parser.add_argument('file', nargs='?', help='PDF file path')
+    arg_parser.add_argument('--batch', metavar='DIR', help='Parse every PDF in a directory in one run')
+    arg_parser.add_argument('--workers', type=int, default=None, help='Worker processes for --batch')
+    args = arg_parser.parse_args()
+    
+    if args.batch:
+        paths = sorted(Path(args.batch).glob('*.pdf'))
+        for path, data in PDFParser.parse_batch(paths, workers=args.workers).items():
+            if 'error' in data:
+                print(f"  ✗ {Path(path).name}: {data['error']}")
+            else:
+                print(f"  ✓ {Path(path).name}: {data['metrics']['page_count']} pages, "
+                      f"{data['metrics']['table_count']} tables, {data['metrics']['word_count']} words")
         return
-    parser = PDFParser(sys.argv[1])
+    
+    if not args.file:
+        arg_parser.print_usage()
+        return
+    
+    parser = PDFParser(args.file)
     data = parser.parse()
     print(f"\n✅ Parsing successful:")
     print(f"  - File: {data['metadata']['file_name']}")
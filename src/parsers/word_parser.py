@@ -5,54 +5,114 @@ Supports text and table extraction with paragraph structure analysis
 """
 
 from docx import Document
+from docx.oxml.ns import qn
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
-from .base_parser import BaseParser
+from typing import Dict, Any, List, Optional
+from .base_parser import BaseParser, text_metrics
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import logging
+
+# Per-table warnings go through logging: formatted only if emitted, and
+# routed to the API's queue handler instead of blocking on stdout
+log = logging.getLogger("hopper.parsers.word")
+
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_P = qn('w:p')
+
+# Layouts where python-docx's row.cells differs from the raw <w:tc> list
+# (spanned or vertically merged cells, skipped grid columns, content controls)
+_IRREGULAR_TABLE_XPATH = (
+    './w:tr/w:tc/w:tcPr/w:gridSpan | ./w:tr/w:tc/w:tcPr/w:vMerge'
+    ' | ./w:tr/w:trPr/w:gridBefore | ./w:tr/w:trPr/w:gridAfter | ./w:tr/w:sdt'
+)
+
+
+def _table_cell_texts(table) -> List[List[str]]:
+    """
+    Stripped cell texts of a table, row by row
+    
+    Regular tables are read in one sweep over the XML (<w:tr>/<w:tc>/<w:p>),
+    skipping python-docx's Row/Cell/Paragraph proxies; each cell is the
+    paragraph texts joined by newlines, exactly as Cell.text. Tables with
+    merged or spanned cells go through row.cells so the merge expansion is kept.
+    """
+    tbl = table._tbl
+    if tbl.xpath(_IRREGULAR_TABLE_XPATH):
+        return [[cell.text.strip() for cell in row.cells] for row in table.rows]
+    
+    return [
+        ['\n'.join(p.text for p in tc.iterchildren(_W_P)).strip() for tc in tr.iterchildren(_W_TC)]
+        for tr in tbl.iterchildren(_W_TR)
+    ]
+
+# Upper bound on tables converted at once by extract_tables
+MAX_TABLE_WORKERS = 8
 
 
 class WordParser(BaseParser):
     """Word document parser"""
     
-    def __init__(self, file_path: str):
-        """
-        Initialize Word parser
-        
-        Args:
-            file_path: Path to Word file
-        """
-        super().__init__(file_path)
-        self.doc = Document(str(self.file_path))
+    @cached_property
+    def doc(self):
+        """The loaded python-docx document (loaded on first use)"""
+        return Document(str(self.file_path))
     
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, *, include_text: bool = True, include_tables: bool = True,
+              include_metrics: bool = True) -> Dict[str, Any]:
         """
         Parse Word document
         
+        Args:
+            include_text: Include content['text']
+            include_tables: Include content['tables']
+            include_metrics: Compute 'metrics' (an empty dict otherwise)
+            
         Returns:
             Standardized data structure
         """
-        text = self.extract_text()
-        tables = self.extract_tables()
+        # Unchanged documents are served from the content-hash cache
+        cache_path = self._cache_path(include_text, include_tables, include_metrics)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
         
-        return {
-            'metadata': self.get_metadata(),
-            'content': {
-                'text': text,
-                'tables': tables,
-                'structure': {
-                    'paragraphs': len(self.doc.paragraphs),
-                    'tables': len(self.doc.tables),
-                    'sections': len(self.doc.sections)
-                }
-            },
-            'metrics': {
-                'word_count': len(text.split()),
-                'character_count': len(text),
-                'paragraph_count': len(self.doc.paragraphs),
-                'table_count': len(self.doc.tables),
-                'line_count': text.count('\n') + 1
+        content = {
+            'structure': {
+                'paragraphs': len(self.doc.paragraphs),
+                'tables': len(self.doc.tables),
+                'sections': len(self.doc.sections)
             }
         }
+        if include_tables:
+            content['tables'] = self.extract_tables()
+        
+        # The text metrics need the text even when it isn't returned
+        metrics = {}
+        if include_text or include_metrics:
+            text = self.extract_text()
+            if include_text:
+                content['text'] = text
+            if include_metrics:
+                counts = text_metrics(text)
+                metrics = {
+                    'word_count': counts['word_count'],
+                    'character_count': counts['character_count'],
+                    'paragraph_count': len(self.doc.paragraphs),
+                    'table_count': len(self.doc.tables),
+                    'line_count': counts['line_count']
+                }
+        
+        result = {
+            'metadata': self.get_metadata(),
+            'content': content,
+            'metrics': metrics
+        }
+        self._store_cached(cache_path, result)
+        
+        return result
     
     def extract_text(self) -> str:
         """
@@ -77,37 +137,51 @@ class WordParser(BaseParser):
         Returns:
             List of tables (DataFrame format)
         """
-        tables = []
-        
-        for table_idx, table in enumerate(self.doc.tables):
-            # Extract table data
-            data = []
-            for row in table.rows:
-                row_data = [cell.text.strip() for cell in row.cells]
-                data.append(row_data)
+        tables = list(enumerate(self.doc.tables))
+        
+        # Tables are independent; overlap their XML walks on a few threads
+        if len(tables) <= 1:
+            results = [self._extract_one_table(item) for item in tables]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_TABLE_WORKERS, len(tables))) as executor:
+                results = list(executor.map(self._extract_one_table, tables))
+        
+        return [df for df in results if df is not None]
+    
+    @staticmethod
+    def _extract_one_table(item) -> Optional[pd.DataFrame]:
+        """
+        Convert one (index, table) pair to a DataFrame
+        
+        Returns:
+            The table with its first row as header, or None if it is empty,
+            single-row or malformed
+        """
+        table_idx, table = item
+        
+        # Extract table data
+        data = _table_cell_texts(table)
+        
+        if not data or len(data) < 2:
+            return None  # Skip empty tables or single-row tables
+        
+        try:
+            # First row as header
+            headers = data[0]
+            rows = data[1:]
+            
+            # Create DataFrame
+            df = pd.DataFrame(rows, columns=headers)
             
-            if not data or len(data) < 2:
-                continue  # Skip empty tables or single-row tables
+            # Add table index information
+            df.attrs['table_index'] = table_idx
+            df.attrs['source'] = 'word_document'
             
-            try:
-                # First row as header
-                headers = data[0]
-                rows = data[1:]
-                
-                # Create DataFrame
-                df = pd.DataFrame(rows, columns=headers)
-                
-                # Add table index information
-                df.attrs['table_index'] = table_idx
-                df.attrs['source'] = 'word_document'
-                
-                tables.append(df)
-                
-            except Exception as e:
-                print(f"  ⚠️  Table {table_idx + 1} parsing failed: {e}")
-                continue
-        
-        return tables
+            return df
+            
+        except Exception as e:
+            log.warning("Table %d parsing failed: %s", table_idx + 1, e)
+            return None
     
     def extract_headings(self) -> List[Dict[str, Any]]:
         """
@@ -116,11 +190,19 @@ class WordParser(BaseParser):
         Returns:
             List of headings with level and content
         """
+        # Resolve "Heading N" style names to levels once per document
+        level_map = {}
+        for style in self.doc.styles:
+            name = style.name or ''
+            prefix, _, level = name.rpartition(' ')
+            if prefix == 'Heading' and level.isdigit():
+                level_map[name] = int(level)
+        
         headings = []
         
         for para in self.doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                level = int(para.style.name.replace('Heading ', ''))
+            level = level_map.get(para.style.name)
+            if level is not None:
                 headings.append({
                     'level': level,
                     'text': para.text.strip()
@@ -131,15 +213,29 @@ class WordParser(BaseParser):
 
 def main():
     """Test function"""
-    import sys
+    import argparse
     
-    if len(sys.argv) < 2:
-        print("Usage: python word_parser.py <docx_file_path>")
+    arg_parser = argparse.ArgumentParser(description='Parse Word documents')
+    arg_parser.add_argument('file', nargs='?', help='Word file path')
+    arg_parser.add_argument('--batch', metavar='DIR', help='Parse every .docx in a directory in one run')
+    arg_parser.add_argument('--workers', type=int, default=None, help='Worker processes for --batch')
+    args = arg_parser.parse_args()
+    
+    if args.batch:
+        paths = sorted(Path(args.batch).glob('*.docx'))
+        for path, data in WordParser.parse_batch(paths, workers=args.workers).items():
+            if 'error' in data:
+                print(f"  ✗ {Path(path).name}: {data['error']}")
+            else:
+                print(f"  ✓ {Path(path).name}: {data['metrics']['paragraph_count']} paragraphs, "
+                      f"{data['metrics']['table_count']} tables, {data['metrics']['word_count']} words")
         return
     
-    file_path = sys.argv[1]
+    if not args.file:
+        arg_parser.print_usage()
+        return
     
-    parser = WordParser(file_path)
+    parser = WordParser(args.file)
     data = parser.parse()
     
     print(f"\n✅ Parsing successful:")
@@ -0,0 +1,69 @@
+"""
+Template Fast Path
+
+Per-cell styling loops for write-only worksheets, kept free of module state
+so the module can be compiled ahead of time:
+
+    mypyc src/templates/_fastpath.py
+
+The compiled extension lands next to this file and is imported in its place;
+without it this pure-Python module is used.
+"""
+
+from datetime import date
+from typing import Any, Iterable, List, Optional, Tuple
+
+from openpyxl.cell import WriteOnlyCell
+
+
+def header_cells(ws: Any, names: List[str], style: str) -> List[Any]:
+    """
+    Header row as styled write-only cells
+
+    Args:
+        ws: openpyxl write-only worksheet
+        names: Column titles
+        style: Registered named style for the header
+
+    Returns:
+        Cells for ws.append
+    """
+    cells: List[Any] = []
+    for name in names:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.style = style
+        cells.append(cell)
+    return cells
+
+
+def append_styled_rows(ws: Any, rows: Iterable[Tuple[Any, ...]], style: str, alt_style: str,
+                       date_style: str, alt_date_style: str) -> None:
+    """
+    Append data rows with alternating named styles; None values stay blank and unstyled
+
+    Args:
+        ws: openpyxl write-only worksheet
+        rows: Row tuples of native values
+        style: Named style for even data rows (first row is 0)
+        alt_style: Named style for odd data rows
+        date_style: Style with a date number format, for date/datetime values
+        alt_date_style: alt_style with a date number format
+    """
+    row_idx = 0
+    for row in rows:
+        # Alternate row fill
+        if row_idx % 2 == 1:
+            row_style, row_date_style = alt_style, alt_date_style
+        else:
+            row_style, row_date_style = style, date_style
+
+        cells: List[Optional[Any]] = []
+        for value in row:
+            if value is None:
+                cells.append(None)
+                continue
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = row_date_style if isinstance(value, date) else row_style
+            cells.append(cell)
+        ws.append(cells)
+        row_idx += 1
@@ -5,18 +5,38 @@ Apply professional templates to Excel workbooks
 """
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 import pandas as pd
+import zlib
 
+# Compiled with mypyc when built, pure Python otherwise
+from ._fastpath import append_styled_rows, header_cells
 
-@dataclass
+
+# Number format for date/datetime cells (a style without one shows the bare serial)
+DATE_NUM_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+
+# Color fields of TemplateConfig, normalized to ARGB on construction
+_COLOR_FIELDS = ('primary_color', 'secondary_color', 'accent_color', 'header_bg')
+
+
+def _argb(color: str) -> str:
+    """Hex color as openpyxl's 8-char ARGB; 6-char RGB becomes opaque ("FF" alpha)"""
+    color = color.lstrip('#').upper()
+    return f"FF{color}" if len(color) == 6 else color
+
+
+@dataclass(frozen=True)
 class TemplateConfig:
-    """Configuration for Excel templates"""
+    """Configuration for Excel templates (immutable, so engines can be cached per config)"""
     
-    # Colors (hex format)
+    # Colors (hex RGB or ARGB; stored as ARGB)
     primary_color: str = "1E3A8A"      # Navy blue
     secondary_color: str = "3B82F6"    # Lighter blue
     accent_color: str = "10B981"       # Green
@@ -36,6 +56,44 @@ class TemplateConfig:
     # Branding
     company_name: str = ""
     header_text: str = ""
+    
+    def __post_init__(self):
+        for name in _COLOR_FIELDS:
+            object.__setattr__(self, name, _argb(getattr(self, name)))
+
+
+# Predefined template palettes
+PROFESSIONAL_PALETTE = TemplateConfig(
+    primary_color="1E3A8A",
+    secondary_color="3B82F6",
+    header_bg="E5E7EB",
+    company_name="Professional Template"
+)
+
+MODERN_PALETTE = TemplateConfig(
+    primary_color="6366F1",
+    secondary_color="8B5CF6",
+    accent_color="EC4899",
+    header_bg="F5F3FF",
+    company_name="Modern Template"
+)
+
+FINANCIAL_PALETTE = TemplateConfig(
+    primary_color="065F46",
+    secondary_color="10B981",
+    accent_color="FBBF24",
+    header_bg="ECFDF5",
+    company_name="Financial Template"
+)
+
+PREDEFINED_TEMPLATES = {
+    "professional": PROFESSIONAL_PALETTE,
+    "modern": MODERN_PALETTE,
+    "financial": FINANCIAL_PALETTE
+}
+
+# Distinct (name, config) engines kept by get_template_engine
+TEMPLATE_ENGINE_CACHE_SIZE = 16
 
 
 class TemplateEngine:
@@ -51,33 +109,11 @@ class TemplateEngine:
         """
         self.template_name = template_name
         self.config = config or self._get_predefined_config(template_name)
+        self._build_styles()
     
     def _get_predefined_config(self, name: str) -> TemplateConfig:
         """Get predefined template configuration"""
-        templates = {
-            "professional": TemplateConfig(
-                primary_color="1E3A8A",
-                secondary_color="3B82F6",
-                header_bg="E5E7EB",
-                company_name="Professional Template"
-            ),
-            "modern": TemplateConfig(
-                primary_color="6366F1",
-                secondary_color="8B5CF6",
-                accent_color="EC4899",
-                header_bg="F5F3FF",
-                company_name="Modern Template"
-            ),
-            "financial": TemplateConfig(
-                primary_color="065F46",
-                secondary_color="10B981",
-                accent_color="FBBF24",
-                header_bg="ECFDF5",
-                company_name="Financial Template"
-            )
-        }
-        
-        return templates.get(name, templates["professional"])
+        return PREDEFINED_TEMPLATES.get(name, PROFESSIONAL_PALETTE)
     
     def apply_to_worksheet(self, worksheet, has_header: bool = True):
         """
@@ -106,105 +142,283 @@ class TemplateEngine:
         # Style data cells
         self._style_data_cells(worksheet, start_row=2 if has_header else 1)
     
-    def _style_header(self, worksheet):
-        """Apply styling to header row"""
-        header_fill = PatternFill(
-            start_color=self.config.header_bg,
-            end_color=self.config.header_bg,
+    def _build_styles(self):
+        """Build the style objects once; every styled cell shares these instances"""
+        config = self.config
+        
+        # Header row
+        self._header_fill = PatternFill(
+            start_color=config.header_bg,
+            end_color=config.header_bg,
             fill_type="solid"
         )
         
-        header_font = Font(
-            name=self.config.header_font,
-            size=self.config.header_size,
+        self._header_font = Font(
+            name=config.header_font,
+            size=config.header_size,
             bold=True,
-            color=self.config.primary_color
+            color=config.primary_color
         )
         
-        header_alignment = Alignment(
+        self._header_alignment = Alignment(
             horizontal="center",
             vertical="center",
             wrap_text=False
         )
         
-        border_side = Side(style="thin", color="D1D5DB")
-        header_border = Border(
-            left=border_side,
-            right=border_side,
-            top=border_side,
-            bottom=border_side
+        header_side = Side(style="thin", color="FFD1D5DB")
+        self._header_border = Border(
+            left=header_side,
+            right=header_side,
+            top=header_side,
+            bottom=header_side
         )
         
-        # Apply to all cells in first row
-        for cell in worksheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = header_border
-    
-    def _style_data_cells(self, worksheet, start_row: int = 2):
-        """Apply styling to data cells"""
-        body_font = Font(
-            name=self.config.body_font,
-            size=self.config.body_size
+        # Data cells
+        self._body_font = Font(
+            name=config.body_font,
+            size=config.body_size
         )
         
-        body_alignment = Alignment(
+        self._body_alignment = Alignment(
             horizontal="left",
             vertical="center"
         )
         
         # Light border
-        border_side = Side(style="thin", color="E5E7EB")
-        cell_border = Border(
-            left=border_side,
-            right=border_side,
-            top=border_side,
-            bottom=border_side
+        cell_side = Side(style="thin", color="FFE5E7EB")
+        self._cell_border = Border(
+            left=cell_side,
+            right=cell_side,
+            top=cell_side,
+            bottom=cell_side
         )
         
         # Alternate row colors
-        light_fill = PatternFill(
-            start_color="FFFFFF",
-            end_color="FFFFFF",
+        self._light_fill = PatternFill(
+            start_color="FFFFFFFF",
+            end_color="FFFFFFFF",
             fill_type="solid"
         )
         
-        alt_fill = PatternFill(
-            start_color="F9FAFB",
-            end_color="F9FAFB",
+        self._alt_fill = PatternFill(
+            start_color="FFF9FAFB",
+            end_color="FFF9FAFB",
             fill_type="solid"
         )
         
+        # Named style names, unique per configuration so two templates can share a workbook
+        suffix = f"{zlib.crc32(repr(config).encode()):08X}"
+        self._header_style = f"Hopper Header {suffix}"
+        self._body_style = f"Hopper Body {suffix}"
+        self._body_alt_style = f"Hopper Body Alt {suffix}"
+        # Assigning a named style resets number_format, so dates need their own variants
+        self._body_date_style = f"Hopper Body Date {suffix}"
+        self._body_alt_date_style = f"Hopper Body Alt Date {suffix}"
+    
+    def named_styles(self) -> List[NamedStyle]:
+        """
+        The template's cell styles as openpyxl NamedStyles (header, body, alternate
+        body, and both body styles with a date number format)
+        
+        Build a fresh list per workbook (add_named_style binds each one to it).
+        
+        Returns:
+            NamedStyle objects
+        """
+        return [
+            NamedStyle(name=self._header_style, font=self._header_font, fill=self._header_fill,
+                       border=self._header_border, alignment=self._header_alignment),
+            NamedStyle(name=self._body_style, font=self._body_font, fill=self._light_fill,
+                       border=self._cell_border, alignment=self._body_alignment),
+            NamedStyle(name=self._body_alt_style, font=self._body_font, fill=self._alt_fill,
+                       border=self._cell_border, alignment=self._body_alignment),
+            NamedStyle(name=self._body_date_style, font=self._body_font, fill=self._light_fill,
+                       border=self._cell_border, alignment=self._body_alignment,
+                       number_format=DATE_NUM_FORMAT),
+            NamedStyle(name=self._body_alt_date_style, font=self._body_font, fill=self._alt_fill,
+                       border=self._cell_border, alignment=self._body_alignment,
+                       number_format=DATE_NUM_FORMAT)
+        ]
+    
+    def _register_named_styles(self, workbook):
+        """Add the template's named styles to an openpyxl workbook once"""
+        if self._header_style not in workbook.named_styles:
+            for style in self.named_styles():
+                workbook.add_named_style(style)
+    
+    def xlsxwriter_formats(self, workbook) -> Dict[str, Any]:
+        """
+        The template's styles as xlsxwriter Formats
+        
+        Build once per workbook and pass the same Format objects for every
+        header and data row (xlsxwriter styles cells as they are written).
+        
+        Args:
+            workbook: xlsxwriter Workbook
+            
+        Returns:
+            {'header': Format, 'body': Format, 'body_alt': Format,
+             'body_date': Format, 'body_alt_date': Format}
+        """
+        config = self.config
+        body = {
+            'font_name': config.body_font,
+            'font_size': config.body_size,
+            'align': 'left',
+            'valign': 'vcenter',
+            'border': 1,
+            'border_color': '#E5E7EB'
+        }
+        
+        return {
+            'header': workbook.add_format({
+                'font_name': config.header_font,
+                'font_size': config.header_size,
+                'bold': True,
+                'font_color': f"#{config.primary_color[2:]}",
+                'bg_color': f"#{config.header_bg[2:]}",
+                'align': 'center',
+                'valign': 'vcenter',
+                'border': 1,
+                'border_color': '#D1D5DB'
+            }),
+            # Alternate row colors
+            'body': workbook.add_format({**body, 'bg_color': '#FFFFFF'}),
+            'body_alt': workbook.add_format({**body, 'bg_color': '#F9FAFB'}),
+            # Datetime columns (a row format replaces the writer's default_date_format)
+            'body_date': workbook.add_format({**body, 'bg_color': '#FFFFFF', 'num_format': DATE_NUM_FORMAT}),
+            'body_alt_date': workbook.add_format({**body, 'bg_color': '#F9FAFB', 'num_format': DATE_NUM_FORMAT})
+        }
+    
+    def pyexcelerate_styles(self) -> Dict[str, Any]:
+        """
+        The template's styles as PyExcelerate Styles, for whole-range assignment
+        
+        Returns:
+            {'header': Style, 'body': Style, 'body_alt': Style,
+             'column': callable(width) -> Style}
+        """
+        # Imported here: only the PyExcelerate merge backend calls this
+        from pyexcelerate import Alignment as XAlignment, Border as XBorder, Borders, Color
+        from pyexcelerate import Fill, Font as XFont, Style
+        
+        def color(argb: str) -> Color:
+            return Color(*(int(argb[i:i + 2], 16) for i in (2, 4, 6)))
+        
+        def borders(argb: str) -> Borders:
+            side = XBorder(color=color(argb), style='thin')
+            return Borders(left=side, right=side, top=side, bottom=side)
+        
+        config = self.config
+        body_font = XFont(family=config.body_font, size=config.body_size)
+        body_alignment = XAlignment(horizontal='left', vertical='center')
+        
+        return {
+            'header': Style(
+                font=XFont(family=config.header_font, size=config.header_size, bold=True,
+                           color=color(config.primary_color)),
+                fill=Fill(background=color(config.header_bg)),
+                alignment=XAlignment(horizontal='center', vertical='center'),
+                borders=borders("FFD1D5DB")
+            ),
+            # Alternate row colors
+            'body': Style(font=body_font, fill=Fill(background=color("FFFFFFFF")),
+                          alignment=body_alignment, borders=borders("FFE5E7EB")),
+            'body_alt': Style(font=body_font, fill=Fill(background=color("FFF9FAFB")),
+                              alignment=body_alignment, borders=borders("FFE5E7EB")),
+            'column': lambda width: Style(size=width)
+        }
+    
+    def _style_header(self, worksheet):
+        """Apply styling to header row"""
+        self._register_named_styles(worksheet.parent)
+        
+        # Apply to all cells in first row (one named-style assignment per cell)
+        for cell in worksheet[1]:
+            cell.style = self._header_style
+    
+    def _style_data_cells(self, worksheet, start_row: int = 2):
+        """Apply styling to data cells"""
+        self._register_named_styles(worksheet.parent)
+        
         # Apply to all data rows
         for row_idx, row in enumerate(worksheet.iter_rows(min_row=start_row), start=start_row):
             # Alternate row fill
-            fill = alt_fill if (row_idx - start_row) % 2 == 1 else light_fill
+            if (row_idx - start_row) % 2 == 1:
+                style, date_style = self._body_alt_style, self._body_alt_date_style
+            else:
+                style, date_style = self._body_style, self._body_date_style
             
             for cell in row:
                 if cell.value is not None:
-                    cell.font = body_font
-                    cell.alignment = body_alignment
-                    cell.border = cell_border
-                    cell.fill = fill
+                    cell.style = date_style if isinstance(cell.value, date) else style
     
     def _auto_size_columns(self, worksheet):
         """Auto-adjust column widths"""
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        max_length = max(max_length, cell_length)
-                except:
-                    pass
-            
+        # One row-wise pass over raw values (values_only skips Cell objects)
+        max_lengths = [0] * worksheet.max_column
+        for row in worksheet.iter_rows(values_only=True):
+            for col_idx, value in enumerate(row):
+                if value:
+                    cell_length = len(str(value))
+                    if cell_length > max_lengths[col_idx]:
+                        max_lengths[col_idx] = cell_length
+        
+        for col_idx, max_length in enumerate(max_lengths, start=1):
             # Set width with some padding
             adjusted_width = min(max_length + 2, 50)  # Max 50 chars
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+    
+    def write_styled(self, df: pd.DataFrame, output_path: str, sheet_name: str = "Sheet1"):
+        """
+        Write a DataFrame to a new styled workbook in openpyxl's write-only mode
+        
+        Rows are streamed to disk as they are appended instead of being held
+        as Cell objects and styled afterwards, so large exports use far less
+        memory; the result matches apply_to_worksheet on the same data.
+        
+        Args:
+            df: Table to write (header row from its columns)
+            output_path: Output .xlsx path
+            sheet_name: Worksheet title
+        """
+        wb = Workbook(write_only=True)
+        self.append_styled(wb.create_sheet(title=sheet_name), df)
+        
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        wb.save(str(output_file))
+    
+    def append_styled(self, ws, df: pd.DataFrame):
+        """
+        Stream a DataFrame into an empty write-only worksheet with the template styling
+        
+        Args:
+            ws: openpyxl write-only worksheet with no rows yet
+            df: Table to write (header row from its columns)
+        """
+        n_rows, n_cols = df.shape
+        
+        # Sheet settings must be in place before the first row is written
+        if self.config.freeze_panes:
+            ws.freeze_panes = "A2"
+        if self.config.auto_filter and n_cols:
+            ws.auto_filter.ref = f"A1:{get_column_letter(n_cols)}{n_rows + 1}"
+        if self.config.column_width == "auto":
+            for col_idx, (col_name, col) in enumerate(df.items(), start=1):
+                lengths = col.dropna().astype(str).str.len()
+                max_length = max(len(str(col_name)), int(lengths.max()) if len(lengths) else 0)
+                ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)  # Max 50 chars
+        
+        self._register_named_styles(ws.parent)
+        
+        ws.append(header_cells(ws, [str(col_name) for col_name in df.columns], self._header_style))
+        
+        # Native values with missing cells as None (left blank and unstyled)
+        values = df.astype(object).where(df.notna(), None)
+        append_styled_rows(ws, values.itertuples(index=False, name=None), self._body_style, self._body_alt_style,
+                           self._body_date_style, self._body_alt_date_style)
     
     def add_company_header(self, worksheet):
         """Add company header to worksheet"""
@@ -238,3 +452,23 @@ class TemplateEngine:
             
             # Adjust row height
             worksheet.row_dimensions[1].height = 25
+
+
+@lru_cache(maxsize=TEMPLATE_ENGINE_CACHE_SIZE)
+def get_template_engine(template_name: str = "professional",
+                        config: Optional[TemplateConfig] = None) -> TemplateEngine:
+    """
+    Shared TemplateEngine for a template name or custom configuration
+    
+    Engines (and their prebuilt styles) are reused across calls with the same
+    arguments, so producing many files per template builds them only once.
+    Treat the returned engine as read-only.
+    
+    Args:
+        template_name: Name of predefined template
+        config: Custom template configuration (keyed by value)
+        
+    Returns:
+        TemplateEngine
+    """
+    return TemplateEngine(template_name, config)
@@ -11,8 +11,11 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from agents import chat_agent
 from agents.chat_agent import ChatAgent
 from agents.data_analyzer import DataAnalyzer
+import json
+from types import SimpleNamespace
 import pandas as pd
 
 
@@ -82,6 +85,101 @@ def test_data_analyzer():
         print(f"  - {sug['type']}: {sug['title']}")
 
 
+def test_arrow_filters():
+    """Test filters on Arrow-backed string columns (as returned by the CSV readers)"""
+    print("\n" + "=" * 60)
+    print("Testing DataAnalyzer on string[pyarrow] columns")
+    print("=" * 60)
+    
+    df = pd.DataFrame({
+        'Product': [f'Item {i}' for i in range(30)] + [None],
+        'Region': (['North', 'South', None] * 11)[:31],
+        'Sales': range(31)
+    })
+    df = df.astype({'Product': 'string[pyarrow]', 'Region': 'string[pyarrow]'})
+    
+    analyzer = DataAnalyzer(df)
+    categories = analyzer.get_summary()['categories']
+    assert 'Product' in categories
+    assert analyzer.original_df['Region'].dtype == 'category'
+    
+    analyzer.apply_filter('Product', 'item 1', operator='contains')
+    print(f"\n'Product' contains 'item 1': {len(analyzer.df)} rows")
+    assert len(analyzer.df) == 11
+    
+    analyzer.reset()
+    analyzer.apply_filter('Product', 'Item 7')
+    print(f"'Product' equals 'Item 7': {len(analyzer.df)} rows")
+    assert len(analyzer.df) == 1
+
+
+class FakeOpenAI:
+    """Stand-in OpenAI client recording how many completions run at once"""
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.uploads = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete))
+        self.files = SimpleNamespace(create=self._upload, content=self._download)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+    
+    async def _complete(self, **request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        content = json.dumps({'message': request['messages'][-1]['content']})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    async def _upload(self, file, purpose):
+        self.uploads.append(file[1].decode())
+        return SimpleNamespace(id='file-1')
+    
+    async def _create_batch(self, **kwargs):
+        return SimpleNamespace(id='batch-1')
+    
+    async def _retrieve_batch(self, batch_id):
+        return SimpleNamespace(status='completed', output_file_id='file-2')
+    
+    async def _download(self, file_id):
+        # Answer each uploaded request with its user message, in reverse order
+        lines = []
+        for line in reversed(self.uploads[-1].splitlines()):
+            request = json.loads(line)
+            content = json.dumps({'message': request['body']['messages'][-1]['content']})
+            lines.append(json.dumps({
+                'custom_id': request['custom_id'],
+                'response': {'body': {'choices': [{'message': {'content': content}}]}}
+            }))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+async def test_request_limit():
+    """Test that concurrent sessions share the bounded OpenAI request slots"""
+    print("\n" + "=" * 60)
+    print("Testing request concurrency limit")
+    print("=" * 60)
+    
+    limit = chat_agent.MAX_CONCURRENT_REQUESTS
+    fake = FakeOpenAI()
+    chat_agent._CLIENTS[('test-key', asyncio.get_running_loop())] = fake
+    
+    agents = [ChatAgent(api_key='test-key') for _ in range(limit * 3)]
+    responses = await asyncio.gather(*(
+        agent.process_message(f"message {i}") for i, agent in enumerate(agents)
+    ))
+    print(f"\n{len(responses)} concurrent messages, peak in flight: {fake.peak} (limit {limit})")
+    assert fake.peak <= limit
+    assert [r.message for r in responses] == [f"message {i}" for i in range(len(agents))]
+    
+    # Offline Batch API path: results come back in submission order
+    batch_id = await agents[0].submit_batch(["first", "second", "third"])
+    results = await agents[0].wait_for_batch(batch_id, poll_interval=0)
+    print(f"Batch {batch_id}: {[r.message for r in results]}")
+    assert [r.message for r in results] == ["first", "second", "third"]
+
+
 def main():
     """Run all tests"""
     print("\n🧪 SMART DOCUMENT FACTORY - AGENT TESTS")
@@ -89,9 +187,11 @@ def main():
     
     # Test Data Analyzer (synchronous)
     test_data_analyzer()
+    test_arrow_filters()
     
     # Test Chat Agent (asynchronous)
     asyncio.run(test_chat_agent())
+    asyncio.run(test_request_limit())
     
     print("\n" + "=" * 60)
     print("✅ All tests completed!")
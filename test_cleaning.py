@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from cleaners.data_cleaner import DataCleaner, CleaningConfig
+import numpy as np
 import pandas as pd
 
 print("=" * 70)
@@ -48,6 +49,33 @@ print(f"\nShape: {cleaned_df.shape}")
 print(f"Column names: {list(cleaned_df.columns)}")
 print(f"Data types:\n{cleaned_df.dtypes}")
 
+# Pandas engine on a mostly-numeric text column (stored as string[pyarrow] when available)
+print("\n4️⃣ Detecting outliers with the pandas engine...")
+text_df = pd.DataFrame({'amount': [str(i) for i in range(1, 20)] + ['1000', 'n/a']})
+config = CleaningConfig(handle_nulls=False, detect_outliers=True, engine='pandas')
+outlier_cleaner = DataCleaner(text_df, config)
+outlier_df = outlier_cleaner.clean()
+
+print(f"\n'amount' dtype: {outlier_df['amount'].dtype}")
+assert isinstance(outlier_df['amount'].dtype, np.dtype)
+assert outlier_cleaner.report.outliers_detected == 1
+assert outlier_cleaner.is_outlier('amount').sum() == 1
+
+# Both engines keep the input index and fill nulls in non-numeric, non-text columns
+print("\n5️⃣ Comparing engines on an indexed frame...")
+indexed_df = pd.DataFrame(
+    {'sales': [1.0, 1.0, 2.0, None], 'flag': [True, True, None, False]},
+    index=pd.Index(['r1', 'r2', 'r3', 'r4'], name='rid')
+)
+results = {
+    engine: DataCleaner(indexed_df, CleaningConfig(engine=engine)).clean()
+    for engine in ('auto', 'pandas')
+}
+for engine, result in results.items():
+    print(f"\n{engine}:\n{result}")
+    assert list(result.index) == ['r1', 'r3', 'r4']
+    assert result['flag'].notna().all()
+
 print("\n" + "=" * 70)
 print("✅ Data cleaning test complete!")
 print("=" * 70)
@@ -5,68 +5,158 @@ Test Template System
 Test the TemplateEngine functionality
 """
 
+import argparse
+import contextlib
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.mergers.excel_merger import ExcelMerger
-from src.templates.template_engine import TemplateEngine, TemplateConfig
-
-print("=" * 70)
-print("🎨 Testing Template System")
-print("=" * 70)
-
-# Test files
-test_files = [
-    "data/input/sample.xlsx",
-    "data/input/products.csv"
-]
-
-# Test template 1: Professional
-print("\n1️⃣ Testing Professional Template...")
-template1 = TemplateEngine("professional")
-merger1 = ExcelMerger(template_engine=template1)
-merger1.add_files(test_files)
-merger1.merge_to_excel("data/output/template_professional.xlsx")
-print("✅ Professional template applied")
-
-# Test template 2: Modern
-print("\n2️⃣ Testing Modern Template...")
-template2 = TemplateEngine("modern")
-merger2 = ExcelMerger(template_engine=template2)
-merger2.add_files(test_files)
-merger2.merge_to_excel("data/output/template_modern.xlsx")
-print("✅ Modern template applied")
-
-# Test template 3: Financial
-print("\n3️⃣ Testing Financial Template...")
-template3 = TemplateEngine("financial")
-merger3 = ExcelMerger(template_engine=template3)
-merger3.add_files(test_files)
-merger3.merge_to_excel("data/output/template_financial.xlsx")
-print("✅ Financial template applied")
-
-# Test custom colors
-print("\n4️⃣ Testing Custom Template...")
-custom_config = TemplateConfig(
-    primary_color="FF6B6B",
-    secondary_color="4ECDC4",
-    accent_color="FFE66D",
-    header_bg="FFE5E5",
-    company_name="Custom Corp"
-)
-template4 = TemplateEngine(config=custom_config)
-merger4 = ExcelMerger(template_engine=template4)
-merger4.add_files(test_files)
-merger4.merge_to_excel("data/output/template_custom.xlsx")
-print("✅ Custom template applied")
-
-print("\n" + "=" * 70)
-print("✅ All template tests complete!")
-print("   Check data/output/ for generated files:")
-print("   - template_professional.xlsx")
-print("   - template_modern.xlsx")
-print("   - template_financial.xlsx")
-print("   - template_custom.xlsx")
-print("=" * 70)
+from src.parsers.csv_parser import CSVParser
+from src.parsers.excel_parser import ExcelParser
+from src.templates.template_engine import TemplateConfig, get_template_engine
+
+
+def silenced(quiet):
+    """Context discarding stdout (merge progress) when quiet"""
+    return contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+
+
+def run_template(template, output_path, frames, quiet=False):
+    """
+    Merge the test tables with one template (runs in a worker process)
+
+    Args:
+        template: Predefined template name or a TemplateConfig
+        output_path: Output Excel file path
+        frames: (source name, DataFrame) pairs, parsed once by main()
+        quiet: Discard the merger's progress output
+
+    Returns:
+        Whether the merge succeeded
+    """
+    if isinstance(template, TemplateConfig):
+        engine = get_template_engine(config=template)
+    else:
+        engine = get_template_engine(template)
+
+    with silenced(quiet):
+        merger = ExcelMerger(template_engine=engine)
+        for source_name, df in frames:
+            merger.add_frame(df, source_name)
+        return merger.merge_to_excel(output_path)
+
+
+def run_single_workbook(scenarios, frames, output_path):
+    """
+    Write every template/table combination as the sheets of one workbook
+
+    Args:
+        scenarios: (number, label, template, output path) tuples
+        frames: (source name, DataFrame) pairs
+        output_path: Output Excel file path
+
+    Returns:
+        Whether the workbook was written
+    """
+    sheets = {}
+    for _, label, template, _ in scenarios:
+        if isinstance(template, TemplateConfig):
+            engine = get_template_engine(config=template)
+        else:
+            engine = get_template_engine(template)
+        for source_name, df in frames:
+            sheets[f"{label} {source_name}"] = (df, engine)
+
+    return ExcelMerger.merge_to_multisheet_excel(sheets, output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Test the template system')
+    parser.add_argument(
+        '--single-workbook',
+        action='store_true',
+        help='Write all templates as sheets of data/output/templates.xlsx instead of one file each'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        default=bool(os.environ.get('HOPPER_QUIET')),
+        help='Only print the final report, not the merge progress (or set HOPPER_QUIET=1)'
+    )
+    args = parser.parse_args()
+
+    # The report is collected and written once at the end
+    report = ["=" * 70, "🎨 Testing Template System", "=" * 70]
+
+    # Test files, read once and shared by every scenario
+    # (the parsers use the calamine and polars/pyarrow readers when installed)
+    frames = [
+        ("sample", ExcelParser("data/input/sample.xlsx").get_dataframe()),
+        ("products", CSVParser("data/input/products.csv").extract_tables()[0])
+    ]
+
+    # Custom colors
+    custom_config = TemplateConfig(
+        primary_color="FF6B6B",
+        secondary_color="4ECDC4",
+        accent_color="FFE66D",
+        header_bg="FFE5E5",
+        company_name="Custom Corp"
+    )
+
+    scenarios = [
+        ("1️⃣", "Professional", "professional", "data/output/template_professional.xlsx"),
+        ("2️⃣", "Modern", "modern", "data/output/template_modern.xlsx"),
+        ("3️⃣", "Financial", "financial", "data/output/template_financial.xlsx"),
+        ("4️⃣", "Custom", custom_config, "data/output/template_custom.xlsx"),
+    ]
+
+    if args.single_workbook:
+        with silenced(args.quiet):
+            ok = run_single_workbook(scenarios, frames, "data/output/templates.xlsx")
+        report += [
+            "",
+            "=" * 70,
+            "✅ All template tests complete!" if ok else "❌ Template workbook failed",
+            "   Check data/output/templates.xlsx (one sheet per template and table)",
+            "=" * 70
+        ]
+        print("\n".join(report))
+        return
+
+    # The scenarios are independent and workbook serialization is CPU-bound, so run them in parallel
+    report.append(f"\nRunning {len(scenarios)} template tests in parallel...")
+    with ProcessPoolExecutor(max_workers=len(scenarios)) as executor:
+        results = list(executor.map(
+            run_template,
+            [template for _, _, template, _ in scenarios],
+            [output_path for _, _, _, output_path in scenarios],
+            [frames] * len(scenarios),
+            [args.quiet] * len(scenarios)
+        ))
+
+    for (number, label, _, _), ok in zip(scenarios, results):
+        report.append(f"\n{number} Testing {label} Template...")
+        report.append(f"✅ {label} template applied" if ok else f"❌ {label} template failed")
+
+    report += [
+        "",
+        "=" * 70,
+        "✅ All template tests complete!",
+        "   Check data/output/ for generated files:",
+        "   - template_professional.xlsx",
+        "   - template_modern.xlsx",
+        "   - template_financial.xlsx",
+        "   - template_custom.xlsx",
+        "=" * 70
+    ]
+    print("\n".join(report))
+
+
+if __name__ == '__main__':
+    main()
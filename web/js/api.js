@@ -73,6 +73,27 @@ const API = {
         return await response.json();
     },
     
+    /**
+     * Poll task status until the merge finishes
+     * @param {string} taskId - Task ID
+     * @param {number} intervalMs - Delay between polls
+     * @returns {Promise} Final task status
+     */
+    async waitForTask(taskId, intervalMs = 500) {
+        while (true) {
+            const status = await this.checkTaskStatus(taskId);
+            
+            if (status.status === 'completed') {
+                return status;
+            }
+            if (status.status === 'failed') {
+                throw new Error(status.error || 'Merge failed');
+            }
+            
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+    },
+    
     /**
      * Get download URL for result
      * @param {string} taskId - Task ID
@@ -72,6 +72,7 @@ class MergeApp {
 
             // Start merge
             const mergeResponse = await API.startMerge(this.taskId, outputFilename);
+            await API.waitForTask(this.taskId);
 
             this.setProgress(100, 'Merge complete!');
 
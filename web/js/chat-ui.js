@@ -58,6 +58,8 @@ class ChatUI {
 
         const rows = preview.data.slice(0, 5); // Show first 5 rows
         const columns = preview.columns || Object.keys(rows[0] || {});
+        // Rows arrive as value arrays in column order (older servers sent objects)
+        const cellValue = (row, col, idx) => (Array.isArray(row) ? row[idx] : row[col]) ?? '';
 
         let tableHTML = `
             <div class="data-preview">
@@ -72,7 +74,7 @@ class ChatUI {
                         <tbody>
                             ${rows.map(row => `
                                 <tr>
-                                    ${columns.map(col => `<td>${row[col] ?? ''}</td>`).join('')}
+                                    ${columns.map((col, idx) => `<td>${cellValue(row, col, idx)}</td>`).join('')}
                                 </tr>
                             `).join('')}
                         </tbody>
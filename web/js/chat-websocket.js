@@ -20,6 +20,9 @@ class WebSocketManager {
 
         try {
             this.ws = new WebSocket(wsUrl);
+            // Server sends replies as binary UTF-8 JSON frames
+            this.ws.binaryType = 'arraybuffer';
+            this.decoder = new TextDecoder();
 
             this.ws.onopen = () => {
                 console.log('✅ WebSocket connected');
@@ -30,7 +33,10 @@ class WebSocketManager {
 
             this.ws.onmessage = (event) => {
                 try {
-                    const data = JSON.parse(event.data);
+                    const text = typeof event.data === 'string'
+                        ? event.data
+                        : this.decoder.decode(event.data);
+                    const data = JSON.parse(text);
                     this.handleMessage(data);
                 } catch (error) {
                     console.error('Error parsing message:', error);